@@ -0,0 +1,9 @@
+"""Runs the headless command line interface with python -m etym_tree_python"""
+import os
+import sys
+
+# Application modules are imported from src, as they are when main.py is run
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from cli import main  # pylint: disable=wrong-import-position
+
+sys.exit(main())
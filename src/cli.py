@@ -0,0 +1,215 @@
+"""Headless command line interface to validate, export, compact, query and generate Projects"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Sequence
+from core.core import WordField
+from core.metrics import metrics
+from core.project import Project, ProjectBuilder
+from core.synthetic_lexicon import SyntheticLexiconGenerator
+from core.wordflow import summarise_word_data
+
+EXIT_OK = 0
+# Words failed validation, or a queried Word was not found
+EXIT_FAILED = 1
+# The command line, or a stored file, could not be used
+EXIT_ERROR = 2
+
+# Words validated by each task submitted to the process pool
+VALIDATION_CHUNK_SIZE = 256
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _report_progress(args: argparse.Namespace, message: str) -> None:
+    if not args.quiet:
+        print(f"{args.command}: {message}", file=sys.stderr, flush=True)
+
+
+def _load_project(args: argparse.Namespace) -> Project:
+    project = ProjectBuilder.project_from_file(args.project)
+    _report_progress(args, f"loading {len(project.list_lexicon_ids())} lexicon(s)")
+    project.load_all_lexicons(jobs=args.jobs)
+    return project
+
+
+def _summarise_chunk(chunk: Sequence[dict]) -> list[dict]:
+    return [summarise_word_data(x) for x in chunk]
+
+
+def _summaries_of(word_data: Sequence[dict], jobs: int) -> Iterator[list[dict]]:
+    """Summaries of word_data in chunks, in order, calculated on up to jobs processes"""
+    chunks = [
+        word_data[start:start + VALIDATION_CHUNK_SIZE]
+        for start in range(0, len(word_data), VALIDATION_CHUNK_SIZE)]
+    if jobs == 1 or len(chunks) < 2:
+        yield from map(_summarise_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_summarise_chunk, chunks)
+
+
+def _validate(args: argparse.Namespace) -> int:
+    """Runs every Word through the Wordflow, listing each Word that fails a stage"""
+    project = _load_project(args)
+    failed_count = 0
+    for lexicon_id in project.list_lexicon_ids():
+        word_data = project.find_lexicon_by_id(lexicon_id).retrieve_export_data_for()
+        validated_count = 0
+        for summaries in _summaries_of(word_data, args.jobs):
+            for (data, summary) in zip(word_data[validated_count:], summaries):
+                if summary["Failed"] > 0:
+                    failed_count += 1
+                    print("\t".join(
+                        [lexicon_id, data["translated_word"], "; ".join(summary["FailedStages"])]))
+            validated_count += len(summaries)
+            _report_progress(args, f"{lexicon_id} {validated_count}/{len(word_data)} words")
+    _report_progress(args, f"{failed_count} word(s) failed")
+    if failed_count > 0:
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+def _export(args: argparse.Namespace) -> int:
+    """Writes the settings, Words and changes of the Project as a single JSON document"""
+    project = _load_project(args)
+    exported = {"Name": project.name, "Lexicons": {}}
+    for lexicon_id in project.list_lexicon_ids():
+        exported["Lexicons"][lexicon_id] = {
+            "Words": project.find_lexicon_by_id(lexicon_id).retrieve_export_data_for(),
+            "Changes": project.find_changehistory_by_id(lexicon_id).retrieve_export_data_for()}
+        _report_progress(args, f"{lexicon_id} exported")
+    if args.output == "-":
+        json.dump(exported, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, 'w', encoding='UTF-8') as output_file:
+            json.dump(exported, output_file, indent=2)
+    return EXIT_OK
+
+
+def _compact(args: argparse.Namespace) -> int:
+    """Stores every Lexicon and change history again in the current indexed file format"""
+    descriptor = ProjectBuilder.descriptor_from_file(args.project)
+    sizes_before = descriptor.lexicon_file_sizes()
+    project = _load_project(args)
+    project.store()
+    for (lexicon_id, sizes_after) in descriptor.lexicon_file_sizes().items():
+        before = sum(sizes_before[lexicon_id].values())
+        _report_progress(args, f"{lexicon_id} {before} -> {sum(sizes_after.values())} bytes")
+    return EXIT_OK
+
+
+def _query(args: argparse.Namespace) -> int:
+    """Prints a Word, one of its fields or its children as JSON"""
+    project = ProjectBuilder.project_from_file(args.project)
+    for lexicon in project.list_lexicons():
+        word = lexicon.retrieve(args.word)
+        if word is None:
+            continue
+        if args.children:
+            result = [
+                x.find_data_on(WordField.TRANSLATEDWORD) for x in lexicon.get_children_of(word)]
+        elif args.field is not None:
+            result = lexicon.get_field_for_word(args.field, word)
+        else:
+            result = word.data_for_export()
+        print(json.dumps(result, indent=2))
+        return EXIT_OK
+    _report_progress(args, f"{args.word} not found")
+    return EXIT_FAILED
+
+
+def _generate(args: argparse.Namespace) -> int:
+    """Writes a Project holding a synthetic Lexicon of valid Words for load testing"""
+    generator = SyntheticLexiconGenerator(
+        args.words,
+        depth=args.depth,
+        fan_out=args.fan_out,
+        changes_per_word=args.changes,
+        ripple_depth=args.ripple_depth,
+        resolved_fraction=args.resolved,
+        seed=args.seed)
+    _report_progress(args, f"writing {args.words} words")
+    print(generator.write_project(args.name, args.name))
+    return EXIT_OK
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="etym_tree_python",
+        description="Validate, export, compact, query and generate EtymTree projects.")
+    parser.add_argument(
+        "--directory", default=".",
+        help="directory containing the data folder of the projects (default: current)")
+    parser.add_argument(
+        "--jobs", type=_positive_int, default=1,
+        help="number of worker threads and processes to use (default: 1)")
+    parser.add_argument(
+        "--quiet", action="store_true", help="do not report progress on stderr")
+    parser.add_argument(
+        "--metrics", metavar="FILE", help="write counters and timings of the command as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def _add_command(name: str, action, help_text: str) -> argparse.ArgumentParser:
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("project", help="path of the PROJ- file, relative to --directory")
+        command.set_defaults(action=action)
+        return command
+    _add_command("validate", _validate, "list the Words that fail validation")
+    export = _add_command("export", _export, "write a project as a single JSON document")
+    export.add_argument("output", help="file to write, or - for stdout")
+    _add_command("compact", _compact, "store every lexicon again in the indexed format")
+    query = _add_command("query", _query, "print a Word as JSON")
+    query.add_argument("word", help="translated word to find")
+    query_output = query.add_mutually_exclusive_group()
+    query_output.add_argument("--field", help="print only the field with this label")
+    query_output.add_argument("--children", action="store_true", help="print its children")
+    generate = commands.add_parser("generate", help="write a synthetic project for load tests")
+    generate.add_argument("name", help="name and file name of the project")
+    generate.add_argument("--words", type=_positive_int, default=1000, help="(default: 1000)")
+    generate.add_argument("--depth", type=_positive_int, default=4, help="(default: 4)")
+    generate.add_argument("--fan-out", type=float, default=4, help="(default: 4)")
+    generate.add_argument(
+        "--changes", type=int, default=0, help="changes originated per word (default: 0)")
+    generate.add_argument(
+        "--ripple-depth", type=int, default=1,
+        help="generations below each word that record its changes (default: 1)")
+    generate.add_argument(
+        "--resolved", type=float, default=0.0,
+        help="fraction of recorded changes resolved (default: 0)")
+    generate.add_argument("--seed", type=int, default=0, help="(default: 0)")
+    generate.set_defaults(action=_generate)
+    return parser
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Runs the command given in argv and returns the process exit code"""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    metrics_location = None
+    if args.metrics is not None:
+        metrics_location = os.path.abspath(args.metrics)
+        metrics.reset()
+        metrics.enable()
+    try:
+        os.chdir(args.directory)
+        return args.action(args)
+    except (OSError, ValueError, KeyError) as error:
+        print(f"{args.command}: error: {error}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if metrics_location is not None:
+            metrics.dump_to(metrics_location)
+            metrics.disable()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Application logging configured from Settings"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Union
+from configuration.settings import Settings
+
+LOGGER_NAME = 'etym_logger'
+LOG_FORMAT = '%(asctime)s - %(levelname)s: Location [%(module)s -> %(funcName)s] - %(message)s'
+
+# Used for any logging option missing from the Settings
+DEFAULT_LOGGING_CONFIG = {
+    "LogFile": "app.log",
+    "LogLevel": "INFO",
+    "LogAsynchronously": True}
+
+
+def _option(settings: Settings, option_id: str):
+    value = settings.find_by_id(option_id)
+    if value is None:
+        return DEFAULT_LOGGING_CONFIG[option_id]
+    return value
+
+
+def configure_logging(settings: Settings) -> Union[QueueListener, None]:
+    """Directs the application logger to the LogFile at LogLevel given in settings
+
+    If LogAsynchronously is set, records are queued and written by a listener thread, so
+    that logging never waits on the file. The started listener is returned and should be
+    stopped on exit to flush the queue; otherwise None is returned."""
+    logger = logging.getLogger(LOGGER_NAME)
+    level_name = str(_option(settings, "LogLevel")).upper()
+    level = logging.getLevelName(level_name)
+    is_known_level = isinstance(level, int)
+    if not is_known_level:
+        level = logging.getLevelName(DEFAULT_LOGGING_CONFIG["LogLevel"])
+    logger.setLevel(level)
+    file_handler = logging.FileHandler(_option(settings, "LogFile"), 'w', encoding='UTF-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    listener = None
+    if _option(settings, "LogAsynchronously"):
+        record_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(record_queue))
+        listener = QueueListener(record_queue, file_handler)
+        listener.start()
+    else:
+        logger.addHandler(file_handler)
+    if not is_known_level:
+        logger.warning(
+            "Unknown LogLevel %s, logging at %s", level_name, DEFAULT_LOGGING_CONFIG["LogLevel"])
+    return listener
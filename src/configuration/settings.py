@@ -1,4 +1,5 @@
 """Application configuration settings"""
+import copy
 from typing import Any
 from core.core import DataFormat
 from services.settings_io_service import SettingsIOService
@@ -37,6 +38,10 @@ class Settings:
             self.set_option_to(config_id, config_updates[config_id])
         return len(config_updates)
 
+    def snapshot(self):
+        """Independent copy of the Settings that later changes do not affect"""
+        return Settings(copy.deepcopy(self._config_data), self._context)
+
     def export_config(self, filename: str) -> None:
         """Serialises and exports configuration settings for local storage"""
         self._context.export_config(filename, self._config_data)
@@ -1,32 +1,52 @@
 """Repository for Change History Items"""
-from typing import Sequence, List
+import bisect
+from typing import Sequence, List, Set
 from core.core import DataFormat
 from core.change_history_item import ChangeHistoryItem
+from core.metrics import metrics
 from services.io_service import IOService
 from services.change_history_io_service import LexiconChangeHistoryIOService
 
 
 class LexiconChangeHistory:
-    """Repository for ChangeHistoryItems."""
+    """Repository for ChangeHistoryItems, held in order of creation time."""
     def __init__(self) -> None:
         self._id_index = {}
-        self._originator_index = {}
-        self._items: Sequence[ChangeHistoryItem] = []
+        self._originator_index: dict[str, list[str]] = {}
+        self._originator_times: dict[str, list[int]] = {}
+        self._affected_index: dict[str, set[str]] = {}
+        self._unresolved_index: dict[str, set[str]] = {}
+        self._items: list[ChangeHistoryItem] = []
+        self._created_times: list[int] = []
 
+    @metrics.timed("changehistory.build_indexes")
     def _build_indexes(self) -> None:
+        """Sorts the items by creation time and indexes them again from scratch"""
+        self._items.sort(key=lambda x: x.created_utc)
+        self._created_times = [x.created_utc for x in self._items]
         self._originator_index = {}
+        self._originator_times = {}
         for item in self._items:
             self._id_index[item.uid] = item
-            if item.originator in self._originator_index:
-                self._originator_index[item.originator].append(item.uid)
-            else:
-                self._originator_index[item.originator] = [item.uid]
+            self._originator_index.setdefault(item.originator, []).append(item.uid)
+            self._originator_times.setdefault(item.originator, []).append(item.created_utc)
+
+    def _index_item(self, item: ChangeHistoryItem) -> None:
+        """Inserts item into the items and postings, after any created at the same time"""
+        created_utc = item.created_utc
+        position = bisect.bisect_right(self._created_times, created_utc)
+        self._created_times.insert(position, created_utc)
+        self._items.insert(position, item)
+        self._id_index[item.uid] = item
+        originator_times = self._originator_times.setdefault(item.originator, [])
+        position = bisect.bisect_right(originator_times, created_utc)
+        originator_times.insert(position, created_utc)
+        self._originator_index.setdefault(item.originator, []).insert(position, item.uid)
 
     def add_item(self, item_to_add: ChangeHistoryItem) -> None:
         """Add a ChangeHistoryItem that has not already been registered."""
-        if item_to_add not in self._items and item_to_add is not None:
-            self._items.extend([item_to_add])
-        self._build_indexes()
+        if item_to_add is not None and item_to_add.uid not in self._id_index:
+            self._index_item(item_to_add)
 
     def get_all_items(self) -> Sequence[ChangeHistoryItem]:
         """List all ChangeHistoryItems currently registered in the History"""
@@ -40,6 +60,52 @@ class LexiconChangeHistory:
         """Return a sequence of ChangeHistoryItem ids with the given originator, otherwise None."""
         return self._originator_index.get(originator_id)
 
+    def find_items_created_between(
+            self,
+            start_utc: int,
+            end_utc: int) -> List[ChangeHistoryItem]:
+        """Return the ChangeHistoryItems created from start_utc up to but excluding end_utc"""
+        return self._items[
+            bisect.bisect_left(self._created_times, start_utc):
+            bisect.bisect_left(self._created_times, end_utc)]
+
+    def find_latest_items(self, count: int) -> List[ChangeHistoryItem]:
+        """Return up to count of the most recently created ChangeHistoryItems, newest first"""
+        if count <= 0:
+            return []
+        return self._items[:-count - 1:-1]
+
+    def find_items_with_originator_created_between(
+            self,
+            originator_id: str,
+            start_utc: int,
+            end_utc: int) -> List[ChangeHistoryItem]:
+        """Return the ChangeHistoryItems with the given originator created in the given range"""
+        originator_times = self._originator_times.get(originator_id, [])
+        item_ids = self._originator_index.get(originator_id, [])[
+            bisect.bisect_left(originator_times, start_utc):
+            bisect.bisect_left(originator_times, end_utc)]
+        return [self._id_index[x] for x in item_ids]
+
+    def index_affected_word(self, change_id: str, word_uid: str, is_resolved: bool) -> None:
+        """Records that the change with change_id reached the Word with word_uid
+
+        Words record their changes whenever their unresolved modifications are identified,
+        which happens as changes ripple through a Lexicon and as Words are loaded."""
+        self._affected_index.setdefault(change_id, set()).add(word_uid)
+        if is_resolved:
+            self._unresolved_index.get(change_id, set()).discard(word_uid)
+        else:
+            self._unresolved_index.setdefault(change_id, set()).add(word_uid)
+
+    def find_words_affected_by(self, change_id: str) -> Set[str]:
+        """Return the uids of the Words that have recorded the change with change_id"""
+        return self._affected_index.get(change_id, set())
+
+    def find_words_unresolved_for(self, change_id: str) -> Set[str]:
+        """Return the uids of the Words that have not resolved the change with change_id"""
+        return self._unresolved_index.get(change_id, set())
+
     def retrieve_export_data_for(self, items: Sequence[ChangeHistoryItem] = None) -> Sequence[dict]:
         """Translate internal data of ChangeHistoryItem instances into serialisable format."""
         if items is not None:
@@ -48,18 +114,35 @@ class LexiconChangeHistory:
             return []
         return [x.data_for_export() for x in self._items]
 
-    def store_to(self, filename: str):
-        """Serialise and store ChangeHistoryItem entries locally"""
+    def export_snapshot(self) -> Sequence[dict]:
+        """Copy of the data store_to would write, safe to store while items are added"""
+        return self.retrieve_export_data_for()
+
+    @staticmethod
+    @metrics.timed("changehistory.store")
+    def store_snapshot_to(filename: str, snapshot: Sequence[dict]):
+        """Serialise and store ChangeHistoryItem entries previously copied with export_snapshot"""
         storage_service: LexiconChangeHistoryIOService = LexiconChangeHistoryIOService(
             IOService(DataFormat.JSON))
-        output_dicts = self.retrieve_export_data_for()
-        storage_service.store_to(filename + ".json", output_dicts)
+        storage_service.store_to(filename + ".json", snapshot)
+
+    def store_to(self, filename: str):
+        """Serialise and store ChangeHistoryItem entries locally"""
+        LexiconChangeHistory.store_snapshot_to(filename, self.retrieve_export_data_for())
 
+    def populate_from(self, item_data: Sequence[dict]):
+        """Register ChangeHistoryItems built from item_data, indexing once all are added"""
+        for data in item_data:
+            new_item = ChangeHistoryItem("", "", item_data=data)
+            if new_item.uid not in self._id_index:
+                self._items.append(new_item)
+                self._id_index[new_item.uid] = new_item
+        self._build_indexes()
+
+    @metrics.timed("changehistory.load")
     def load_from(self, filename: str):
         """Read and deserialise LexiconChangeHistory entries from local store"""
         storage_service: LexiconChangeHistoryIOService = LexiconChangeHistoryIOService(
             IOService(DataFormat.JSON))
         input_data = storage_service.load_from(filename + ".json")
-        for item_data in input_data:
-            self.add_item(ChangeHistoryItem("", "", item_data=item_data))
-        self._build_indexes()
+        self.populate_from(input_data)
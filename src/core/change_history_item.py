@@ -1,28 +1,120 @@
 """Definition of Change History Items and their operations"""
+import ast
 import datetime
+import re
 import uuid
+from typing import Any, Union
+
+# Free text descriptions written before changes were stored as structured records
+_LEGACY_DESCRIPTION = re.compile(r"^([a-z_]+) ON (.*) FROM (.*) TO (.*)$", re.DOTALL)
+_LEGACY_SEPARATORS = (" ON ", " FROM ", " TO ")
+
+
+def _list_from_text(text: str) -> Union[list, None]:
+    try:
+        value = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return None
+    return value if isinstance(value, list) else None
+
+
+def _value_from_text(text: str) -> Any:
+    """The scalar value a legacy description rendered as text"""
+    if text == "None":
+        return None
+    return text
 
 
 class ChangeHistoryItem:
-    """Item recording a single change made to a single word."""
-    def __init__(self, description_of_change: str, originator: str, item_data: dict = None) -> None:
+    """Item recording a single change made to a single word.
+
+    Changes to a field of a Word are held as a structured record of the field, the Word and
+    the values it changed between; list values are held as the items added and removed.
+    The description is rendered from the record when requested, unless set explicitly."""
+    __slots__ = (
+        "_uid", "_description_of_change", "_creation_time", "_originator",
+        "_field", "_word", "_change")
+
+    def __init__(
+            self,
+            description_of_change: Union[str, None],
+            originator: str,
+            item_data: dict = None) -> None:
         self._uid = uuid.uuid4().hex
         self._description_of_change = description_of_change
         self._creation_time = int(datetime.datetime.now().timestamp())
         self._originator = originator
+        self._field: Union[str, None] = None
+        self._word: Union[str, None] = None
+        self._change: dict = {}
         if item_data is not None:
-            stored_uid = item_data.get("UId")
-            stored_description = item_data.get("DescriptionOfChange")
-            stored_creation = item_data.get("CreationTimeUTC")
-            stored_originator = item_data.get("Originator")
-            if stored_uid is not None:
-                self._uid = stored_uid
-            if stored_description is not None:
-                self._description_of_change = stored_description
-            if stored_creation is not None:
-                self._creation_time = stored_creation
-            if stored_originator is not None:
-                self._originator = stored_originator
+            self._merge_stored(item_data)
+
+    def _merge_stored(self, item_data: dict) -> None:
+        stored_uid = item_data.get("UId")
+        stored_description = item_data.get("DescriptionOfChange")
+        stored_creation = item_data.get("CreationTimeUTC")
+        stored_originator = item_data.get("Originator")
+        if stored_uid is not None:
+            self._uid = stored_uid
+        if stored_description is not None:
+            self._description_of_change = stored_description
+        if stored_creation is not None:
+            self._creation_time = stored_creation
+        if stored_originator is not None:
+            self._originator = stored_originator
+        if item_data.get("Field") is not None:
+            self._description_of_change = stored_description
+            self._field = item_data["Field"]
+            self._word = item_data.get("Word", "")
+            self._change = {
+                x: item_data[x] for x in ("From", "To", "Added", "Removed") if x in item_data}
+        elif stored_description is not None:
+            self._migrate_description()
+
+    def _migrate_description(self) -> None:
+        """Replaces a legacy description with a record if the record renders it exactly
+
+        Descriptions that could be split into field, word and values in more than one way
+        are kept as they are."""
+        match = _LEGACY_DESCRIPTION.match(self._description_of_change)
+        if match is None:
+            return
+        (field, word, old_text, new_text) = match.groups()
+        if sum(self._description_of_change.count(x) for x in _LEGACY_SEPARATORS) > 3:
+            return
+        (old_list, new_list) = (_list_from_text(old_text), _list_from_text(new_text))
+        if old_list is not None and new_list is not None:
+            (old_value, new_value) = (old_list, new_list)
+        else:
+            (old_value, new_value) = (_value_from_text(old_text), _value_from_text(new_text))
+        if f"{field} ON {word} FROM {old_value} TO {new_value}" != self._description_of_change:
+            return
+        self._record_change(field, word, old_value, new_value)
+        self._description_of_change = None
+
+    def _record_change(self, field: str, word: str, old_value: Any, new_value: Any) -> None:
+        self._field = field
+        self._word = word
+        if isinstance(old_value, list) and isinstance(new_value, list):
+            added = [x for x in new_value if x not in old_value]
+            removed = [x for x in old_value if x not in new_value]
+            if [x for x in old_value if x not in removed] + added == new_value:
+                self._change = {"Added": added, "Removed": removed}
+                return
+        self._change = {"From": old_value, "To": new_value}
+
+    @staticmethod
+    def for_field_change(
+            field: str,
+            word: str,
+            old_value: Any,
+            new_value: Any,
+            originator: str) -> "ChangeHistoryItem":
+        """Item recording that field of the Word named word changed from old_value to new_value"""
+        item = ChangeHistoryItem(None, originator)
+        item._record_change(field, word, old_value, new_value)  # pylint: disable=protected-access
+        return item
 
     @property
     def uid(self) -> str:
@@ -32,7 +124,23 @@ class ChangeHistoryItem:
     @property
     def description(self) -> str:
         """Provides description of the change"""
-        return self._description_of_change[:]
+        if self._description_of_change is not None:
+            return self._description_of_change[:]
+        if self._field is None:
+            return ""
+        if "From" in self._change:
+            return (
+                f"{self._field} ON {self._word} "
+                f"FROM {self._change['From']} TO {self._change['To']}")
+        changes = [
+            f"{label.upper()} {self._change[label]}"
+            for label in ("Added", "Removed") if self._change[label]]
+        return f"{self._field} ON {self._word} {' '.join(changes)}"
+
+    @property
+    def field(self) -> Union[str, None]:
+        """Provides the Word field changed, if the change was recorded as a structured record"""
+        return self._field
 
     @property
     def created_utc(self) -> int:
@@ -50,8 +158,13 @@ class ChangeHistoryItem:
 
     def data_for_export(self) -> dict:
         """Provides data object for serialisation and storage"""
-        return {
+        export_data = {
             "UId": self._uid,
-            "DescriptionOfChange": self._description_of_change,
             "CreationTimeUTC": self._creation_time,
             "Originator": self.originator}
+        if self._field is not None:
+            export_data.update({"Field": self._field, "Word": self._word})
+            export_data.update(self._change)
+        if self._description_of_change is not None or self._field is None:
+            export_data["DescriptionOfChange"] = self.description
+        return export_data
@@ -1,11 +1,13 @@
 """Location for project-wide values and interfaces."""
 from typing import Callable, Sequence
 import os
+import json
 import uuid
 import logging
 from enum import Enum, auto
 from abc import ABCMeta, abstractmethod
-from PyQt5.QtCore import QObject, pyqtSignal, QEvent
+
+logger = logging.getLogger('etym_logger')
 
 
 # Build this programmatically from files rather than hard coding and then adding items to io_service
@@ -91,40 +93,75 @@ class DeserialiserInterface(metaclass=ABCMeta):
         raise NotImplementedError
 
 
-def double_clickable(widget):
-    """Helper method to add an event filter for Double Click"""
-    class Filter(QObject):
-        """Permits double click on an element that doesn't have a Double Click slot"""
-        clicked = pyqtSignal()
-
-        # pylint: disable-next=invalid-name
-        def eventFilter(self,
-                        obj: 'QObject',
-                        event: 'QEvent') -> bool:
-            """Catch Dbl-Click if triggered within the bounds of the element"""
-            if obj == widget:
-                if event.type() == QEvent.MouseButtonDblClick:
-                    if obj.rect().contains(event.pos()):
-                        self.clicked.emit()
-                        return True
-            return False
-    dbl_filter = Filter(widget)
-    widget.installEventFilter(dbl_filter)
-    return dbl_filter.clicked
-
-
-def id_project_files_in(file_location: str, validator: Callable) -> Sequence:
-    """Collects data about Projects stored in the specified location."""
-    logger = logging.getLogger('etym_logger')
+def _read_directory_index(index_location: str) -> dict:
+    if index_location is None or not os.path.exists(index_location):
+        return {}
+    try:
+        with open(index_location, 'r', encoding='UTF-8') as index_file:
+            return json.load(index_file).get("Directories", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _write_directory_index(index_location: str, directories: dict) -> None:
+    with open(index_location, 'w', encoding='UTF-8') as index_file:
+        json.dump({"Directories": directories}, index_file)
+
+
+def _scan_directory(path: str, modified_time: int) -> dict:
+    """Lists the subdirectories and file names of a single directory."""
+    listing = {"MTime": modified_time, "Dirnames": [], "Links": [], "Files": []}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                listing["Dirnames"].append(entry.name)
+                if entry.is_symlink():
+                    listing["Links"].append(entry.name)
+            else:
+                listing["Files"].append(entry.name)
+    return listing
+
+
+def id_project_files_in(
+        file_location: str,
+        validator: Callable,
+        index_location: str = None) -> Sequence:
+    """Collects data about Projects stored in the specified location.
+
+    If index_location is given, directory listings are cached in that file and only
+    directories whose modification time has changed since the last call are rescanned."""
+    cached_directories = _read_directory_index(index_location)
+    scanned_directories = {}
+    rescanned_count = 0
     proj_files_found = {}
-    for path, dirnames, filenames in os.walk(file_location):
-        logger.debug("Path     : %s", path)
-        logger.debug("Dirnames : %s", dirnames)
-        logger.debug("Filenames: %s", filenames)
+    pending_paths = [file_location]
+    while pending_paths:
+        path = pending_paths.pop()
+        try:
+            modified_time = os.stat(path).st_mtime_ns
+            listing = cached_directories.get(path)
+            if listing is None or listing["MTime"] != modified_time:
+                listing = _scan_directory(path, modified_time)
+                rescanned_count += 1
+        except OSError:
+            continue
+        scanned_directories[path] = listing
+        filenames = list(listing["Files"])
         proj_files_found[path] = {}
-        if dirnames:
-            for dirname in dirnames:
+        if listing["Dirnames"]:
+            for dirname in listing["Dirnames"]:
                 proj_files_found[path][dirname] = [x for x in filenames if validator(x)]
         else:
             proj_files_found[path][''] = [x for x in filenames if validator(x)]
+        pending_paths.extend(reversed([
+            os.path.join(path, dirname)
+            for dirname in listing["Dirnames"]
+            if dirname not in listing["Links"]]))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Project file scan: %s of %s directories rescanned",
+            rescanned_count, len(scanned_directories))
+    if index_location is not None:
+        if rescanned_count or scanned_directories.keys() != cached_directories.keys():
+            _write_directory_index(index_location, scanned_directories)
     return proj_files_found
@@ -1,19 +1,54 @@
 """Library for Word and Lexicon level functionality."""
 from __future__ import annotations
+import bisect
+import copy
+import logging
 import uuid
 import re
 from typing import Any, Union
-from collections.abc import Sequence
-from services.io_service import IOService
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from services.io_service import IOService, MappedRecords
 from services.io_service_api import IOServiceAPI
 from core.core import DataFormat, WordField, split_string_into_groups
+from core.metrics import metrics
 from core.word import Word
 from core.change_history import LexiconChangeHistory
 from core.change_history_item import ChangeHistoryItem
 from core.wordflow import Wordflow
 
+logger = logging.getLogger('etym_logger')
 
-class Lexicon:
+
+# Fields whose values place a Word within the etymological hierarchy
+STRUCTURAL_FIELDS = frozenset({WordField.TRANSLATEDWORD, WordField.TRANSLATEDCOMPONENTS})
+
+
+class LexiconChange:
+    """Words and fields affected by a single modification of a Lexicon"""
+
+    def __init__(
+            self,
+            words: Sequence[Word],
+            fields: Sequence[WordField] = None,
+            rippled: Sequence[Word] = None,
+            added: bool = False) -> None:
+        self.words = list(words)
+        self.fields = set(fields or [])
+        self.rippled = list(rippled or [])
+        self.added = added
+
+    @property
+    def is_structural(self) -> bool:
+        """True if Words were added or moved within the etymological hierarchy"""
+        return self.added or not self.fields.isdisjoint(STRUCTURAL_FIELDS)
+
+    @property
+    def affected_words(self) -> list[Word]:
+        """The modified Words followed by the descendants flagged by the modification"""
+        return self.words + self.rippled
+
+
+class Lexicon:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Container to hold Words that comprise a language."""
     @staticmethod
     def _structure_validator_etymological_symbology(to_validate: str):
@@ -37,15 +72,19 @@ class Lexicon:
 
     uuid: str
     title: str
-    members: list[Word]
 
     def __init__(self) -> None:
         self.uuid = uuid.uuid4().hex
         self.title = "BlankProjectLexicon"
-        self.members = []
+        self._members: list[Union[Word, None]] = []
+        self._records: Union[MappedRecords, None] = None
+        self._unloaded_positions: dict[str, list[int]] = {}
+        self._relationship_positions: Union[dict[str, list[int]], None] = None
+        self._uid_positions: Union[dict[str, int], None] = None
         self.changehistory = LexiconChangeHistory()
+        self._subscribers: list[Callable[[LexiconChange], None]] = []
+        self._revision = 0
         self.index_by_translated_word = {}
-        self.index_by_relationship = {}
         self.label_to_wordfield_mapping = {
             "Translated Word": WordField.TRANSLATEDWORD,
             "Translated Word Components": WordField.TRANSLATEDCOMPONENTS,
@@ -62,27 +101,188 @@ class Lexicon:
             "Has Modified Ancestor": WordField.HASMODIFIEDANCESTOR,
             "Is Related To": WordField.ISRELATEDTO}
 
+    def subscribe(self, callback: Callable[[LexiconChange], None]) -> None:
+        """Calls callback with a LexiconChange after each modification of the Lexicon"""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[LexiconChange], None]) -> None:
+        """Stops calling a previously subscribed callback"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    @property
+    def revision(self) -> int:
+        """Count of modifications made since the Lexicon was created or loaded"""
+        return self._revision
+
+    def _notify(self, change: LexiconChange) -> None:
+        self._revision += 1
+        for callback in list(self._subscribers):
+            callback(change)
+
+    @property
+    def members(self) -> list[Word]:
+        """All registered Words, materialising any that have not yet been read from storage"""
+        self._materialise_all()
+        return self._members
+
+    def __iter__(self) -> Iterator[Word]:
+        """Yields registered Words in order, materialising each one only as it is reached"""
+        for position in range(len(self._members)):
+            yield self._materialise(position)
+
+    def _materialise(self, position: int) -> Word:
+        word = self._members[position]
+        if word is None:
+            word = Word(self._records.record_at(position))
+            word.identify_unresolved_modifications(self.changehistory)
+            self._members[position] = word
+            translated_word = self._records.keys[position]
+            self._unloaded_positions[translated_word].remove(position)
+            if not self._unloaded_positions[translated_word]:
+                del self._unloaded_positions[translated_word]
+            self.index_by_translated_word[word.find_data_on(WordField.TRANSLATEDWORD)] = word
+            if not self._unloaded_positions:
+                self._release_records()
+        return word
+
+    def _materialise_all(self) -> None:
+        if self._unloaded_positions:
+            for position in range(len(self._members)):
+                self._materialise(position)
+
+    def _release_records(self) -> None:
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+
+    def _key_at(self, position: int) -> str:
+        word = self._members[position]
+        if word is None:
+            return self._records.keys[position]
+        return word.find_data_on(WordField.TRANSLATEDWORD)
+
+    def _components_at(self, position: int) -> list[str]:
+        """Translated components of the Word at position, read from the file index if unloaded"""
+        word = self._members[position]
+        if word is None and self._records.column("Parents") is not None:
+            return self._records.column("Parents")[position] or []
+        return self._materialise(position).find_data_on(WordField.TRANSLATEDCOMPONENTS) or []
+
+    def _uid_at(self, position: int) -> str:
+        """Uid of the Word at position, read from the file index if unloaded"""
+        word = self._members[position]
+        if word is None and self._records.column("UIds") is not None:
+            return self._records.column("UIds")[position]
+        return self._materialise(position).find_data_on(WordField.UID)
+
+    def _uids(self) -> dict[str, int]:
+        """Position of the Word with each uid"""
+        if self._uid_positions is None:
+            self._uid_positions = {self._uid_at(x): x for x in range(len(self._members))}
+        return self._uid_positions
+
+    def _is_registered(self, translated_word: str) -> bool:
+        return (
+            translated_word in self.index_by_translated_word
+            or translated_word in self._unloaded_positions)
+
+    def _relationships(self) -> dict[str, list[int]]:
+        """Positions of the children of each registered Word, and of the ROOT Words"""
+        if self._relationship_positions is None:
+            self._build_relationship_index()
+        return self._relationship_positions
+
+    @metrics.timed("lexicon.build_relationship_index")
+    def _build_relationship_index(self) -> None:
+        self._relationship_positions = {"ROOT": []}
+        for position in range(len(self._members)):
+            self._link(position)
+
+    def _link(self, position: int) -> None:
+        """Adds position to the relationship index under each of its registered components
+
+        Words with no registered component are indexed under ROOT, so that every Word can
+        be reached from the ROOT Words."""
+        buckets = [x for x in self._components_at(position) if self._is_registered(x)]
+        for component in buckets or ["ROOT"]:
+            bucket = self._relationship_positions.setdefault(component, [])
+            if position not in bucket:
+                bisect.insort(bucket, position)
+
+    def _unlink(self, position: int) -> None:
+        for bucket in self._relationship_positions.values():
+            if position in bucket:
+                bucket.remove(position)
+
+    def _relink(self, positions: Iterable[int]) -> None:
+        for position in positions:
+            self._unlink(position)
+            self._link(position)
+
+    def _link_children_of(self, translated_word: str) -> None:
+        """Indexes every Word with translated_word as a component again, moving it from ROOT"""
+        self._relink([
+            x for x in range(len(self._members)) if translated_word in self._components_at(x)])
+
+    def _position_of(self, word: Word) -> int:
+        position = self._uids().get(word.find_data_on(WordField.UID))
+        if position is None or self._members[position] is not word:
+            raise ValueError("Word is not registered in the Lexicon")
+        return position
+
+    def _reindex(self, word: Word, field: WordField, previous_value: Any) -> None:
+        """Updates the indexes in place after a structural field of word has changed"""
+        if field == WordField.TRANSLATEDWORD:
+            if self.index_by_translated_word.get(previous_value) is word:
+                del self.index_by_translated_word[previous_value]
+            self.index_by_translated_word[word.find_data_on(WordField.TRANSLATEDWORD)] = word
+        if self._relationship_positions is None:
+            return
+        if field == WordField.TRANSLATEDWORD:
+            if not self._is_registered(previous_value):
+                self._relink(self._relationship_positions.pop(previous_value, []))
+            self._link_children_of(word.find_data_on(WordField.TRANSLATEDWORD))
+        else:
+            position = self._position_of(word)
+            self._unlink(position)
+            self._link(position)
+
+    def _relationship_bucket(self, bucket: str) -> list[Word]:
+        return [self._materialise(position) for position in self._relationships().get(bucket, [])]
+
+    @metrics.timed("lexicon.build_indexes")
     def _build_indexes(self):
+        """Indexes loaded Words by name; relationships are indexed again when next requested"""
         self.index_by_translated_word.clear()
-        self.index_by_relationship = {"ROOT": []}
-        for word in self.members:
-            translated_word = word.find_data_on(WordField.TRANSLATEDWORD)
-            self.index_by_translated_word[translated_word] = word
-            self.index_by_relationship[translated_word] = []
-        for word in self.members:
-            parent_components: list = word.find_data_on(WordField.TRANSLATEDCOMPONENTS)
-            if parent_components is None:
-                self.index_by_relationship["ROOT"].append(word)
-            elif len(parent_components) == 0:
-                self.index_by_relationship["ROOT"].append(word)
-            else:
-                for component in parent_components:
-                    if self.index_by_translated_word.get(component) is not None:
-                        self.index_by_relationship[component].append(word)
+        for word in self._members:
+            if word is not None:
+                self.index_by_translated_word[word.find_data_on(WordField.TRANSLATEDWORD)] = word
+        self._relationship_positions = None
+        self._uid_positions = None
 
     def get_children_of(self, parent_word: Word) -> Union[list[Word], None]:
         """Gets the immediate child Words of the specified Word, otherwise None"""
-        return self.index_by_relationship[parent_word.find_data_on(WordField.TRANSLATEDWORD)]
+        return self._relationship_bucket(parent_word.find_data_on(WordField.TRANSLATEDWORD))
+
+    def get_root_words(self) -> list[Word]:
+        """Gets the Words that have no translated components naming a registered Word"""
+        return self._relationship_bucket("ROOT")
+
+    def list_child_positions(self, parent_word: Word = None) -> list[int]:
+        """Positions of the children of parent_word, or of the ROOT Words if None
+
+        Ordered by translated word, without materialising any Word."""
+        bucket = "ROOT"
+        if parent_word is not None:
+            bucket = parent_word.find_data_on(WordField.TRANSLATEDWORD)
+        return sorted(self._relationships().get(bucket, []), key=self._key_at)
+
+    def count_children_of(self, parent_word: Word) -> int:
+        """Counts the immediate child Words of the specified Word without materialising them"""
+        translated_word = parent_word.find_data_on(WordField.TRANSLATEDWORD)
+        return len(self._relationships().get(translated_word, []))
 
     def get_descendants_of(
             self,
@@ -103,8 +303,37 @@ class Lexicon:
 
     def retrieve(self, entry_id: str):
         """Returns a Word with identifier entry_id if it has been registered. Otherwise None."""
+        for position in list(self._unloaded_positions.get(entry_id, [])):
+            self._materialise(position)
         return self.index_by_translated_word.get(entry_id)
 
+    def retrieve_by_uid(self, uid: str) -> Union[Word, None]:
+        """Returns the Word with uid if it has been registered. Otherwise None."""
+        position = self._uids().get(uid)
+        if position is None:
+            return None
+        return self._materialise(position)
+
+    def retrieve_at(self, position: int) -> Word:
+        """Returns the Word registered at position, in registration order"""
+        return self._materialise(position)
+
+    def translated_word_at(self, position: int) -> str:
+        """Translated word of the Word registered at position, without materialising it"""
+        return self._key_at(position)
+
+    def _word_for(self, word: Union[Word, str]) -> Word:
+        if isinstance(word, str):
+            found_word = self.retrieve(word)
+            if found_word is None:
+                raise KeyError(word)
+            return found_word
+        return word
+
+    def count_entries(self) -> int:
+        """Number of Words registered in the Lexicon, including any not yet materialised"""
+        return len(self._members)
+
     def get_all_words(self) -> Sequence[Word]:
         """List all Words currently registered in the Lexicon"""
         return self.members
@@ -115,6 +344,22 @@ class Lexicon:
             return [x.data_for_export() for x in words_selected]
         return [x.data_for_export() for x in self.get_all_words()]
 
+    def populate_from(
+            self,
+            word_data: Sequence[dict],
+            changehistory: LexiconChangeHistory = None) -> None:
+        """Register Words built from word_data, then index and flag them in a single pass
+
+        Word data with the uid of a Word already registered is not registered again."""
+        if changehistory is not None:
+            self.changehistory = changehistory
+        self._materialise_all()
+        self._members.extend([
+            Word(data) for data in word_data
+            if data.get("uid") is None or self.retrieve_by_uid(data["uid"]) is None])
+        self._build_indexes()
+        self.resolve_modification_flags()
+
     def create_entry(self) -> Word:
         """Create a Word from the Template and then register it in the Lexicon"""
         new_word = Word()
@@ -123,22 +368,31 @@ class Lexicon:
 
     def add_entry(self, entry: Word):
         """Register a given Word in the Lexicon"""
-        self.members.append(entry)
-        self._build_indexes()
+        self._members.append(entry)
+        translated_word = entry.find_data_on(WordField.TRANSLATEDWORD)
+        self.index_by_translated_word[translated_word] = entry
+        if self._uid_positions is not None:
+            self._uid_positions[entry.find_data_on(WordField.UID)] = len(self._members) - 1
+        if self._relationship_positions is not None:
+            self._link_children_of(translated_word)
+            self._link(len(self._members) - 1)
+        self._notify(LexiconChange([entry], added=True))
 
     def get_field_for_word(self, field: str, word: Union[Word, str] = None):
         """Return the data for specified field from a supplied word"""
-        if isinstance(word, str):
-            word: Word = self.index_by_translated_word[word]
+        word = self._word_for(word)
         this_field = self._map_label_to_field(field)
         if this_field is not None:
             return word.find_data_on(this_field)
         raise ValueError(f"Field label {field} is not mapped to a Word field")
 
     def resolve_modification_flags(self):
-        """Identifies unresolved modifications on all entries."""
-        for word in self.members:
-            word.identify_unresolved_modifications(self.changehistory)
+        """Identifies unresolved modifications on all entries.
+
+        Entries not yet materialised are identified when they are first accessed."""
+        for word in self._members:
+            if word is not None:
+                word.identify_unresolved_modifications(self.changehistory)
 
     def _validate_characters_for_field(self, field: WordField, to_validate: str):
         if field not in Lexicon._character_validators:
@@ -174,45 +428,195 @@ class Lexicon:
         """Returns Wordflow results"""
         return Wordflow()
 
+    @metrics.timed("lexicon.set_field_to_value")
     def set_field_to_value(self, field: str, word: Union[Word, str], new_value: Any):
         """Set the value of the specified field for a supplied word"""
-        if isinstance(word, str):
-            word: Word = self.index_by_translated_word[word]
+        word = self._word_for(word)
 
         # if isinstance(new_value, str):
         #     if self.validate_for_field(field_name=field, to_validate=new_value) is False:
         #         raise ValueError("Word: Error - Field cannot be set to invalid value.")
 
         this_field = self._map_label_to_field(field)
+        previous_value = word.find_data_on(this_field)
         change_history_item = word.set_field_to(this_field, new_value)
 
         if change_history_item is not None:
-            self._build_indexes()
+            if this_field in STRUCTURAL_FIELDS:
+                self._reindex(word, this_field, previous_value)
 
             self.changehistory.add_item(change_history_item)
 
             word.identify_unresolved_modifications(self.changehistory)
 
             all_children = self.get_descendants_of(word)
+            metrics.increment("lexicon.ripple.propagations")
+            metrics.increment("lexicon.ripple.words", len(all_children))
             for child_word in all_children:
                 child_word.acknowledge_ancestor_modification_of(change_history_item.uid)
                 child_word.identify_unresolved_modifications(self.changehistory)
 
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Change %s to %s rippled to %s descendants",
+                    change_history_item.uid, word.find_data_on(WordField.TRANSLATEDWORD),
+                    len(all_children))
+            self._notify(LexiconChange([word], [this_field], all_children))
+
     def resolve_change_for(self, change_item: ChangeHistoryItem, changed_word: Word):
         """Logs that change_item has been resolved for changed_word"""
-        changed_word.resolve_change_with_id(change_item.uid)
+        self.resolve_changes_for([change_item], changed_word)
+
+    def resolve_changes_for(
+            self,
+            change_items: Sequence[ChangeHistoryItem],
+            changed_word: Word):
+        """Logs that each of change_items has been resolved for changed_word, notifying once"""
+        for change_item in change_items:
+            changed_word.resolve_change_with_id(change_item.uid)
         changed_word.identify_unresolved_modifications(self.changehistory)
+        self._notify(LexiconChange([changed_word]))
+
+    def _resolve_changes_where(
+            self,
+            words: Iterable[Word],
+            is_resolvable: Callable[[Word, ChangeHistoryItem], bool]) -> list[Word]:
+        """Resolves each unresolved change of words that is_resolvable selects in a single pass
+
+        Unresolved state is recomputed once for each Word that changed and subscribers are
+        notified once of every such Word."""
+        resolved_words = []
+        for word in words:
+            resolved_ids = set(word.find_data_on(WordField.RESOLVEDHISTORYITEMS))
+            resolved_count = len(resolved_ids)
+            for change_id in word.find_data_on(WordField.VERSIONHISTORY):
+                if change_id in resolved_ids:
+                    continue
+                change_item = self.changehistory.find_item_with_id(change_id)
+                if change_item is not None and is_resolvable(word, change_item):
+                    word.resolve_change_with_id(change_id)
+                    resolved_ids.add(change_id)
+            if len(resolved_ids) > resolved_count:
+                word.identify_unresolved_modifications(self.changehistory)
+                resolved_words.append(word)
+        if resolved_words:
+            self._notify(LexiconChange(resolved_words))
+        return resolved_words
+
+    def _subtree_of(self, word: Word) -> list[Word]:
+        """word followed by each of its descendants once, however many parents they have"""
+        subtree = {id(word): word}
+        for descendant in self.get_descendants_of(word):
+            subtree.setdefault(id(descendant), descendant)
+        return list(subtree.values())
+
+    def resolve_ancestor_changes_for_subtree(self, root_word: Union[Word, str]) -> list[Word]:
+        """Resolves every change made by an ancestor for root_word and all of its descendants
+
+        Returns the Words that had changes resolved."""
+        return self._resolve_changes_where(
+            self._subtree_of(self._word_for(root_word)),
+            lambda word, change: change.originator != word.find_data_on(WordField.UID))
+
+    def resolve_changes_older_than(self, created_utc: int) -> list[Word]:
+        """Resolves every change created before created_utc for every Word in the Lexicon
+
+        Returns the Words that had changes resolved."""
+        return self._resolve_changes_where(
+            iter(self), lambda _, change: change.created_utc < created_utc)
+
+    def resolve_changes_for_descendants(
+            self,
+            change_items: Sequence[ChangeHistoryItem],
+            changed_word: Union[Word, str]) -> list[Word]:
+        """Resolves each of change_items for changed_word and all of its descendants
+
+        Returns the Words that had changes resolved."""
+        change_ids = {x.uid for x in change_items}
+        # Materialising the subtree first indexes the changes of any Words not yet loaded
+        subtree = self._subtree_of(self._word_for(changed_word))
+        unresolved_uids = set().union(
+            *[self.changehistory.find_words_unresolved_for(x) for x in change_ids])
+        subtree_uids = {x.find_data_on(WordField.UID) for x in subtree}
+        return self._resolve_changes_where(
+            [
+                self.retrieve_by_uid(x)
+                for x in sorted(unresolved_uids & subtree_uids, key=self._uids().get)],
+            lambda _, change: change.uid in change_ids)
+
+    def uids_with_unresolved_change(self, change_id: str) -> set[str]:
+        """Uids of every Word that has not resolved the change with change_id
+
+        Any Words not yet materialised are read first so that their changes are indexed."""
+        self._materialise_all()
+        return set(self.changehistory.find_words_unresolved_for(change_id))
+
+    def words_with_unresolved_change(self, change_id: str) -> list[Word]:
+        """Every Word that has not resolved the change with change_id, in registration order"""
+        return sorted(
+            (self.retrieve_by_uid(x) for x in self.uids_with_unresolved_change(change_id)),
+            key=lambda word: self._uids()[word.find_data_on(WordField.UID)])
+
+    def _export_data(self, copy_words: bool) -> dict:
+        """Data store_to would write, holding the stored record of each unloaded Word as it is
+
+        If copy_words is set, the data of each materialised Word is copied one level deep.
+        Word fields are replaced or appended to rather than modified in place, so such a
+        copy is unaffected by later edits."""
+        positions = range(len(self._members))
+        keys = [self._key_at(x) for x in positions]
+        columns = {
+            "Parents": [list(self._components_at(x)) for x in positions],
+            "UIds": [self._uid_at(x) for x in positions]}
+        records = []
+        for (position, word) in enumerate(self._members):
+            if word is None:
+                records.append(self._records.raw_record_at(position))
+            elif copy_words:
+                records.append({x: copy.copy(y) for (x, y) in word.data_for_export().items()})
+            else:
+                records.append(word.data_for_export())
+        return {"Records": records, "Keys": keys, "Columns": columns}
+
+    def export_snapshot(self) -> dict:
+        """Copy of the data store_to would write, safe to store while the Lexicon is edited
+
+        Words not yet materialised are copied as their serialised records, without being read."""
+        return self._export_data(copy_words=True)
+
+    @staticmethod
+    @metrics.timed("lexicon.store")
+    def store_snapshot_to(filename: str, snapshot: dict):
+        """Serialise and store Word entries previously copied with export_snapshot"""
+        storage_service: IOServiceAPI = IOServiceAPI("LEX", IOService(DataFormat.JSON))
+        storage_service.store_to(
+            filename + ".json", snapshot["Records"], snapshot["Keys"], snapshot["Columns"])
 
     def store_to(self, filename: str):
         """Serialise and store Word entries locally"""
-        storage_service: IOServiceAPI = IOServiceAPI("LEX", IOService(DataFormat.JSON))
-        output_dicts = self.retrieve_export_data_for()
-        storage_service.store_to(filename + ".json", output_dicts)
+        Lexicon.store_snapshot_to(filename, self._export_data(copy_words=False))
 
+    @metrics.timed("lexicon.load")
     def load_from(self, filename: str):
-        """Read and deserialise Word entries from local store"""
+        """Read and deserialise Word entries from local store
+
+        Indexed files are memory mapped and each Word is materialised on first access."""
         storage_service: IOServiceAPI = IOServiceAPI("LEX", IOService(DataFormat.JSON))
-        input_data = storage_service.load_from(filename + ".json")
         self.uuid = filename
-        for word_data in input_data:
-            self.add_entry(Word(word_data))
+        records = None
+        if not self._members:
+            records = storage_service.map_from(filename + ".json")
+        if records is None:
+            input_data = storage_service.load_from(filename + ".json")
+            self._materialise_all()
+            self._members.extend([Word(word_data) for word_data in input_data])
+            self._build_indexes()
+            return
+        self._records = records
+        self._members = [None] * len(records)
+        for (position, translated_word) in enumerate(records.keys):
+            self._unloaded_positions.setdefault(translated_word, []).append(position)
+        self._relationship_positions = None
+        self._uid_positions = None
+        if not self._unloaded_positions:
+            self._release_records()
@@ -0,0 +1,118 @@
+"""Counters and timing histograms for core operations, recorded only while enabled"""
+import bisect
+import functools
+import json
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+_Function = TypeVar("_Function", bound=Callable[..., Any])
+
+# Upper bounds in seconds of the timing histogram buckets; slower timings land in the last bucket
+TIMING_BUCKET_BOUNDS = [10 ** (x / 2) * 1e-6 for x in range(15)]
+
+
+class _Timing:
+    """Count, total, extremes and bucketed distribution of the durations of one operation"""
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.buckets = [0] * (len(TIMING_BUCKET_BOUNDS) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Adds one duration of seconds to the Timing"""
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        self.buckets[bisect.bisect_left(TIMING_BUCKET_BOUNDS, seconds)] += 1
+
+    def summary(self) -> dict:
+        """Serialisable description of the recorded durations"""
+        return {
+            "Count": self.count,
+            "TotalSeconds": self.total,
+            "MeanSeconds": self.total / self.count if self.count else 0.0,
+            "MinSeconds": self.minimum if self.count else 0.0,
+            "MaxSeconds": self.maximum,
+            "Buckets": {
+                f"<={bound:g}" if index < len(TIMING_BUCKET_BOUNDS) else "slower": count
+                for (index, (bound, count)) in enumerate(
+                    zip(TIMING_BUCKET_BOUNDS + [None], self.buckets))
+                if count > 0}}
+
+
+class MetricsRegistry:
+    """Named counters and timings, ignoring every record made while disabled"""
+    def __init__(self) -> None:
+        self.enabled = False
+        self._counters: dict[str, int] = {}
+        self._timings: dict[str, _Timing] = {}
+
+    def enable(self) -> None:
+        """Starts recording counts and timings"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording, keeping what has been recorded so far"""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discards every recorded count and timing"""
+        self._counters = {}
+        self._timings = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Adds amount to the counter called name"""
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record_time(self, name: str, seconds: float) -> None:
+        """Adds a duration of seconds to the timing called name"""
+        if self.enabled:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = _Timing()
+            timing.record(seconds)
+
+    def timed(self, name: str) -> Callable[[_Function], _Function]:
+        """Decorates a function so that each call is timed under name while enabled"""
+        def _decorate(function: _Function) -> _Function:
+            @functools.wraps(function)
+            def _timed_call(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record_time(name, time.perf_counter() - started)
+            return _timed_call
+        return _decorate
+
+    def counter(self, name: str) -> int:
+        """Current value of the counter called name"""
+        return self._counters.get(name, 0)
+
+    def timing(self, name: str) -> dict:
+        """Summary of the timing called name, with a Count of 0 if nothing was recorded"""
+        return self._timings.get(name, _Timing()).summary()
+
+    def snapshot(self) -> dict:
+        """Serialisable copy of every counter and timing summary"""
+        return {
+            "Counters": dict(sorted(self._counters.items())),
+            "Timings": {x: self._timings[x].summary() for x in sorted(self._timings)}}
+
+    def dump_to(self, file_location: str) -> None:
+        """Writes the snapshot as JSON to file_location"""
+        with open(file_location, 'w', encoding='UTF-8') as output_file:
+            json.dump(self.snapshot(), output_file, indent=2)
+
+
+# Registry shared by the instrumented core operations
+metrics = MetricsRegistry()
@@ -2,25 +2,85 @@
 from __future__ import annotations
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import Union, Sequence
 from configuration.settings import Settings
+from core.core import DataFormat
 from core.lexicon import Lexicon
+from core.metrics import metrics
 from core.change_history import LexiconChangeHistory
+from services.io_service import IOService, deserialise_records
+from services.io_service_api import IOServiceAPI
+from services.change_history_io_service import LexiconChangeHistoryIOService
+
+# Files larger than this (in characters) are parsed on a process pool by load_all_lexicons
+PARALLEL_PARSE_THRESHOLD = 1_000_000
+
+
+class ProjectDescriptor:
+    """Summary of a stored Project read from its PROJ- settings file alone"""
+    def __init__(self, file_location: str, settings: dict) -> None:
+        self._file_location = file_location
+        self._settings = settings
+
+    @property
+    def file_location(self) -> str:
+        """The path of the PROJ- settings file that was read"""
+        return self._file_location
+
+    @property
+    def name(self) -> str:
+        """The descriptive name of the project"""
+        return self._settings.get("Name")
+
+    @property
+    def filename(self) -> str:
+        """The non-extension file name to which the Project is saved"""
+        return self._settings.get("Filename")
+
+    @property
+    def lexicon_ids(self) -> Sequence[str]:
+        """The identifiers of the Lexicons registered in the project"""
+        return self._settings.get("RegisteredLexicons") or []
+
+    def lexicon_file_sizes(self) -> dict:
+        """Sizes in bytes of the stored Lexicon and change history files, keyed by identifier"""
+        def _size_of(file_location: str) -> int:
+            if os.path.exists(file_location):
+                return os.path.getsize(file_location)
+            return 0
+        return {
+            lexicon_id: {
+                "Lexicon": _size_of(f"data/LEX-{lexicon_id}.json"),
+                "ChangeHistory": _size_of(f"data/CHI-{lexicon_id}.json")}
+            for lexicon_id in self.lexicon_ids}
+
+    def build_project(self) -> Project:
+        """Constructs the full Project described"""
+        return Project(dict(self._settings))
 
 
 class ProjectBuilder:
     """Returns Project instances if provided with valid Project data file locations."""
     @staticmethod
-    def projects_from_files(location_tree: dict):
-        """Given a directory structure as a nested dictionary will return Project instances"""
-        proj_files_found = {}
+    def descriptors_from_files(location_tree: dict):
+        """Given a directory structure as a nested dictionary will return ProjectDescriptors"""
+        descriptors_found = {}
         for (path, directory_data) in location_tree.items():
             for (directory_name, file_names) in directory_data.items():
                 for file_name in file_names:
-                    rebuilt_proj = ProjectBuilder.project_from_file(
+                    descriptor = ProjectBuilder.descriptor_from_file(
                         os.path.join(path, directory_name, file_name))
-                    proj_files_found[rebuilt_proj.name] = rebuilt_proj
-        return proj_files_found
+                    descriptors_found[descriptor.name] = descriptor
+        return descriptors_found
+
+    @staticmethod
+    def descriptor_from_file(file_location: str) -> ProjectDescriptor:
+        """Given a Project file path will return a descriptor read from its settings only"""
+        # REFACTOR - Knows about JSON
+        with open(file_location, 'r', encoding='UTF-8') as proj_file:
+            proj_data = json.load(proj_file)
+        return ProjectDescriptor(file_location, proj_data)
 
     @staticmethod
     def project_from_file(file_location: str) -> Project:
@@ -31,6 +91,34 @@ class ProjectBuilder:
         return Project(proj_data)
 
 
+class ProjectSnapshot:
+    """Copy of the unsaved state of a Project that can be stored while the Project is edited"""
+    def __init__(
+            self,
+            settings: Settings,
+            lexicon_data: dict[str, dict],
+            changehistory_data: dict[str, Sequence[dict]],
+            revisions: dict[str, int]) -> None:
+        self._settings = settings
+        self._lexicon_data = lexicon_data
+        self._changehistory_data = changehistory_data
+        self.revisions = revisions
+
+    @property
+    def lexicon_ids(self) -> list[str]:
+        """Identifiers of the Lexicons copied into the snapshot"""
+        return list(self._lexicon_data)
+
+    @metrics.timed("project.store_snapshot")
+    def store(self) -> None:
+        """Store the copied Project settings, Lexicon and Change History files"""
+        self._settings.export_config(f"data/PROJ-{self._settings.find_by_id('Filename')}")
+        for (lex_id, lexicon_data) in self._lexicon_data.items():
+            Lexicon.store_snapshot_to(lex_id, lexicon_data)
+        for (lex_id, changehistory_data) in self._changehistory_data.items():
+            LexiconChangeHistory.store_snapshot_to(lex_id, changehistory_data)
+
+
 class Project:
     """Class that contains Project level settings and Lexicons"""
     def __init__(self, settings: Union[dict, Settings] = None) -> None:
@@ -42,8 +130,9 @@ class Project:
             self._settings = Settings(settings)
         if isinstance(settings, Settings):
             self._settings = settings
-        self._lexicons: Sequence[str, Lexicon] = {}
-        self._changehistories: Sequence[str, LexiconChangeHistory] = {}
+        self._lexicons: Sequence[str, Union[Lexicon, None]] = {}
+        self._changehistories: Sequence[str, Union[LexiconChangeHistory, None]] = {}
+        self._stored_revisions: dict[str, int] = {}
         registered_lexicons = self._settings.find_by_id("RegisteredLexicons")
         if not registered_lexicons:
             base_blank_lexicon = Lexicon()
@@ -56,16 +145,89 @@ class Project:
             base_blank_lexicon.changehistory = base_blank_change_history
             base_blank_lexicon.resolve_modification_flags()
         else:
+            # Lexicons and their change histories are loaded on first request
             for lexicon_id in registered_lexicons:
-                new_lexicon = Lexicon()
-                # IS IT DOING FILENAMES CORRECTLY?
-                new_lexicon.load_from(lexicon_id)
-                self._lexicons[lexicon_id] = new_lexicon
-                new_changehistory = LexiconChangeHistory()
-                new_changehistory.load_from(lexicon_id)
-                self._changehistories[lexicon_id] = new_changehistory
-                new_lexicon.changehistory = new_changehistory
-                new_lexicon.resolve_modification_flags()
+                self._lexicons[lexicon_id] = None
+                self._changehistories[lexicon_id] = None
+
+    @metrics.timed("project.load_lexicon")
+    def _load_lexicon(self, lexicon_id: str) -> None:
+        new_lexicon = Lexicon()
+        # IS IT DOING FILENAMES CORRECTLY?
+        new_lexicon.load_from(lexicon_id)
+        self._lexicons[lexicon_id] = new_lexicon
+        new_changehistory = LexiconChangeHistory()
+        new_changehistory.load_from(lexicon_id)
+        self._changehistories[lexicon_id] = new_changehistory
+        new_lexicon.changehistory = new_changehistory
+        new_lexicon.resolve_modification_flags()
+        self._stored_revisions[lexicon_id] = new_lexicon.revision
+
+    def _accept_parsed_half(self, parsed: dict, lexicon_id: str, half: str, data: list) -> None:
+        parsed[lexicon_id][half] = data
+        if len(parsed[lexicon_id]) < 2:
+            return
+        halves = parsed.pop(lexicon_id)
+        new_changehistory = LexiconChangeHistory()
+        new_changehistory.populate_from(halves["CHI"])
+        new_lexicon = Lexicon()
+        new_lexicon.uuid = lexicon_id
+        new_lexicon.populate_from(halves["LEX"], new_changehistory)
+        self._lexicons[lexicon_id] = new_lexicon
+        self._changehistories[lexicon_id] = new_changehistory
+        self._stored_revisions[lexicon_id] = new_lexicon.revision
+
+    @metrics.timed("project.load_all_lexicons")
+    def load_all_lexicons(
+            self,
+            jobs: int = None,
+            parse_threshold: int = PARALLEL_PARSE_THRESHOLD) -> None:
+        """Loads every registered Lexicon and change history that is not yet loaded, concurrently
+
+        Files are read on a thread pool of up to jobs workers. Files longer than
+        parse_threshold are parsed on a process pool, smaller ones as they arrive.
+        Each Lexicon is indexed only once both it and its change history are parsed."""
+        pending_ids = [x for x in self._lexicons if not self.is_lexicon_loaded(x)]
+        if not pending_ids:
+            return
+        lexicon_service = IOServiceAPI("LEX", IOService(DataFormat.JSON))
+        history_service = LexiconChangeHistoryIOService(IOService(DataFormat.JSON))
+        parsed = {lexicon_id: {} for lexicon_id in pending_ids}
+        parse_pool = None
+        try:
+            with ThreadPoolExecutor(max_workers=jobs) as read_pool:
+                read_futures = {}
+                for lexicon_id in pending_ids:
+                    read_futures[read_pool.submit(
+                        lexicon_service.read_from, lexicon_id + ".json")] = (lexicon_id, "LEX")
+                    read_futures[read_pool.submit(
+                        history_service.read_from, lexicon_id + ".json")] = (lexicon_id, "CHI")
+                parse_futures = {}
+                for future in as_completed(read_futures):
+                    (lexicon_id, half) = read_futures[future]
+                    raw_data = future.result()
+                    if len(raw_data) > parse_threshold:
+                        if parse_pool is None:
+                            parse_pool = ProcessPoolExecutor(max_workers=jobs)
+                        parse_futures[parse_pool.submit(
+                            deserialise_records, raw_data, DataFormat.JSON)] = (lexicon_id, half)
+                    else:
+                        self._accept_parsed_half(
+                            parsed, lexicon_id, half,
+                            deserialise_records(raw_data, DataFormat.JSON))
+            for future in as_completed(parse_futures):
+                (lexicon_id, half) = parse_futures[future]
+                self._accept_parsed_half(parsed, lexicon_id, half, future.result())
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+
+    def _describe_lexicon(self, lexicon_id: str) -> dict:
+        lexicon: Lexicon = self._lexicons[lexicon_id]
+        changehistory: LexiconChangeHistory = self._changehistories[lexicon_id]
+        return {
+            "WordCount": lexicon.count_entries(),
+            "ChangeCount": len(changehistory.get_all_items())}
 
     @property
     def name(self) -> str:
@@ -77,27 +239,91 @@ class Project:
         """The non-extension file name to which the Project will be saved"""
         return self._settings.find_by_id("Filename")
 
+    def list_lexicon_ids(self) -> Sequence[str]:
+        """A list of the identifiers of all registered Lexicons, without loading them"""
+        return list(self._lexicons)
+
     def list_lexicons(self) -> Sequence[Lexicon]:
-        """A list of all registered Lexicons"""
-        return [x for (_, x) in self._lexicons.items()]
+        """A list of all registered Lexicons, loading any that have not yet been loaded"""
+        return [self.find_lexicon_by_id(x) for x in self._lexicons]
+
+    def is_lexicon_loaded(self, identifier: str) -> bool:
+        """True if the Lexicon with identifier has been loaded from storage"""
+        return self._lexicons.get(identifier) is not None
+
+    def lexicon_manifest(self) -> dict:
+        """Metadata for each registered Lexicon, keyed by identifier, without loading them
+
+        Entries for Lexicons that have not been loaded come from the stored manifest."""
+        stored_manifest: dict = self._settings.find_by_id("LexiconManifest") or {}
+        manifest = {}
+        for lexicon_id in self._lexicons:
+            if self.is_lexicon_loaded(lexicon_id):
+                manifest[lexicon_id] = self._describe_lexicon(lexicon_id)
+            else:
+                manifest[lexicon_id] = stored_manifest.get(lexicon_id, {})
+        return manifest
 
     def find_lexicon_by_id(self, identifier: str) -> Lexicon:
         """If identifier exists then a Lexicon is returned, otherwise None"""
+        if identifier in self._lexicons and self._lexicons[identifier] is None:
+            self._load_lexicon(identifier)
         return self._lexicons.get(identifier)
 
     def find_changehistory_by_id(self, identifier: str) -> LexiconChangeHistory:
         """If identifier exists then a LexiconChangeHistory is returned, otherwise None"""
+        if identifier in self._changehistories and self._changehistories[identifier] is None:
+            self._load_lexicon(identifier)
         return self._changehistories.get(identifier)
 
+    @metrics.timed("project.store")
     def store(self) -> None:
-        """Store Project Files and then Included Lexicon and Change History Files (separately)"""
+        """Store Project Files and then Included Lexicon and Change History Files (separately)
+
+        Lexicons that have not been loaded are unchanged and are not rewritten."""
         # Store Project Settings file "Proj-<ProjID>"
+        self._settings.set_option_to("LexiconManifest", self.lexicon_manifest())
         self._settings.export_config(f"data/PROJ-{self._settings.find_by_id('Filename')}")
         # Store Project Lexicon files "Lex-<LexID>"
         lexicon: Lexicon
         for (lex_id, lexicon) in self._lexicons.items():
-            lexicon.store_to(lex_id)
+            if lexicon is not None:
+                lexicon.store_to(lex_id)
         # Store Project Lexicon Change History files "CHI-<LexID>"
         changehistory: LexiconChangeHistory
         for (lex_id, changehistory) in self._changehistories.items():
-            changehistory.store_to(lex_id)
+            if changehistory is not None:
+                changehistory.store_to(lex_id)
+        self._stored_revisions.update(self._loaded_revisions())
+
+    def _loaded_revisions(self) -> dict[str, int]:
+        return {
+            lex_id: lexicon.revision
+            for (lex_id, lexicon) in self._lexicons.items()
+            if lexicon is not None}
+
+    def has_unsaved_changes(self) -> bool:
+        """True if any loaded Lexicon has been modified since it was last loaded or stored"""
+        return any(
+            self._stored_revisions.get(lex_id) != revision
+            for (lex_id, revision) in self._loaded_revisions().items())
+
+    def snapshot(self) -> ProjectSnapshot:
+        """Copies the settings and every Lexicon modified since it was last loaded or stored
+
+        The snapshot can be stored from another thread; pass it to record_stored afterwards."""
+        self._settings.set_option_to("LexiconManifest", self.lexicon_manifest())
+        revisions = {
+            lex_id: revision
+            for (lex_id, revision) in self._loaded_revisions().items()
+            if self._stored_revisions.get(lex_id) != revision}
+        return ProjectSnapshot(
+            settings=self._settings.snapshot(),
+            lexicon_data={x: self._lexicons[x].export_snapshot() for x in revisions},
+            changehistory_data={x: self._changehistories[x].export_snapshot() for x in revisions},
+            revisions=revisions)
+
+    def record_stored(self, snapshot: ProjectSnapshot) -> None:
+        """Notes that the Lexicons in snapshot were stored at the revisions it was taken at"""
+        for (lex_id, revision) in snapshot.revisions.items():
+            self._stored_revisions[lex_id] = max(revision, self._stored_revisions.get(lex_id, -1))
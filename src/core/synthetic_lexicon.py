@@ -0,0 +1,217 @@
+"""Generator of large synthetic Lexicons of valid Words for load and scaling tests"""
+import random
+from collections.abc import Iterator
+from typing import Union
+from configuration.settings import Settings
+from core.change_history import LexiconChangeHistory
+from core.lexicon import Lexicon
+from core.word import Word
+
+_CONSONANTS = list("bcdfghjklmnpqrstvwxyz") + ["th", "sh", "ch"]
+_VOWELS = list("aeiou")
+_ROOT_SYMBOLS = ["A", "B", "C", "D"]
+# Symbol mapping, selection and selected pattern registered in the base Wordflow, by parent groups
+_COMBINED_PATTERNS = {
+    1: ("A + B", "A B", "A + B"),
+    3: ("A B C + D", "A C D", "A C + D")}
+
+
+class _PlannedWord:
+    """Shape of one synthetic Word, held until its record is generated"""
+    __slots__ = ("translated_word", "uid", "groups", "parents", "version_history")
+
+    def __init__(self, translated_word: str, uid: str, groups: list[str], parents: list[int]):
+        self.translated_word = translated_word
+        self.uid = uid
+        self.groups = groups
+        self.parents = parents
+        self.version_history: list[str] = []
+
+    @property
+    def in_language_word(self) -> str:
+        """The in language word the base Wordflow expects from the groups of the Word"""
+        if not self.parents:
+            return "".join(self.groups)
+        if len(self.groups) == 4:
+            return self.groups[0] + self.groups[2] + self.groups[3]
+        return self.groups[0] + self.groups[1]
+
+
+class SyntheticLexiconGenerator:  # pylint: disable=too-many-instance-attributes
+    """Generates Lexicons of Words that pass the base Wordflow, with matching change histories
+
+    Words are laid out in depth generations. Every Word after the roots combines two Words of
+    the previous generation, so that each parent has about fan_out children. Each Word
+    originates changes_per_word changes, which are recorded against its descendants up to
+    ripple_depth generations below it. About resolved_fraction of the recorded changes are
+    resolved. The same seed always generates the same Lexicon."""
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            word_count: int,
+            *,
+            depth: int = 4,
+            fan_out: float = 4,
+            changes_per_word: int = 0,
+            ripple_depth: int = 1,
+            resolved_fraction: float = 0.0,
+            seed: int = 0) -> None:
+        self.word_count = word_count
+        self.depth = depth
+        self.fan_out = fan_out
+        self.changes_per_word = changes_per_word
+        self.ripple_depth = ripple_depth
+        self.resolved_fraction = resolved_fraction
+        self.seed = seed
+        self._planned_words: Union[list[_PlannedWord], None] = None
+        self._change_data: list[dict] = []
+
+    def _generation_sizes(self) -> list[int]:
+        weights = [(self.fan_out / 2) ** x for x in range(self.depth)]
+        sizes = []
+        for weight in weights:
+            size = min(
+                max(1, round(self.word_count * weight / sum(weights))),
+                self.word_count - sum(sizes))
+            if size > 0:
+                sizes.append(size)
+        if sizes:
+            sizes[-1] += self.word_count - sum(sizes)
+        return sizes
+
+    def _plan_words(self, rng: random.Random) -> list[_PlannedWord]:
+        """Names, groups and parents of every Word, in generation order"""
+        planned_words = []
+        previous_generation: list[int] = []
+        for generation_size in self._generation_sizes():
+            generation = []
+            for _ in range(generation_size):
+                index = len(planned_words)
+                uid = f"{rng.getrandbits(128):032x}"
+                if previous_generation:
+                    parents = rng.sample(previous_generation, min(2, len(previous_generation)))
+                    if len(parents) < 2:
+                        parents.append(rng.randrange(index))
+                    first_groups = planned_words[parents[0]].groups
+                    groups = first_groups[:3] if len(first_groups) >= 3 else first_groups[:1]
+                    groups = groups + planned_words[parents[1]].groups[:1]
+                else:
+                    parents = []
+                    groups = [
+                        rng.choice(_CONSONANTS) + rng.choice(_VOWELS)
+                        for _ in range(rng.randint(1, len(_ROOT_SYMBOLS)))]
+                planned_words.append(_PlannedWord(f"word{index}", uid, groups, parents))
+                generation.append(index)
+            previous_generation = generation
+        return planned_words
+
+    def _record_change(self, change_id: str, origin: int, children: list[list[int]]) -> None:
+        """Adds change_id to the history of origin and of its descendants down to ripple_depth"""
+        reached = set()
+        generation = [origin]
+        for _ in range(self.ripple_depth + 1):
+            next_generation = []
+            for index in generation:
+                if index not in reached:
+                    reached.add(index)
+                    self._planned_words[index].version_history.append(change_id)
+                    next_generation.extend(children[index])
+            generation = next_generation
+
+    def _plan_changes(self, rng: random.Random) -> list[dict]:
+        children = [[] for _ in self._planned_words]
+        for (index, planned_word) in enumerate(self._planned_words):
+            for parent in set(planned_word.parents):
+                children[parent].append(index)
+        change_data = []
+        for (index, planned_word) in enumerate(self._planned_words):
+            for change_number in range(self.changes_per_word):
+                change_id = f"{rng.getrandbits(128):032x}"
+                change_data.append({
+                    "UId": change_id,
+                    "Field": "in_language_word",
+                    "Word": planned_word.translated_word,
+                    "From": str(change_number),
+                    "To": str(change_number + 1),
+                    "CreationTimeUTC": 1_600_000_000 + len(change_data),
+                    "Originator": planned_word.uid})
+                self._record_change(change_id, index, children)
+        return change_data
+
+    def _plan(self) -> list[_PlannedWord]:
+        if self._planned_words is None:
+            rng = random.Random(self.seed)
+            self._planned_words = self._plan_words(rng)
+            self._change_data = self._plan_changes(rng)
+        return self._planned_words
+
+    def _record_for(self, planned_word: _PlannedWord, rng: random.Random) -> dict:
+        groups = planned_word.groups
+        if planned_word.parents:
+            parents = [self._planned_words[x] for x in planned_word.parents]
+            (mapping, selection, pattern) = _COMBINED_PATTERNS[len(groups) - 1]
+            record = {
+                "translated_word_components": [x.translated_word for x in parents],
+                "in_language_components": [x.in_language_word for x in parents],
+                "etymological_symbology": f"|{'|'.join(groups[:-1])}| + |{groups[-1]}|",
+                "symbol_mapping": mapping,
+                "symbol_selection": selection,
+                "symbol_pattern_selected": pattern}
+        else:
+            symbols = " ".join(_ROOT_SYMBOLS[:len(groups)])
+            record = {
+                "etymological_symbology": f"|{'|'.join(groups)}|",
+                "symbol_mapping": symbols,
+                "symbol_selection": symbols}
+        record.update({
+            "translated_word": planned_word.translated_word,
+            "compiled_symbology": f"|{'|'.join(groups)}|",
+            "in_language_word": planned_word.in_language_word,
+            "version_history": list(planned_word.version_history),
+            "resolved_history_items": [
+                x for x in planned_word.version_history if rng.random() < self.resolved_fraction],
+            "uid": planned_word.uid})
+        return Word(record).data_for_export()
+
+    def word_data(self) -> Iterator[dict]:
+        """Export data of each Word in turn, each built only as it is reached"""
+        rng = random.Random(f"{self.seed}-resolved")
+        for planned_word in self._plan():
+            yield self._record_for(planned_word, rng)
+
+    def change_data(self) -> list[dict]:
+        """Export data of every change originated by the generated Words"""
+        self._plan()
+        return self._change_data
+
+    def build_lexicon(self) -> Lexicon:
+        """A Lexicon holding the generated Words and change history"""
+        changehistory = LexiconChangeHistory()
+        changehistory.populate_from(self.change_data())
+        lexicon = Lexicon()
+        lexicon.populate_from(list(self.word_data()), changehistory)
+        return lexicon
+
+    def write_project(self, name: str, filename: str) -> str:
+        """Writes PROJ-, LEX- and CHI- files for a Project holding the generated Lexicon
+
+        Records are serialised from the generated data without building a Word for each,
+        though the whole file is serialised before it is written. Returns the location of the
+        PROJ- file."""
+        planned_words = self._plan()
+        lexicon_id = f"{filename}Lexicon"
+        Lexicon.store_snapshot_to(lexicon_id, {
+            "Records": self.word_data(),
+            "Keys": [x.translated_word for x in planned_words],
+            "Columns": {
+                "Parents": [
+                    [planned_words[y].translated_word for y in x.parents] for x in planned_words],
+                "UIds": [x.uid for x in planned_words]}})
+        LexiconChangeHistory.store_snapshot_to(lexicon_id, self.change_data())
+        Settings({
+            "Name": name,
+            "Filename": filename,
+            "RegisteredLexicons": [lexicon_id],
+            "LexiconManifest": {lexicon_id: {
+                "WordCount": len(planned_words),
+                "ChangeCount": len(self._change_data)}}}).export_config(f"data/PROJ-{filename}")
+        return f"data/PROJ-{filename}.data"
@@ -7,6 +7,8 @@ from core.core import WordField, new_garbage_string
 from core.change_history_item import ChangeHistoryItem
 from core.change_history import LexiconChangeHistory
 
+logger = logging.getLogger('etym_logger')
+
 
 class Word:
     """Smallest element of a Lexicon. A single translated word."""
@@ -92,29 +94,37 @@ class Word:
 
     def identify_unresolved_modifications(self, changehistory: LexiconChangeHistory) -> None:
         """Maps internally resolved changes onto all changes to the Lexicon"""
-        logger = logging.getLogger('etym_logger')
+        is_debugging = logger.isEnabledFor(logging.DEBUG)
         self._unresolved_changes_to_self = []
         self._unresolved_changes_to_ancestor = []
-        logger.debug("START Determining Changes for : %s", self._data["translated_word"])
+        if is_debugging:
+            logger.debug("START Determining Changes for : %s", self._data["translated_word"])
         for change_id in self._data["version_history"]:
-            if self._data["resolved_history_items"].count(change_id) > 0:
-                logger.debug("%s already resolved.", change_id)
+            is_resolved = self._data["resolved_history_items"].count(change_id) > 0
+            changehistory.index_affected_word(change_id, self._data["uid"], is_resolved)
+            if is_resolved:
+                if is_debugging:
+                    logger.debug("%s already resolved.", change_id)
             else:
                 change_item = changehistory.find_item_with_id(change_id)
                 if change_item is None:
-                    logger.debug("Change item with id %s is not found.", change_id)
+                    if is_debugging:
+                        logger.debug("Change item with id %s is not found.", change_id)
                 else:
                     if change_item.originator == self._data["uid"]:
                         self._unresolved_changes_to_self.append(change_id)
-                        logger.debug(
-                            "Item with id %s is an unresolved changed to %s.",
-                            change_id, self._data["translated_word"])
+                        if is_debugging:
+                            logger.debug(
+                                "Item with id %s is an unresolved changed to %s.",
+                                change_id, self._data["translated_word"])
                     else:
                         self._unresolved_changes_to_ancestor.append(change_id)
-                        logger.debug(
-                            "Item with id %s is an unresolved ancestral change to %s.",
-                            change_id, self._data["translated_word"])
-        logger.debug("END Determining Changes for : %s", self._data["translated_word"])
+                        if is_debugging:
+                            logger.debug(
+                                "Item with id %s is an unresolved ancestral change to %s.",
+                                change_id, self._data["translated_word"])
+        if is_debugging:
+            logger.debug("END Determining Changes for : %s", self._data["translated_word"])
 
     def acknowledge_ancestor_modification_status_of(self, ancestor_status: bool) -> None:
         """Acts on supplied status of ancestor nodes."""
@@ -157,9 +167,12 @@ class Word:
             new_value: Any) -> ChangeHistoryItem:
         if not self._data["version_history"]:
             self._data["version_history"] = []
-        word_for_entry = self.find_data_on(WordField.TRANSLATEDWORD)
-        log_entry = f"{field_name} ON {word_for_entry} FROM {old_value} TO {new_value}"
-        change_history_item = ChangeHistoryItem(log_entry, self._data["uid"])
+        change_history_item = ChangeHistoryItem.for_field_change(
+            field_name,
+            self.find_data_on(WordField.TRANSLATEDWORD),
+            old_value,
+            new_value,
+            self._data["uid"])
         self._data["version_history"].append(change_history_item.uid)
         return change_history_item
 
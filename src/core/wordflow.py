@@ -2,6 +2,7 @@
 import uuid
 import re
 from core.core import WordField, split_string_into_groups
+from core.metrics import metrics
 from core.word import Word
 
 
@@ -26,6 +27,7 @@ class Wordflow:
         self._results.append(
             (stage_description + " " + result_text[stage_result], stage_field, stage_result))
 
+    @metrics.timed("wordflow.run_stages")
     def run_stages(self, word: Word) -> list:
         """Calculates validity of word with regards to predefined conditions."""
         # TRANSLATEDWORD
@@ -391,3 +393,15 @@ class Wordflow:
                 stage_description="In Language Word - Combined Selection To In Language Word Match",
                 stage_result=symbolic_and_in_language_words_match,
                 stage_field=WordField.INLANGUAGEWORD)
+
+
+def summarise_word_data(word_data: dict) -> dict:
+    """Runs a Wordflow over a Word built from word_data and summarises the results
+
+    Takes plain data rather than a Word so it can run on worker threads or processes."""
+    wordflow = Wordflow()
+    wordflow.run_stages(word=Word(word_data))
+    return {
+        "Checks": wordflow.count_checks(),
+        "Failed": wordflow.count_failed_stages(),
+        "FailedStages": wordflow.list_failed_stages()}
@@ -1,8 +1,10 @@
 """A project to allow the tracking, mapping, and modification of vocabulary."""
 
+import argparse
 import logging
 import sys
 from PyQt5.QtWidgets import (QApplication)
+from configuration.logging_setup import configure_logging
 from configuration.settings import Settings
 from ui.splash import SplashWindow
 from ui.project_ui import ProjectWindow
@@ -16,25 +18,32 @@ BASE_CONFIG = {
     "DefaultUserConfig": "UserConfig",
     "ProjectFilePrefix": "PROJ-",
     "LexiconFilePrefix": "LEX-",
+    "ProjectIndexFile": "ProjectIndex.json",
+    "LogFile": "app.log",
+    "LogLevel": "INFO",
+    "LogAsynchronously": True,
+    "ProfileDirectory": None,
+    "ProfileMemory": True,
     "SplashWindow": None,
     "MainWindow": None}
 
 if __name__ == '__main__':
 
-    logger = logging.getLogger('etym_logger')
-    logger.setLevel(logging.DEBUG)
-    f_handler = logging.FileHandler('app.log', 'w')
-    f_format = logging.Formatter(
-        '%(asctime)s - %(levelname)s: Location [%(module)s -> %(funcName)s] - %(message)s')
-    f_handler.setFormatter(f_format)
-    logger.addHandler(f_handler)
+    parser = argparse.ArgumentParser(description="Track, map and modify vocabulary.")
+    parser.add_argument(
+        "--profile", metavar="DIRECTORY",
+        help="profile each user action, writing the profiles and a summary to DIRECTORY")
+    (arguments, qt_arguments) = parser.parse_known_args()
 
     configuration = Settings(BASE_CONFIG)
     configuration.import_config(BASE_CONFIG["DefaultUserConfig"])
+    if arguments.profile is not None:
+        configuration.set_option_to("ProfileDirectory", arguments.profile)
+    log_listener = configure_logging(configuration)
 
-    logger.debug("Application Start")
+    logging.getLogger('etym_logger').debug("Application Start")
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_arguments)
     splashwindow = SplashWindow(configuration)
     mainwindow = ProjectWindow(configuration)
     configuration.integrate_config({
@@ -42,4 +51,7 @@ if __name__ == '__main__':
         "MainWindow": mainwindow})
     splashwindow.show()
 
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if log_listener is not None:
+        log_listener.stop()
+    sys.exit(exit_code)
@@ -24,10 +24,14 @@ class LexiconChangeHistoryIOService:
             output_data.append(self._io_service.serialise_obj_to_string(item_dict) + "\n")
         self._io_service.store(self._modify_filename_for_changehistory_type(filename), output_data)
 
+    def read_from(self, filename: str) -> str:
+        """Read raw serialised data from storage using I/O service"""
+        return self._io_service.read(self._modify_filename_for_changehistory_type(filename))
+
     def load_from(self, filename: str):
         """Read data from storage using I/O service and clean"""
         input_data = []
-        input_string = self._io_service.read(self._modify_filename_for_changehistory_type(filename))
+        input_string = self.read_from(filename)
         input_strings = input_string.split(sep="\n")
         for serialised_string in input_strings:
             if serialised_string:
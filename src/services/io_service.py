@@ -1,5 +1,8 @@
 """Low level IO operations involving (de)serialisation and file read/write"""
 import json
+import mmap
+import os
+from typing import Sequence, Union
 from core.core import (
     DataFormat,
     SerialiserInterface,
@@ -64,6 +67,66 @@ class JSONDeserialiser(DeserialiserInterface):
         return {}
 
 
+def deserialise_records(input_string: str, data_format: DataFormat) -> list:
+    """Deserialise newline separated records, skipping blank lines and offset index headers.
+
+    Module level so that it can be dispatched to a process pool."""
+    deserialiser = Deserialiser(data_format)
+    input_data = []
+    for serialised_string in input_string.split(sep="\n"):
+        if serialised_string:
+            deserialised_data = deserialiser.deserialise(serialised_string)
+            if "RecordIndex" in deserialised_data:
+                continue
+            input_data.append(deserialised_data)
+    return input_data
+
+
+class MappedRecords:
+    """Read-only memory mapped view of an indexed file, deserialising records on request"""
+    def __init__(
+            self,
+            mapped_file: mmap.mmap,
+            data_start: int,
+            record_index: dict,
+            deserialiser: Deserialiser) -> None:
+        self._mapped_file = mapped_file
+        self._data_start = data_start
+        self._keys = record_index["Keys"]
+        self._offsets = record_index["Offsets"]
+        self._columns = record_index.get("Columns", {})
+        self._deserialiser = deserialiser
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def keys(self) -> Sequence[str]:
+        """The key stored in the index for each record, in file order"""
+        return self._keys
+
+    def column(self, column_name: str) -> Union[Sequence, None]:
+        """Per-record values stored in the index under column_name, or None if not stored"""
+        return self._columns.get(column_name)
+
+    def raw_record_at(self, position: int) -> str:
+        """Returns the serialised string for the record at position"""
+        start = self._data_start + self._offsets[position]
+        if position + 1 < len(self._offsets):
+            end = self._data_start + self._offsets[position + 1]
+        else:
+            end = len(self._mapped_file)
+        return self._mapped_file[start:end].decode('UTF-8').rstrip("\n")
+
+    def record_at(self, position: int):
+        """Returns the deserialised object for the record at position"""
+        return self._deserialiser.deserialise(self.raw_record_at(position))
+
+    def close(self) -> None:
+        """Releases the memory map"""
+        self._mapped_file.close()
+
+
 class IOService:
     """Carries out low level data IO operations"""
     def __init__(
@@ -100,6 +163,48 @@ class IOService:
             else:
                 file_ref.write(data)
 
+    def store_indexed(
+            self,
+            filename: str,
+            data: Sequence[str],
+            keys: Sequence[str],
+            columns: dict = None):
+        """Stores newline terminated records in a UTF-8 file headed by an offset index.
+
+        The file is written under a temporary name and then replaces filename, so that a
+        memory map of the file it replaces stays readable.
+        columns: optional per-record values, keyed by column name, held in the index"""
+        encoded_records = [record.encode('UTF-8') for record in data]
+        offsets = []
+        position = 0
+        for encoded_record in encoded_records:
+            offsets.append(position)
+            position += len(encoded_record)
+        record_index = {"Keys": list(keys), "Offsets": offsets}
+        if columns:
+            record_index["Columns"] = columns
+        header = self.serialise_obj_to_string({"RecordIndex": record_index}) + "\n"
+        with open(filename + ".tmp", "wb") as file_ref:
+            file_ref.write(header.encode('UTF-8'))
+            file_ref.writelines(encoded_records)
+        os.replace(filename + ".tmp", filename)
+
+    def map_indexed(self, filename: str) -> Union[MappedRecords, None]:
+        """Memory maps a file written by store_indexed. Returns None if the file has no index."""
+        with open(filename, "rb") as file_ref:
+            header_line = file_ref.readline()
+            if not header_line:
+                return None
+            header = self.deserialise_string_to_obj(header_line.decode('UTF-8'))
+            if not isinstance(header, dict) or "RecordIndex" not in header:
+                return None
+            mapped_file = mmap.mmap(file_ref.fileno(), 0, access=mmap.ACCESS_READ)
+        return MappedRecords(
+            mapped_file,
+            len(header_line),
+            header["RecordIndex"],
+            self._deserialiser or Deserialiser(self._data_format))
+
     def serialise_obj_to_string(self, obj: object):
         """Converts an input object into a serialised string in the specified data_format"""
         if self._serialiser:
@@ -1,7 +1,7 @@
 """Standard IO API to use low level IOService"""
-from typing import Sequence
+from typing import Sequence, Union
 from core.core import DataFormat
-from .io_service import IOService
+from .io_service import IOService, MappedRecords
 
 
 class IOServiceAPI:
@@ -22,20 +22,47 @@ class IOServiceAPI:
     def _modify_filename_for_structure_type(self, filename: str):
         return f"data/{self._file_prefix}-" + filename
 
-    def store_to(self, filename: str, item_data: Sequence[dict]):
-        """Serialise item_data and pass to I/O service for storage"""
+    def store_to(
+            self,
+            filename: str,
+            item_data: Sequence[Union[dict, str]],
+            keys: Sequence[str] = None,
+            columns: dict = None):
+        """Serialise item_data and pass to I/O service for storage
+
+        Items that are already serialised strings are stored as they are.
+
+        keys: if supplied, the file is headed by an offset index of items under these keys
+        columns: per-item values held in that index, keyed by column name
+        """
         output_data = []
-        for item_dict in item_data:
-            output_data.append(self._io_service.serialise_obj_to_string(item_dict) + "\n")
-        self._io_service.store(self._modify_filename_for_structure_type(filename), output_data)
+        for item in item_data:
+            if not isinstance(item, str):
+                item = self._io_service.serialise_obj_to_string(item)
+            output_data.append(item + "\n")
+        if keys is not None:
+            self._io_service.store_indexed(
+                self._modify_filename_for_structure_type(filename), output_data, keys, columns)
+        else:
+            self._io_service.store(self._modify_filename_for_structure_type(filename), output_data)
+
+    def map_from(self, filename: str) -> Union[MappedRecords, None]:
+        """Memory map indexed data from storage, or None if it was stored without an index"""
+        return self._io_service.map_indexed(self._modify_filename_for_structure_type(filename))
+
+    def read_from(self, filename: str) -> str:
+        """Read raw serialised data from storage using I/O service"""
+        return self._io_service.read(self._modify_filename_for_structure_type(filename))
 
     def load_from(self, filename: str):
         """Read data from storage using I/O service and clean"""
         input_data = []
-        input_string = self._io_service.read(self._modify_filename_for_structure_type(filename))
+        input_string = self.read_from(filename)
         input_strings = input_string.split(sep="\n")
         for serialised_string in input_strings:
             if serialised_string:
                 deserialised_data = self._io_service.deserialise_string_to_obj(serialised_string)
+                if "RecordIndex" in deserialised_data:
+                    continue
                 input_data.append(deserialised_data)
         return input_data
@@ -0,0 +1,10 @@
+"""Fixtures shared by the test modules"""
+import pytest
+
+
+@pytest.fixture(name="project_directory")
+def fixture_project_directory(tmp_path, monkeypatch):
+    """Stores Project files beneath a temporary working directory"""
+    (tmp_path / "data").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,53 @@
+"""Test properties and methods of the ActionProfiler of user actions"""
+import json
+import os
+import tracemalloc
+from ui.action_profiler import ActionProfiler
+
+
+class TestAnActionProfilerShould:
+    """Tests for profiling wrapped slots"""
+    def test_return_the_result_of_the_wrapped_slot(self, tmp_path):
+        """Behaviour Test"""
+        profiler = ActionProfiler(str(tmp_path), trace_memory=False)
+        assert profiler.wrap("Double", lambda x: x * 2)(4) == 8
+
+    def test_drop_signal_arguments_the_wrapped_slot_does_not_accept(self, tmp_path):
+        """Behaviour Test"""
+        profiler = ActionProfiler(str(tmp_path), trace_memory=False)
+        assert profiler.wrap("Constant", lambda: 1)(True) == 1
+        assert profiler.wrap("Double", lambda x: x * 2)(4, "Index") == 8
+        assert profiler.wrap("Count", lambda *args: len(args))(1, 2, 3) == 3
+
+    def test_write_a_profile_for_each_call(self, tmp_path):
+        """Behaviour Test"""
+        profiler = ActionProfiler(str(tmp_path), trace_memory=False)
+        slot = profiler.wrap("Action Name", lambda: None)
+        slot()
+        slot()
+        assert sorted(os.listdir(tmp_path)) == ["00001-Action_Name.prof", "00002-Action_Name.prof"]
+
+    def test_include_nested_actions_in_the_profile_of_the_outer_action(self, tmp_path):
+        """Behaviour Test"""
+        profiler = ActionProfiler(str(tmp_path), trace_memory=False)
+        inner = profiler.wrap("Inner", lambda: None)
+        profiler.wrap("Outer", inner)()
+        assert list(profiler.summary()) == ["Outer"]
+
+    def test_record_peak_memory_while_tracing(self, tmp_path):
+        """State Test"""
+        profiler = ActionProfiler(str(tmp_path))
+        profiler.wrap("Allocate", lambda: bytearray(1_000_000))()
+        profiler.close()
+        assert profiler.summary()["Allocate"]["PeakMemoryBytes"] >= 1_000_000
+        assert not tracemalloc.is_tracing()
+
+    def test_write_a_summary_report_on_close(self, tmp_path):
+        """Behaviour Test"""
+        profiler = ActionProfiler(str(tmp_path), trace_memory=False)
+        profiler.wrap("Action", lambda: None)()
+        profiler.close()
+        with open(tmp_path / "summary.json", 'r', encoding='UTF-8') as summary_file:
+            assert json.load(summary_file)["Action"]["Calls"] == 1
+        with open(tmp_path / "summary.txt", 'r', encoding='UTF-8') as summary_file:
+            assert "Action" in summary_file.read()
@@ -0,0 +1,93 @@
+"""Benchmarks of core hot paths over synthetic Lexicons; skipped if pytest-benchmark is missing"""
+import pytest
+from core.change_history import LexiconChangeHistory
+from core.change_history_item import ChangeHistoryItem
+from core.lexicon import Lexicon
+from core.synthetic_lexicon import SyntheticLexiconGenerator
+from core.word import Word
+from core.wordflow import Wordflow
+
+pytest.importorskip("pytest_benchmark")
+
+# Shape of the synthetic Lexicons benchmarked
+WORD_COUNT = 2000
+TREE_DEPTH = 4
+FAN_OUT = 5
+CHANGES_PER_WORD = 3
+
+
+def _synthetic_lexicon() -> Lexicon:
+    return SyntheticLexiconGenerator(WORD_COUNT, depth=TREE_DEPTH, fan_out=FAN_OUT).build_lexicon()
+
+
+class TestBenchmarkALexicon:
+    """Benchmarks of Lexicon operations"""
+    def test_add_entry(self, benchmark):
+        """Benchmark"""
+        def _add_entries(lexicon: Lexicon, words: list[Word]):
+            for word in words:
+                lexicon.add_entry(word)
+
+        def _setup():
+            return (Lexicon(), [Word({"translated_word": f"W{x}"}) for x in range(1000)]), {}
+        benchmark.pedantic(_add_entries, setup=_setup, rounds=5)
+
+    def test_set_field_to_value_ripple(self, benchmark):
+        """Benchmark"""
+        benchmark.pedantic(
+            lambda lexicon: lexicon.set_field_to_value("In Language Word", "word0", "Changed"),
+            setup=lambda: ((_synthetic_lexicon(),), {}),
+            rounds=10)
+
+    def test_get_descendants_of(self, benchmark):
+        """Benchmark"""
+        lexicon = _synthetic_lexicon()
+        descendants = benchmark(lexicon.get_descendants_of, lexicon.retrieve("word0"))
+        assert descendants
+
+    def test_store_to(self, benchmark, project_directory):  # pylint: disable=unused-argument
+        """Benchmark"""
+        lexicon = _synthetic_lexicon()
+        benchmark(lexicon.store_to, "BenchmarkLexicon")
+
+    def test_load_from(self, benchmark, project_directory):  # pylint: disable=unused-argument
+        """Benchmark"""
+        SyntheticLexiconGenerator(WORD_COUNT).write_project("Benchmark", "Benchmark")
+
+        def _load() -> Lexicon:
+            lexicon = Lexicon()
+            lexicon.load_from("BenchmarkLexicon")
+            return lexicon
+        assert benchmark(_load).count_entries() == WORD_COUNT
+
+
+class TestBenchmarkAChangeHistory:
+    """Benchmarks of LexiconChangeHistory operations"""
+    def test_add_item(self, benchmark):
+        """Benchmark"""
+        def _add_items(history: LexiconChangeHistory, items: list[ChangeHistoryItem]):
+            for item in items:
+                history.add_item(item)
+
+        def _setup():
+            return (LexiconChangeHistory(), [ChangeHistoryItem("", "") for _ in range(5000)]), {}
+        benchmark.pedantic(_add_items, setup=_setup, rounds=5)
+
+    def test_load_from(self, benchmark, project_directory):  # pylint: disable=unused-argument
+        """Benchmark"""
+        SyntheticLexiconGenerator(
+            WORD_COUNT, changes_per_word=CHANGES_PER_WORD).write_project("Benchmark", "Benchmark")
+
+        def _load() -> LexiconChangeHistory:
+            loaded_history = LexiconChangeHistory()
+            loaded_history.load_from("BenchmarkLexicon")
+            return loaded_history
+        assert len(benchmark(_load).get_all_items()) == WORD_COUNT * CHANGES_PER_WORD
+
+
+class TestBenchmarkAWordflow:
+    """Benchmarks of Word validation"""
+    def test_run_stages(self, benchmark):
+        """Benchmark"""
+        words = [Word(x) for x in SyntheticLexiconGenerator(100, depth=2).word_data()]
+        benchmark(lambda: [Wordflow().run_stages(x) for x in words])
@@ -41,6 +41,72 @@ class TestGivenANewChangeHistoryItem:
         assert new_item.description == "DescriptionB"
 
 
+class TestGivenAChangeHistoryItemForAFieldChange:
+    """Test changes to Word fields recorded as structured records"""
+    def test__the_description_is_rendered_from_the_record(self):
+        """Scalar values are recorded as the values changed from and to."""
+        new_item = ChangeHistoryItem.for_field_change("in_language_word", "Word", "a", "b", "Me")
+        assert new_item.description == "in_language_word ON Word FROM a TO b"
+        assert "DescriptionOfChange" not in new_item.data_for_export()
+
+    def test__list_values_are_recorded_as_the_items_added_and_removed(self):
+        """Only the difference between long lists is stored."""
+        old_value = [f"Component{x}" for x in range(100)]
+        new_item = ChangeHistoryItem.for_field_change(
+            "translated_word_components", "Word", old_value, old_value[1:] + ["New"], "Me")
+        export_dto = new_item.data_for_export()
+        assert (export_dto["Added"], export_dto["Removed"]) == (["New"], ["Component0"])
+        assert new_item.description == (
+            "translated_word_components ON Word ADDED ['New'] REMOVED ['Component0']")
+
+    def test__reordered_list_values_are_recorded_in_full(self):
+        """A difference cannot describe a change of order."""
+        new_item = ChangeHistoryItem.for_field_change(
+            "translated_word_components", "Word", ["A", "B"], ["B", "A"], "Me")
+        assert new_item.description == (
+            "translated_word_components ON Word FROM ['A', 'B'] TO ['B', 'A']")
+
+    def test__the_record_survives_export_and_import(self):
+        """Structured records are restored from their export data."""
+        new_item = ChangeHistoryItem.for_field_change(
+            "translated_word_components", "Word", [], ["Parent"], "Me")
+        restored_item = ChangeHistoryItem("", "", item_data=new_item.data_for_export())
+        assert restored_item.data_for_export() == new_item.data_for_export()
+        assert restored_item.field == "translated_word_components"
+
+    def test__legacy_descriptions_are_migrated_to_records(self):
+        """Descriptions stored by earlier versions load as records that render identically."""
+        legacy_description = "translated_word_components ON Word FROM ['Old'] TO ['Old', 'New']"
+        restored_item = ChangeHistoryItem("", "", item_data={
+            "UId": "Legacy", "DescriptionOfChange": legacy_description, "Originator": "Me"})
+        assert restored_item.field == "translated_word_components"
+        assert restored_item.data_for_export()["Added"] == ["New"]
+
+    def test__legacy_descriptions_that_split_more_than_one_way_are_kept(self):
+        """Values containing a separator cannot be told apart from the separator."""
+        legacy_description = "in_language_word ON go FROM x TO a TO b"
+        restored_item = ChangeHistoryItem("", "", item_data={
+            "UId": "Legacy", "DescriptionOfChange": legacy_description, "Originator": "Me"})
+        assert restored_item.field is None
+        assert restored_item.data_for_export()["DescriptionOfChange"] == legacy_description
+
+    def test__legacy_none_values_are_migrated_to_none(self):
+        """A value that was None is rendered as None and restored as None."""
+        restored_item = ChangeHistoryItem("", "", item_data={
+            "UId": "Legacy",
+            "DescriptionOfChange": "in_language_word ON go FROM None TO went",
+            "Originator": "Me"})
+        assert restored_item.data_for_export()["From"] is None
+        assert restored_item.description == "in_language_word ON go FROM None TO went"
+
+    def test__free_text_descriptions_are_kept(self):
+        """Descriptions that are not field changes are stored as they are."""
+        restored_item = ChangeHistoryItem("", "", item_data={
+            "UId": "Legacy", "DescriptionOfChange": "Merged two words", "Originator": "Me"})
+        assert restored_item.field is None
+        assert restored_item.data_for_export()["DescriptionOfChange"] == "Merged two words"
+
+
 class TestALexiconChangeHistoryShould:
     """Test operations related to instantiation."""
     def test__instantiate_blank(self):
@@ -101,3 +167,61 @@ class TestGivenALexiconChangeHistoryWithOneItem:
         lch = LexiconChangeHistory()
         lch.add_item(new_item)
         assert lch.find_items_with_originator("Me") == [new_item.uid]
+
+    def test__when_words_index_an_item__then_affected_and_unresolved_word_uids_are_returned(self):
+        """Items are indexed by the Words they reached and whether each has resolved them."""
+        new_item = ChangeHistoryItem("A test item.", "Me")
+        lch = LexiconChangeHistory()
+        lch.add_item(new_item)
+        lch.index_affected_word(new_item.uid, "WordA", False)
+        lch.index_affected_word(new_item.uid, "WordB", False)
+        lch.index_affected_word(new_item.uid, "WordB", True)
+        assert lch.find_words_affected_by(new_item.uid) == {"WordA", "WordB"}
+        assert lch.find_words_unresolved_for(new_item.uid) == {"WordA"}
+
+
+class TestGivenALexiconChangeHistoryWithItemsOverTime:
+    """Test range queries over a LexiconChangeHistory ordered by creation time"""
+    @staticmethod
+    def _history() -> LexiconChangeHistory:
+        lch = LexiconChangeHistory()
+        for (created_utc, originator) in [(30, "Me"), (10, "You"), (20, "Me"), (40, "Me")]:
+            lch.add_item(ChangeHistoryItem("", "", item_data={
+                "UId": f"Item{created_utc}",
+                "CreationTimeUTC": created_utc,
+                "Originator": originator}))
+        return lch
+
+    def test__items_are_held_in_creation_order(self):
+        """Items added out of order are still listed oldest first."""
+        assert [x.uid for x in self._history().get_all_items()] == [
+            "Item10", "Item20", "Item30", "Item40"]
+
+    def test__when_adding_an_item_twice__then_it_is_registered_once(self):
+        """Items are registered once however often they are added."""
+        lch = self._history()
+        lch.add_item(lch.find_item_with_id("Item20"))
+        assert len(lch.get_all_items()) == 4
+
+    def test__when_finding_items_between_two_times__then_the_end_time_is_excluded(self):
+        """Ranges include their start and exclude their end."""
+        items = self._history().find_items_created_between(20, 40)
+        assert [x.uid for x in items] == ["Item20", "Item30"]
+
+    def test__when_finding_the_latest_items__then_the_newest_are_first(self):
+        """Latest items are listed newest first."""
+        assert [x.uid for x in self._history().find_latest_items(2)] == ["Item40", "Item30"]
+        assert not self._history().find_latest_items(0)
+
+    def test__when_finding_items_by_originator_in_a_range__then_only_theirs_are_returned(self):
+        """Originator postings are kept in creation order."""
+        lch = self._history()
+        items = lch.find_items_with_originator_created_between("Me", 0, 35)
+        assert [x.uid for x in items] == ["Item20", "Item30"]
+        assert lch.find_items_with_originator("Me") == ["Item20", "Item30", "Item40"]
+
+    def test__when_populating_from_data__then_range_queries_are_available(self):
+        """Loaded items are sorted and indexed once."""
+        lch = LexiconChangeHistory()
+        lch.populate_from(self._history().retrieve_export_data_for()[::-1])
+        assert [x.uid for x in lch.find_items_created_between(0, 25)] == ["Item10", "Item20"]
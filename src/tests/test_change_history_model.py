@@ -0,0 +1,81 @@
+"""Test properties and methods of the ChangeHistoryTableModel Qt model"""
+from PyQt5.QtCore import QModelIndex, Qt
+from core.change_history import LexiconChangeHistory
+from core.change_history_item import ChangeHistoryItem
+from core.word import Word
+from ui.change_history_model import ChangeHistoryTableModel, CHANGE_ROLE
+
+
+def _change_history(change_count: int) -> LexiconChangeHistory:
+    change_history = LexiconChangeHistory()
+    for number in range(change_count):
+        change_history.add_item(ChangeHistoryItem("", "", item_data={
+            "UId": f"Change{number}",
+            "DescriptionOfChange": f"Description{number}",
+            "Originator": "ChangedUid"}))
+    return change_history
+
+
+def _changed_word(change_count: int, resolved: list[str]) -> Word:
+    return Word({
+        "translated_word": "Changed",
+        "uid": "ChangedUid",
+        "version_history": [f"Change{x}" for x in range(change_count)],
+        "resolved_history_items": resolved})
+
+
+class TestGivenAChangeHistoryTableModel:
+    """Tests for a model presenting the history of a Word"""
+    def test_no_rows_are_fetched_until_requested(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        model.set_word(_changed_word(3, []), _change_history(3))
+        assert model.rowCount() == 0
+        assert model.canFetchMore(QModelIndex())
+
+    def test_rows_are_fetched_in_batches(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        model.fetch_batch_size = 2
+        model.set_word(_changed_word(3, []), _change_history(3))
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 2
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 3
+        assert not model.canFetchMore(QModelIndex())
+
+    def test_unresolved_changes_are_listed_first_in_history_order(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        model.set_word(_changed_word(3, ["Change0"]), _change_history(3))
+        model.fetchMore(QModelIndex())
+        rows = [(model.index(x, 0).data(), model.index(x, 1).data()) for x in range(3)]
+        assert rows == [
+            ("Description1", "False"), ("Description2", "False"), ("Description0", "True")]
+
+    def test_a_change_missing_from_the_history_is_shown_by_id(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        model.set_word(_changed_word(2, []), _change_history(1))
+        model.fetchMore(QModelIndex())
+        assert model.index(1, 0).data(Qt.DisplayRole) == "Change1"
+        assert model.index(1, 0).data(CHANGE_ROLE) is None
+        assert model.change_at(model.index(0, 1)).uid == "Change0"
+
+    def test_clearing_presents_no_rows(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        model.set_word(_changed_word(2, []), _change_history(2))
+        model.fetchMore(QModelIndex())
+        model.clear()
+        assert model.rowCount() == 0
+        assert not model.canFetchMore(QModelIndex())
+
+    def test_descriptions_name_the_originating_word_in_their_tooltip(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = ChangeHistoryTableModel()
+        word = _changed_word(1, [])
+        model.set_word(word, _change_history(1), {"ChangedUid": word}.get)
+        model.fetchMore(QModelIndex())
+        assert model.index(0, 0).data(Qt.ToolTipRole) == "Changed on Changed"
+        assert model.index(0, 1).data(Qt.ToolTipRole) is None
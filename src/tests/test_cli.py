@@ -0,0 +1,107 @@
+"""Test commands of the headless command line interface"""
+import json
+import os
+import subprocess
+import sys
+import pytest
+import cli
+from core.project import Project, ProjectBuilder
+
+PROJECT_FILE = "data/PROJ-TestCliProject.data"
+
+
+@pytest.fixture(name="stored_project", autouse=True)
+def fixture_stored_project(project_directory):
+    """Stores a Project with a parent and child Word beneath a temporary working directory"""
+    project = Project({"Name": "TestCliProject", "Filename": "TestCliProject"})
+    lexicon = project.list_lexicons()[0]
+    lexicon.populate_from([
+        {"translated_word": "Parent"},
+        {"translated_word": "Child", "translated_word_components": ["Parent"]}])
+    project.store()
+    return project_directory
+
+
+class TestGivenAStoredProject:
+    """Tests for commands run against a stored Project"""
+    def test_validation_lists_failed_words_and_reports_failure(self, capsys):
+        """Behaviour Test"""
+        assert cli.main(["--quiet", "validate", PROJECT_FILE]) == cli.EXIT_FAILED
+        failed_words = [x.split("\t")[1] for x in capsys.readouterr().out.splitlines()]
+        assert failed_words == ["Child"]
+
+    def test_validation_streams_progress_to_stderr(self, capsys):
+        """Behaviour Test"""
+        cli.main(["validate", PROJECT_FILE])
+        assert "2/2 words" in capsys.readouterr().err
+
+    def test_validation_on_several_processes_matches_a_single_process(self, capsys, monkeypatch):
+        """Behaviour Test"""
+        monkeypatch.setattr(cli, "VALIDATION_CHUNK_SIZE", 1)
+        cli.main(["--quiet", "validate", PROJECT_FILE])
+        single_output = capsys.readouterr().out
+        cli.main(["--quiet", "--jobs", "2", "validate", PROJECT_FILE])
+        assert capsys.readouterr().out == single_output
+
+    def test_export_writes_every_word(self):
+        """Behaviour Test"""
+        assert cli.main(["--quiet", "export", PROJECT_FILE, "export.json"]) == cli.EXIT_OK
+        with open("export.json", 'r', encoding='UTF-8') as export_file:
+            exported = json.load(export_file)
+        (lexicon_data,) = exported["Lexicons"].values()
+        assert [x["translated_word"] for x in lexicon_data["Words"]] == ["Parent", "Child"]
+
+    def test_metrics_option_writes_timings_of_the_command(self):
+        """Behaviour Test"""
+        cli.main(["--quiet", "--metrics", "metrics.json", "compact", PROJECT_FILE])
+        with open("metrics.json", 'r', encoding='UTF-8') as metrics_file:
+            timings = json.load(metrics_file)["Timings"]
+        assert timings["project.load_all_lexicons"]["Count"] == 1
+        assert timings["project.store"]["Count"] == 1
+
+    def test_compact_keeps_every_word(self):
+        """Behaviour Test"""
+        assert cli.main(["--quiet", "compact", PROJECT_FILE]) == cli.EXIT_OK
+        project = ProjectBuilder.project_from_file(PROJECT_FILE)
+        assert project.list_lexicons()[0].count_entries() == 2
+
+    def test_query_prints_the_children_of_a_word(self, capsys):
+        """Behaviour Test"""
+        assert cli.main(["query", PROJECT_FILE, "Parent", "--children"]) == cli.EXIT_OK
+        assert json.loads(capsys.readouterr().out) == ["Child"]
+
+    def test_query_prints_a_field_of_a_word(self, capsys):
+        """Behaviour Test"""
+        cli.main(["query", PROJECT_FILE, "Child", "--field", "Translated Word Components"])
+        assert json.loads(capsys.readouterr().out) == ["Parent"]
+
+    def test_query_for_a_missing_word_reports_failure(self):
+        """Behaviour Test"""
+        assert cli.main(["--quiet", "query", PROJECT_FILE, "Missing"]) == cli.EXIT_FAILED
+
+    def test_a_missing_project_file_reports_an_error(self, capsys):
+        """Behaviour Test"""
+        assert cli.main(["validate", "data/PROJ-Missing.data"]) == cli.EXIT_ERROR
+        assert "error" in capsys.readouterr().err
+
+
+class TestGivenTheInstalledPackage:
+    """Tests for running the command line interface as a module"""
+    def test_it_runs_as_a_module(self):
+        """Behaviour Test"""
+        repository_directory = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        completed = subprocess.run(
+            [sys.executable, "-m", "etym_tree_python", "--help"],
+            cwd=repository_directory, capture_output=True, text=True, check=False)
+        assert completed.returncode == 0
+        assert "validate" in completed.stdout
+
+
+class TestGivenASyntheticProject:
+    """Tests for projects written by the generate command"""
+    def test_generate_writes_a_project_that_validates(self, capsys):
+        """Behaviour Test"""
+        assert cli.main(["--quiet", "generate", "Generated", "--words", "30"]) == cli.EXIT_OK
+        project_file = capsys.readouterr().out.strip()
+        assert cli.main(["--quiet", "validate", project_file]) == cli.EXIT_OK
@@ -1,6 +1,12 @@
 """Test Core functionality available to all parts of the application"""
+import os
+import subprocess
+import sys
 from core.core import id_project_files_in
 
+# Generous budget for importing the headless layer, guarding against heavy imports creeping in
+HEADLESS_IMPORT_BUDGET_US = 1_000_000
+
 
 def _project_filename_validator(filename: str):
     return filename.startswith("PROJ-")
@@ -15,3 +21,71 @@ class TestGivenExtantProjectFiles:
     def test_extant_files_will_be_returned(self):
         """Placeholder: State Test"""
         assert id_project_files_in("data/", _project_filename_validator)
+
+
+class TestGivenACachedProjectFileIndex:
+    """Tests for scans that persist and reuse an index of directory listings"""
+    def test_the_index_is_written_on_first_scan(self, tmp_path):
+        """State Test"""
+        (tmp_path / "PROJ-Cached.data").write_text("{}", encoding="UTF-8")
+        index_location = str(tmp_path / "index.json")
+        id_project_files_in(str(tmp_path), _project_filename_validator, index_location)
+        assert os.path.exists(index_location)
+
+    def test_unchanged_directories_are_not_rescanned(self, tmp_path, mocker):
+        """Behaviour Test"""
+        (tmp_path / "PROJ-Cached.data").write_text("{}", encoding="UTF-8")
+        index_location = str(tmp_path.parent / f"{tmp_path.name}-index.json")
+        first_scan = id_project_files_in(
+            str(tmp_path), _project_filename_validator, index_location)
+        scandir_spy = mocker.spy(os, "scandir")
+        second_scan = id_project_files_in(
+            str(tmp_path), _project_filename_validator, index_location)
+        assert second_scan == first_scan
+        assert scandir_spy.call_count == 0
+
+    def test_changed_directories_are_rescanned(self, tmp_path):
+        """State Test"""
+        index_location = str(tmp_path.parent / f"{tmp_path.name}-index.json")
+        id_project_files_in(str(tmp_path), _project_filename_validator, index_location)
+        (tmp_path / "PROJ-Added.data").write_text("{}", encoding="UTF-8")
+        rescanned = id_project_files_in(
+            str(tmp_path), _project_filename_validator, index_location)
+        assert rescanned[str(tmp_path)][""] == ["PROJ-Added.data"]
+
+    def test_dangling_links_do_not_hide_project_files(self, tmp_path):
+        """State Test"""
+        (tmp_path / "PROJ-Linked.data").write_text("{}", encoding="UTF-8")
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+        found = id_project_files_in(str(tmp_path), _project_filename_validator)
+        assert found[str(tmp_path)][""] == ["PROJ-Linked.data"]
+
+
+def _import_times_of(statement: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of each module imported by statement"""
+    source_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=source_directory, capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+    return import_times
+
+
+class TestGivenTheHeadlessLayer:
+    """Tests for importing the core and service modules without a display"""
+    def test_qt_is_not_imported(self):
+        """State Test"""
+        import_times = _import_times_of(
+            "import core.lexicon, core.project, core.wordflow, services.io_service")
+        assert "core.lexicon" in import_times
+        assert not [x for x in import_times if x.startswith("PyQt5")]
+
+    def test_core_imports_within_budget(self):
+        """State Test"""
+        import_times = _import_times_of("import core.lexicon, core.project")
+        total_time = import_times["core.lexicon"] + import_times["core.project"]
+        assert total_time < HEADLESS_IMPORT_BUDGET_US
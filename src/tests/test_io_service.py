@@ -94,6 +94,26 @@ class TestGivenAnIOServiceInJSONFormat:
         deserialised_object = json_io_service.deserialise_stored(f"{testdatapath}/testdata")
         assert deserialised_object == {"A": "B", "C": 1}
 
+    def test_ios_map_00_indexed_records_are_read_individually(self, tmp_path):
+        """State Test"""
+        json_io_service = IOService(DataFormat.JSON)
+        json_io_service.store_indexed(
+            f"{tmp_path}/testindexed.data",
+            ['{"A": "B"}\n', '{"C": 1}\n'],
+            ["First", "Second"])
+        records = json_io_service.map_indexed(f"{tmp_path}/testindexed.data")
+        assert len(records) == 2
+        assert records.keys == ["First", "Second"]
+        assert records.record_at(1) == {"C": 1}
+        assert records.record_at(0) == {"A": "B"}
+        records.close()
+
+    def test_ios_map_01_a_file_without_an_index_is_not_mapped(self):
+        """State Test"""
+        testdatapath = _write_testdata_data_file()
+        json_io_service = IOService(DataFormat.JSON)
+        assert json_io_service.map_indexed(f"{testdatapath}/testdata.data") is None
+
     def test_the_service_will_write_a_string_to_a_file(self, mocker):
         """Behaviour Test: File write operations are carried out"""
         mock = mocker.patch("builtins.open")
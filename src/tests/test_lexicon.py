@@ -69,6 +69,15 @@ class TestAnEmptyLexiconShould:
             field_name="Translated Word",
             to_validate="abcde") is None
 
+    def test_importing_word_data_already_registered_keeps_a_single_word(self):
+        """State Test"""
+        new_lexicon = Lexicon()
+        new_lexicon.populate_from([{"translated_word": "Word1"}])
+        exported_data = new_lexicon.retrieve_export_data_for()
+        new_lexicon.populate_from(exported_data + [{"translated_word": "Word2"}])
+        assert new_lexicon.count_entries() == 2
+        assert new_lexicon.retrieve_by_uid(exported_data[0]["uid"]) is new_lexicon.retrieve("Word1")
+
 
 class TestModifyingWordFieldsShould:
     """Test operations for a Lexicon and the linked changes when changing field values"""
@@ -142,6 +151,20 @@ class TestRetrievingWordChildrenShould:
         assert new_lexicon.get_descendants_of(parent_word).count(child_word) == 1
 
 
+    def test_list_words_whose_parents_are_not_registered_as_roots(self):
+        """A Word is a root until a Word named by one of its components is registered"""
+        new_lexicon = Lexicon()
+        child_word = Word(merge_data={
+            "translated_word": "Child", "translated_word_components": ["Parent"]})
+        new_lexicon.add_entry(child_word)
+        assert new_lexicon.get_root_words() == [child_word]
+        parent_word = Word(merge_data={"translated_word": "Parent"})
+        new_lexicon.add_entry(parent_word)
+        assert new_lexicon.get_root_words() == [parent_word]
+        assert new_lexicon.get_children_of(parent_word) == [child_word]
+        new_lexicon.set_field_to_value("Translated Word", parent_word, "Renamed")
+        assert new_lexicon.get_root_words() == [child_word, parent_word]
+
 class TestAPopulatedLexiconShould:
     """Test operations on a lexicon with more than 1 word (1+ words)"""
     def test_when_all_words_are_requested_then_a_list_of_the_items_is_returned(self):
@@ -261,6 +284,95 @@ class TestAPopulatedLexiconShould:
             print(f"Words Unpacked  : {word.find_data_on(WordField.TRANSLATEDWORD)}")
         assert read_lexicon.get_all_words() == [storeable_word]
 
+    def test_words_are_not_materialised_when_read_from_local_storage(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        lexicon_to_store.add_entry(Word({"translated_word": "Stored"}))
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        assert read_lexicon._members == [None]  # pylint: disable=protected-access
+
+    def test_a_stored_word_is_materialised_on_retrieve(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        storeable_word = Word({"translated_word": "Stored"})
+        lexicon_to_store.add_entry(storeable_word)
+        lexicon_to_store.add_entry(Word({"translated_word": "Untouched"}))
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        assert read_lexicon.retrieve("Stored") == storeable_word
+        assert read_lexicon._members[1] is None  # pylint: disable=protected-access
+
+    def test_stored_words_are_materialised_in_order_on_iteration(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        parent_word = Word({"translated_word": "Parent"})
+        child_word = Word({"translated_word": "Child", "translated_word_components": ["Parent"]})
+        lexicon_to_store.add_entry(parent_word)
+        lexicon_to_store.add_entry(child_word)
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        assert list(read_lexicon) == [parent_word, child_word]
+        assert read_lexicon.get_children_of(read_lexicon.retrieve("Parent")) == [child_word]
+
+    def test_stored_root_words_are_found_without_materialising_their_children(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        parent_word = Word({"translated_word": "Parent"})
+        child_word = Word({"translated_word": "Child", "translated_word_components": ["Parent"]})
+        lexicon_to_store.add_entry(parent_word)
+        lexicon_to_store.add_entry(child_word)
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        assert read_lexicon.get_root_words() == [parent_word]
+        assert read_lexicon.count_children_of(parent_word) == 1
+        assert read_lexicon._members[1] is None  # pylint: disable=protected-access
+
+    def test_editing_a_stored_word_does_not_materialise_unrelated_words(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        lexicon_to_store.populate_from([{"translated_word": f"Word{x}"} for x in range(5)])
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        read_lexicon.set_field_to_value("In Language Word", "Word0", "NotAWord")
+        assert read_lexicon._members[1:] == [None] * 4  # pylint: disable=protected-access
+
+    def test_moving_a_stored_word_updates_its_relationships_in_place(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        lexicon_to_store.populate_from([
+            {"translated_word": "Parent"},
+            {"translated_word": "Child"},
+            {"translated_word": "Unrelated"}])
+        lexicon_to_store.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        parent_word = read_lexicon.retrieve("Parent")
+        read_lexicon.set_field_to_value("Translated Word Components", "Child", ["Parent"])
+        assert read_lexicon.get_children_of(parent_word) == [read_lexicon.retrieve("Child")]
+        assert read_lexicon.count_children_of(parent_word) == 1
+        read_lexicon.set_field_to_value("Translated Word", parent_word, "Renamed")
+        assert not read_lexicon.get_children_of(parent_word)
+        assert read_lexicon._members[2] is None  # pylint: disable=protected-access
+
+    def test_retrieving_a_stored_word_by_uid_materialises_only_that_word(self):
+        """State Test"""
+        lexicon_to_store = Lexicon()
+        lexicon_to_store.populate_from([{"translated_word": f"Word{x}"} for x in range(3)])
+        lexicon_to_store.store_to("TestLexicon")
+        uid = lexicon_to_store.retrieve("Word1").find_data_on(WordField.UID)
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        assert read_lexicon.retrieve_by_uid(uid).find_data_on(WordField.TRANSLATEDWORD) == "Word1"
+        assert read_lexicon.retrieve_by_uid("NotAUid") is None
+        assert read_lexicon._members[0] is None  # pylint: disable=protected-access
+        assert read_lexicon._members[2] is None  # pylint: disable=protected-access
+
     def test__change_etymological_symbology_for_word_with_valid_input(self):
         """An input of valid characters with valid structure will change the value of the field"""
         new_lexicon = Lexicon()
@@ -300,3 +412,144 @@ class TestResolvingChangesOnAWordShould:
         new_lexicon.resolve_change_for(false_change_item, new_word)
         new_lexicon.resolve_modification_flags()
         assert new_word.has_unresolved_modification
+
+
+def _family_lexicon_with_a_change_to(translated_word: str) -> Lexicon:
+    new_lexicon = Lexicon()
+    new_lexicon.populate_from([
+        {"translated_word": "Parent"},
+        {"translated_word": "Child", "translated_word_components": ["Parent"]},
+        {"translated_word": "Grandchild", "translated_word_components": ["Child"]}])
+    new_lexicon.set_field_to_value("In Language Word", translated_word, "NotAWord")
+    return new_lexicon
+
+
+class TestResolvingChangesInBulkShould:
+    """Test operations resolving many change history items in a single pass."""
+    def test__resolve_ancestor_changes_for_a_subtree_only(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        resolved_words = new_lexicon.resolve_ancestor_changes_for_subtree("Child")
+        assert resolved_words == [new_lexicon.retrieve("Child"), new_lexicon.retrieve("Grandchild")]
+        assert not new_lexicon.retrieve("Grandchild").has_modified_ancestor
+        assert new_lexicon.retrieve("Parent").has_unresolved_modification
+
+    def test__leave_changes_made_to_the_subtree_root_itself(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Child")
+        resolved_words = new_lexicon.resolve_ancestor_changes_for_subtree("Child")
+        assert resolved_words == [new_lexicon.retrieve("Grandchild")]
+        assert new_lexicon.retrieve("Child").has_unresolved_modification
+
+    def test__resolve_only_changes_created_before_a_time(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        created_utc = new_lexicon.changehistory.get_all_items()[0].created_utc
+        assert not new_lexicon.resolve_changes_older_than(created_utc)
+        assert len(new_lexicon.resolve_changes_older_than(created_utc + 1)) == 3
+        assert not new_lexicon.retrieve("Parent").has_unresolved_modification
+
+    def test__resolve_a_change_across_all_descendants(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        change_item = new_lexicon.changehistory.get_all_items()[0]
+        new_lexicon.resolve_changes_for_descendants([change_item], "Parent")
+        assert not any(
+            x.has_unresolved_modification or x.has_modified_ancestor for x in new_lexicon)
+
+    def test__index_the_words_a_change_ripples_to_until_they_resolve_it(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        change_item = new_lexicon.changehistory.get_all_items()[0]
+        uids = {x.find_data_on(WordField.UID) for x in new_lexicon}
+        assert new_lexicon.changehistory.find_words_affected_by(change_item.uid) == uids
+        new_lexicon.resolve_changes_for_descendants([change_item], "Child")
+        assert new_lexicon.uids_with_unresolved_change(change_item.uid) == {
+            new_lexicon.retrieve("Parent").find_data_on(WordField.UID)}
+
+    def test__map_unresolved_change_uids_back_to_words(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        change_item = new_lexicon.changehistory.get_all_items()[0]
+        assert new_lexicon.retrieve_by_uid(change_item.originator) is new_lexicon.retrieve("Parent")
+        assert new_lexicon.words_with_unresolved_change(change_item.uid) == list(new_lexicon)
+
+    def test__resolve_a_change_across_the_descendants_of_a_stored_word(self):
+        """Behaviour Test"""
+        stored_lexicon = _family_lexicon_with_a_change_to("Parent")
+        stored_lexicon.store_to("TestLexicon")
+        stored_lexicon.changehistory.store_to("TestLexicon")
+        read_lexicon = Lexicon()
+        read_lexicon.load_from("TestLexicon")
+        read_lexicon.changehistory.load_from("TestLexicon")
+        read_lexicon.resolve_modification_flags()
+        change_item = read_lexicon.changehistory.get_all_items()[0]
+        resolved_words = read_lexicon.resolve_changes_for_descendants([change_item], "Parent")
+        assert len(resolved_words) == 3
+
+    def test__notify_subscribers_once(self):
+        """Behaviour Test"""
+        new_lexicon = _family_lexicon_with_a_change_to("Parent")
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_lexicon.resolve_ancestor_changes_for_subtree("Parent")
+        assert len(changes) == 1
+        assert len(changes[0].words) == 2
+
+
+class TestASubscribedLexiconShould:
+    """Test notifications sent to subscribers when a Lexicon is modified."""
+    def test_report_the_word_and_field_that_changed(self):
+        """Behaviour Test"""
+        new_lexicon = Lexicon()
+        new_word = new_lexicon.create_entry()
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_lexicon.set_field_to_value("In Language Word", new_word, "NotAWord")
+        assert changes[0].words == [new_word]
+        assert changes[0].fields == {WordField.INLANGUAGEWORD}
+        assert not changes[0].is_structural
+
+    def test_report_the_descendants_flagged_by_a_change(self):
+        """Behaviour Test"""
+        new_lexicon = Lexicon()
+        new_lexicon.populate_from([
+            {"translated_word": "Parent"},
+            {"translated_word": "Child", "translated_word_components": ["Parent"]}])
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_lexicon.set_field_to_value("In Language Word", "Parent", "NotAWord")
+        assert changes[0].rippled == [new_lexicon.retrieve("Child")]
+
+    def test_report_added_words_as_structural(self):
+        """Behaviour Test"""
+        new_lexicon = Lexicon()
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_word = new_lexicon.create_entry()
+        assert changes[0].words == [new_word]
+        assert changes[0].is_structural
+
+    def test_stop_reporting_once_unsubscribed(self):
+        """Behaviour Test"""
+        new_lexicon = Lexicon()
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_lexicon.unsubscribe(changes.append)
+        new_lexicon.create_entry()
+        assert not changes
+
+    def test_report_several_resolved_changes_once(self):
+        """Behaviour Test"""
+        new_lexicon = Lexicon()
+        new_word = new_lexicon.create_entry()
+        new_lexicon.set_field_to_value("In Language Word", new_word, "NotAWord")
+        new_lexicon.set_field_to_value("Etymological Symbology", new_word, "|abu|da|")
+        change_items = [
+            new_lexicon.changehistory.find_item_with_id(x)
+            for x in new_word.find_data_on(WordField.VERSIONHISTORY)]
+        changes = []
+        new_lexicon.subscribe(changes.append)
+        new_lexicon.resolve_changes_for(change_items, new_word)
+        assert len(changes) == 1
+        assert not new_word.has_unresolved_modification
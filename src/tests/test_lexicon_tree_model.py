@@ -0,0 +1,181 @@
+"""Test properties and methods of the LexiconTreeModel Qt model"""
+from PyQt5.QtCore import QModelIndex, Qt
+from core.core import WordField
+from core.lexicon import Lexicon
+from core.word import Word
+from ui.lexicon_tree_model import LexiconTreeModel, WORD_ROLE
+
+
+def _text_builder(word: Word):
+    return word.find_data_on(WordField.TRANSLATEDWORD), ""
+
+
+def _colour_builder(_: Word):
+    return None, None
+
+
+def _populated_lexicon(word_count: int) -> Lexicon:
+    lexicon = Lexicon()
+    lexicon.populate_from([{"translated_word": f"Word{x}"} for x in range(word_count)])
+    return lexicon
+
+
+def _family_lexicon() -> Lexicon:
+    lexicon = Lexicon()
+    lexicon.populate_from([
+        {"translated_word": "Root", "translated_word_components": []},
+        {"translated_word": "Child", "translated_word_components": ["Root"]},
+        {"translated_word": "Grandchild", "translated_word_components": ["Child"]}])
+    return lexicon
+
+
+class TestGivenALexiconTreeModel:
+    """Tests for a model presenting a populated Lexicon"""
+    def test_no_rows_are_fetched_until_requested(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.set_lexicon(_populated_lexicon(3))
+        assert model.rowCount() == 0
+        assert model.canFetchMore(QModelIndex())
+
+    def test_rows_are_fetched_in_batches(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.fetch_batch_size = 2
+        model.set_lexicon(_populated_lexicon(3))
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 2
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 3
+        assert not model.canFetchMore(QModelIndex())
+
+    def test_display_text_and_word_are_provided_for_a_row(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = _populated_lexicon(1)
+        model.set_lexicon(lexicon)
+        model.fetchMore(QModelIndex())
+        assert model.index(0, 0).data(Qt.DisplayRole) == "Word0"
+        assert model.index(0, 0).data(WORD_ROLE) is lexicon.retrieve("Word0")
+
+    def test_refreshing_a_word_signals_only_its_row(self, qapp):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = _populated_lexicon(3)
+        model.set_lexicon(lexicon)
+        model.fetchMore(QModelIndex())
+        changed_rows = []
+        model.dataChanged.connect(
+            lambda first, last: changed_rows.append((first.row(), last.row())))
+        model.refresh_words([lexicon.retrieve("Word1")])
+        assert changed_rows == [(1, 1)]
+
+
+class TestGivenALexiconTreeModelOfRelatedWords:
+    """Tests for a model presenting a Lexicon with parent and child Words"""
+    def test_only_root_words_are_top_level_rows(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.set_lexicon(_family_lexicon())
+        model.fetchMore(QModelIndex())
+        assert model.rowCount() == 1
+        assert model.index(0, 0).data(Qt.DisplayRole) == "Root"
+
+    def test_children_are_fetched_when_their_parent_is_expanded(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.set_lexicon(_family_lexicon())
+        model.fetchMore(QModelIndex())
+        root_index = model.index(0, 0)
+        assert model.hasChildren(root_index)
+        assert model.rowCount(root_index) == 0
+        model.fetchMore(root_index)
+        child_index = model.index(0, 0, root_index)
+        assert child_index.data(Qt.DisplayRole) == "Child"
+        assert model.parent(child_index) == root_index
+
+    def test_revealing_a_word_fetches_the_rows_leading_to_it(self, qapp):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = _family_lexicon()
+        model.set_lexicon(lexicon)
+        found_index = model.reveal_word(lexicon.retrieve("Grandchild"))
+        assert found_index.data(WORD_ROLE) is lexicon.retrieve("Grandchild")
+        assert model.parent(model.parent(found_index)).data(Qt.DisplayRole) == "Root"
+
+    def test_words_whose_components_name_no_word_are_top_level_rows(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = Lexicon()
+        lexicon.populate_from([
+            {"translated_word": "Orphan", "translated_word_components": ["Gone"]}])
+        model.set_lexicon(lexicon)
+        assert model.index_of_word(lexicon.retrieve("Orphan")).isValid()
+
+    def test_children_of_a_renamed_parent_are_still_reachable(self, qapp):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = _family_lexicon()
+        model.set_lexicon(lexicon)
+        model.reveal_word(lexicon.retrieve("Grandchild"))
+        lexicon.set_field_to_value("Translated Word", "Root", "Renamed")
+        model.reload()
+        child_index = model.index_of_word(lexicon.retrieve("Child"))
+        assert child_index.isValid()
+        assert not model.parent(child_index).isValid()
+        assert model.index_of_word(lexicon.retrieve("Grandchild")).isValid()
+        lexicon.set_field_to_value("Translated Word", "Renamed", "Root")
+        model.reload()
+        assert model.parent(model.index_of_word(lexicon.retrieve("Child"))).data() == "Root"
+
+    def test_the_index_of_a_word_is_exact_for_words_sharing_a_prefix(self, qapp):  # pylint: disable=unused-argument
+        """State Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        lexicon = Lexicon()
+        lexicon.populate_from([{"translated_word": x} for x in ["abc", "ab", "a"]])
+        model.set_lexicon(lexicon)
+        found_index = model.index_of_word(lexicon.retrieve("ab"))
+        assert found_index.data(WORD_ROLE) is lexicon.retrieve("ab")
+        assert found_index.row() == 1
+
+    def test_the_index_of_a_fetched_word_does_not_fetch_further_rows(self, qapp):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.fetch_batch_size = 1
+        lexicon = _populated_lexicon(3)
+        model.set_lexicon(lexicon)
+        model.fetchMore(QModelIndex())
+        assert model.index_of_word(lexicon.retrieve("Word0")) == model.index(0, 0)
+        assert model.rowCount() == 1
+
+
+class TestGivenALexiconTreeModelOfAStoredLexicon:
+    """Tests for a model presenting a Lexicon read lazily from storage"""
+    def test_only_fetched_rows_are_materialised(self, qapp, tmp_path, monkeypatch):  # pylint: disable=unused-argument
+        """State Test"""
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
+        _populated_lexicon(3).store_to("TestTreeLexicon")
+        lexicon = Lexicon()
+        lexicon.load_from("TestTreeLexicon")
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.fetch_batch_size = 1
+        model.set_lexicon(lexicon)
+        model.fetchMore(QModelIndex())
+        assert model.index(0, 0).data(Qt.DisplayRole) == "Word0"
+        assert lexicon._members[1:] == [None, None]  # pylint: disable=protected-access
+
+    def test_revealing_a_word_fetches_only_the_rows_before_it(self, qapp, tmp_path, monkeypatch):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
+        _populated_lexicon(4).store_to("TestTreeLexicon")
+        lexicon = Lexicon()
+        lexicon.load_from("TestTreeLexicon")
+        model = LexiconTreeModel(_text_builder, _colour_builder)
+        model.fetch_batch_size = 1
+        model.set_lexicon(lexicon)
+        found_index = model.reveal_word(lexicon.retrieve("Word1"))
+        assert found_index.row() == 1
+        assert model.rowCount() == 2
+        assert lexicon._members[2] is None  # pylint: disable=protected-access
@@ -0,0 +1,67 @@
+"""Tests for application logging configured from Settings"""
+import logging
+import pytest
+from configuration.logging_setup import LOGGER_NAME, configure_logging
+from configuration.settings import Settings
+from core import word as word_module
+from core.change_history import LexiconChangeHistory
+from core.word import Word
+
+
+@pytest.fixture(name="app_logger")
+def fixture_app_logger():
+    """Restores the handlers and level of the application logger after a test"""
+    logger = logging.getLogger(LOGGER_NAME)
+    (handlers, level) = (list(logger.handlers), logger.level)
+    yield logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+def _log_contents_of(log_file) -> str:
+    with open(log_file, 'r', encoding='UTF-8') as opened_file:
+        return opened_file.read()
+
+
+class TestGivenLoggingSettings:
+    """Tests for configuring the application logger"""
+    def test_records_are_written_synchronously_when_not_asynchronous(self, tmp_path, app_logger):
+        """Behaviour Test"""
+        log_file = tmp_path / "test.log"
+        listener = configure_logging(Settings({
+            "LogFile": str(log_file), "LogLevel": "DEBUG", "LogAsynchronously": False}))
+        app_logger.debug("Synchronous record")
+        assert listener is None
+        assert "Synchronous record" in _log_contents_of(log_file)
+
+    def test_queued_records_are_written_once_the_listener_stops(self, tmp_path, app_logger):
+        """Behaviour Test"""
+        log_file = tmp_path / "test.log"
+        listener = configure_logging(Settings({"LogFile": str(log_file), "LogLevel": "info"}))
+        app_logger.info("Queued record")
+        app_logger.debug("Filtered record")
+        listener.stop()
+        assert "Queued record" in _log_contents_of(log_file)
+        assert "Filtered record" not in _log_contents_of(log_file)
+
+    def test_an_unknown_level_falls_back_to_info_with_a_warning(self, tmp_path, app_logger):
+        """Behaviour Test"""
+        log_file = tmp_path / "test.log"
+        configure_logging(Settings({
+            "LogFile": str(log_file), "LogLevel": "Loud", "LogAsynchronously": False}))
+        assert app_logger.level == logging.INFO
+        assert "Unknown LogLevel LOUD" in _log_contents_of(log_file)
+
+    def test_words_skip_debug_logging_above_debug_level(self, tmp_path, app_logger, mocker):
+        """Behaviour Test"""
+        configure_logging(Settings({
+            "LogFile": str(tmp_path / "test.log"), "LogAsynchronously": False}))
+        debug = mocker.patch.object(word_module.logger, "debug")
+        word = Word({"version_history": ["Missing"]})
+        word.identify_unresolved_modifications(LexiconChangeHistory())
+        assert app_logger.level == logging.INFO
+        debug.assert_not_called()
@@ -0,0 +1,90 @@
+"""Tests for the counters and timing histograms of core operations"""
+import json
+import pytest
+from core.lexicon import Lexicon
+from core.metrics import MetricsRegistry, metrics
+from core.word import Word
+
+
+@pytest.fixture(name="enabled_metrics")
+def fixture_enabled_metrics():
+    """Records into the shared registry for the duration of a test"""
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+class TestAMetricsRegistryShould:
+    """Tests for recording counters and timings"""
+    def test_ignore_records_while_disabled(self):
+        """State Test"""
+        registry = MetricsRegistry()
+        registry.increment("Counter")
+        registry.record_time("Timing", 0.5)
+        assert registry.snapshot() == {"Counters": {}, "Timings": {}}
+
+    def test_add_to_counters_while_enabled(self):
+        """State Test"""
+        registry = MetricsRegistry()
+        registry.enable()
+        registry.increment("Counter")
+        registry.increment("Counter", 4)
+        assert registry.counter("Counter") == 5
+
+    def test_summarise_recorded_timings(self):
+        """State Test"""
+        registry = MetricsRegistry()
+        registry.enable()
+        for seconds in [0.001, 0.003, 20.0]:
+            registry.record_time("Timing", seconds)
+        timing = registry.timing("Timing")
+        assert timing["Count"] == 3
+        assert timing["MinSeconds"] == 0.001
+        assert timing["MaxSeconds"] == 20.0
+        assert sum(timing["Buckets"].values()) == 3
+        assert timing["Buckets"]["slower"] == 1
+
+    def test_time_calls_of_decorated_functions_only_while_enabled(self):
+        """Behaviour Test"""
+        registry = MetricsRegistry()
+
+        @registry.timed("Function")
+        def _function(value):
+            return value * 2
+
+        assert _function(2) == 4
+        registry.enable()
+        assert _function(3) == 6
+        assert registry.timing("Function")["Count"] == 1
+
+    def test_dump_a_json_snapshot(self, tmp_path):
+        """Behaviour Test"""
+        registry = MetricsRegistry()
+        registry.enable()
+        registry.increment("Counter")
+        registry.dump_to(str(tmp_path / "metrics.json"))
+        with open(tmp_path / "metrics.json", 'r', encoding='UTF-8') as metrics_file:
+            assert json.load(metrics_file) == registry.snapshot()
+
+
+class TestGivenEnabledMetrics:
+    """Tests for the instrumentation of Lexicon operations"""
+    def test_ripple_propagations_count_the_descendants_reached(self, enabled_metrics):
+        """Behaviour Test"""
+        lexicon = Lexicon()
+        lexicon.populate_from([
+            {"translated_word": "Parent"},
+            {"translated_word": "Child", "translated_word_components": ["Parent"]}])
+        lexicon.set_field_to_value("In Language Word", "Parent", "changed")
+        assert enabled_metrics.counter("lexicon.ripple.propagations") == 1
+        assert enabled_metrics.counter("lexicon.ripple.words") == 1
+        assert enabled_metrics.timing("lexicon.set_field_to_value")["Count"] == 1
+
+    def test_index_rebuilds_are_timed(self, enabled_metrics):
+        """Behaviour Test"""
+        lexicon = Lexicon()
+        lexicon.add_entry(Word({"translated_word": "Root"}))
+        lexicon.get_root_words()
+        assert enabled_metrics.timing("lexicon.build_relationship_index")["Count"] == 1
@@ -0,0 +1,31 @@
+"""Test properties and methods of the PoolTask run on a thread pool"""
+from PyQt5.QtCore import QThreadPool
+from ui.pool_task import PoolTask
+
+
+class _DoublingTask(PoolTask):
+    def __init__(self, value) -> None:
+        super().__init__()
+        self.value = value
+
+    def work(self) -> int:
+        return self.value * 2
+
+
+class TestAPoolTaskShould:
+    """Tests for reporting the outcome of work run on a pool thread"""
+    def test_emit_the_result_of_its_work(self, qtbot):
+        """Behaviour Test"""
+        task = _DoublingTask(2)
+        signals = task.signals
+        with qtbot.waitSignal(signals.finished, timeout=5000) as finished:
+            QThreadPool.globalInstance().start(task)
+        assert finished.args == [4]
+
+    def test_emit_the_error_raised_by_its_work(self, qtbot):
+        """Behaviour Test"""
+        task = _DoublingTask(None)
+        signals = task.signals
+        with qtbot.waitSignal(signals.failed, timeout=5000) as failed:
+            QThreadPool.globalInstance().start(task)
+        assert "unsupported operand" in failed.args[1]
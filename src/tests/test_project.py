@@ -1,5 +1,7 @@
 """Tests for a Project that will contain Lexicons of Words."""
-from core.project import Project
+import pytest
+from core.project import Project, ProjectBuilder
+from core.core import WordField
 from core.lexicon import Lexicon
 
 
@@ -31,6 +33,7 @@ class TestANewEmptyProjectShould:
         """Placeholder: State Test"""
         empty_project = Project({"Filename": "TestProject"})
         mock_method = mocker.patch("builtins.open")
+        mocker.patch("os.replace")
         empty_project.store()
         assert mock_method.called
 
@@ -38,6 +41,7 @@ class TestANewEmptyProjectShould:
         """Placeholder: State Test"""
         empty_project = Project({"Filename": "TestProject"})
         mock_method = mocker.patch("builtins.open")
+        mocker.patch("os.replace")
         empty_project.store()
         assert mock_method.call_count == 3
 
@@ -51,3 +55,137 @@ class TestANewProjectWithDefinedSettingsShould:
     def test__prj_ist_05__import_a_defined_name(self):
         """Placeholder: State Test"""
         assert Project(settings={"Name": "TestProjectSettings"}).name == "TestProjectSettings"
+
+
+@pytest.mark.usefixtures("project_directory")
+class TestAStoredProjectShould:
+    """Tests for a Project reconstructed from local storage"""
+    def test__prj_lzy_00__not_load_lexicons_on_instantiation(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestLazyProject", "Filename": "TestLazyProject"})
+        stored_project.list_lexicons()[0].create_entry()
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestLazyProject.data")
+        lexicon_id = loaded_project.list_lexicon_ids()[0]
+        assert not loaded_project.is_lexicon_loaded(lexicon_id)
+
+    def test__prj_lzy_01__report_lexicon_metadata_without_loading(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestLazyProject", "Filename": "TestLazyProject"})
+        stored_project.list_lexicons()[0].create_entry()
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestLazyProject.data")
+        lexicon_id = loaded_project.list_lexicon_ids()[0]
+        assert loaded_project.lexicon_manifest()[lexicon_id]["WordCount"] == 1
+        assert not loaded_project.is_lexicon_loaded(lexicon_id)
+
+    def test__prj_lzy_02__load_a_lexicon_and_history_on_first_request(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestLazyProject", "Filename": "TestLazyProject"})
+        stored_project.list_lexicons()[0].create_entry()
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestLazyProject.data")
+        lexicon_id = loaded_project.list_lexicon_ids()[0]
+        assert loaded_project.find_changehistory_by_id(lexicon_id) is not None
+        assert loaded_project.is_lexicon_loaded(lexicon_id)
+        assert len(loaded_project.find_lexicon_by_id(lexicon_id).get_all_words()) == 1
+
+    def test__prj_lzy_03__load_all_lexicons_concurrently(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestLazyProject", "Filename": "TestLazyProject"})
+        stored_project.list_lexicons()[0].create_entry()
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestLazyProject.data")
+        loaded_project.load_all_lexicons(jobs=2)
+        lexicon_id = loaded_project.list_lexicon_ids()[0]
+        assert loaded_project.is_lexicon_loaded(lexicon_id)
+        assert len(loaded_project.find_lexicon_by_id(lexicon_id).get_all_words()) == 1
+
+    def test__prj_lzy_04__parse_large_files_on_a_process_pool(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestLazyProject", "Filename": "TestLazyProject"})
+        stored_word = stored_project.list_lexicons()[0].create_entry()
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestLazyProject.data")
+        loaded_project.load_all_lexicons(jobs=2, parse_threshold=0)
+        lexicon_id = loaded_project.list_lexicon_ids()[0]
+        assert loaded_project.find_lexicon_by_id(lexicon_id).get_all_words() == [stored_word]
+
+
+@pytest.mark.usefixtures("project_directory")
+class TestAStoredProjectDescriptorShould:
+    """Tests for the summary of a stored Project read without building it"""
+    def test__prj_dsc_00__report_settings_without_building_the_project(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestDescribedProject", "Filename": "TestDescribed"})
+        stored_project.store()
+        descriptor = ProjectBuilder.descriptor_from_file("data/PROJ-TestDescribed.data")
+        assert descriptor.name == "TestDescribedProject"
+        assert descriptor.filename == "TestDescribed"
+        assert descriptor.lexicon_ids == stored_project.list_lexicon_ids()
+
+    def test__prj_dsc_01__report_stored_lexicon_file_sizes(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestDescribedProject", "Filename": "TestDescribed"})
+        stored_project.store()
+        descriptor = ProjectBuilder.descriptor_from_file("data/PROJ-TestDescribed.data")
+        lexicon_id = descriptor.lexicon_ids[0]
+        assert descriptor.lexicon_file_sizes()[lexicon_id]["Lexicon"] > 0
+
+    def test__prj_dsc_02__build_the_described_project(self):
+        """State Test"""
+        stored_project = Project({"Name": "TestDescribedProject", "Filename": "TestDescribed"})
+        stored_project.store()
+        descriptor = ProjectBuilder.descriptor_from_file("data/PROJ-TestDescribed.data")
+        assert descriptor.build_project().name == "TestDescribedProject"
+
+
+@pytest.mark.usefixtures("project_directory")
+class TestAProjectSnapshotShould:
+    """Tests for copies of unsaved Project state stored separately from the Project"""
+    def test__prj_snp_00__include_a_new_lexicon_until_it_is_stored(self):
+        """State Test"""
+        new_project = Project({"Name": "TestSnapshotProject", "Filename": "TestSnapshot"})
+        assert new_project.has_unsaved_changes()
+        new_project.store()
+        assert not new_project.has_unsaved_changes()
+        assert not new_project.snapshot().lexicon_ids
+
+    def test__prj_snp_01__include_only_lexicons_modified_since_storing(self):
+        """State Test"""
+        new_project = Project({"Name": "TestSnapshotProject", "Filename": "TestSnapshot"})
+        new_project.store()
+        new_project.list_lexicons()[0].create_entry()
+        assert new_project.snapshot().lexicon_ids == new_project.list_lexicon_ids()
+
+    def test__prj_snp_02__not_change_when_the_project_is_edited_afterwards(self):
+        """Behaviour Test"""
+        new_project = Project({"Name": "TestSnapshotProject", "Filename": "TestSnapshot"})
+        lexicon = new_project.list_lexicons()[0]
+        stored_word = lexicon.create_entry()
+        snapshot = new_project.snapshot()
+        lexicon.set_field_to_value("Translated Word", stored_word, "ChangedAfterSnapshot")
+        snapshot.store()
+        new_project.record_stored(snapshot)
+        assert new_project.has_unsaved_changes()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestSnapshot.data")
+        loaded_lexicon = loaded_project.list_lexicons()[0]
+        assert loaded_lexicon.retrieve("ChangedAfterSnapshot") is None
+        assert loaded_lexicon.count_entries() == 1
+
+    def test__prj_snp_03__copy_words_not_yet_loaded_without_reading_them(self):
+        """Behaviour Test"""
+        stored_project = Project({"Name": "TestSnapshotProject", "Filename": "TestSnapshot"})
+        stored_project.list_lexicons()[0].populate_from(
+            [{"translated_word": f"Word{x}"} for x in range(4)])
+        stored_project.store()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestSnapshot.data")
+        lexicon = loaded_project.list_lexicons()[0]
+        lexicon.set_field_to_value("In Language Word", "Word0", "Edited")
+        loaded_project.snapshot().store()
+        assert lexicon._members[1:] == [None] * 3  # pylint: disable=protected-access
+        assert lexicon.retrieve("Word3").find_data_on(WordField.TRANSLATEDWORD) == "Word3"
+        reloaded_project = ProjectBuilder.project_from_file("data/PROJ-TestSnapshot.data")
+        reloaded_lexicon = reloaded_project.list_lexicons()[0]
+        assert reloaded_lexicon.get_field_for_word("In Language Word", "Word0") == "Edited"
+        assert reloaded_lexicon.count_entries() == 4
@@ -1,5 +1,10 @@
 """Test properties and methods of the ProjectWindow UI class"""
+import os
+import pytest
+from PyQt5.QtWidgets import QMessageBox
 from src.configuration.settings import Settings
+from src.core.core import ProjectStatus
+from src.core.project import Project, ProjectBuilder
 from src.ui.project_ui import ProjectWindow, ProjectUIController
 
 
@@ -11,6 +16,22 @@ class TestGivenANewProjectWindow:
         qtbot.addWidget(new_window)
         assert hasattr(new_window, "options")
 
+    def test_actions_are_profiled_when_a_profile_directory_is_configured(self, qtbot, tmp_path):
+        """Each profiled action writes a profile to the configured directory"""
+        new_window = ProjectWindow(Settings({
+            "ProfileDirectory": str(tmp_path), "ProfileMemory": False}))
+        qtbot.addWidget(new_window)
+        new_window._resolve_changes_btn_clicked()  # pylint: disable=protected-access
+        assert os.listdir(tmp_path) == ["00001-resolve_changes_btn_clicked.prof"]
+
+    def test_profiled_actions_accept_the_arguments_of_their_signals(self, qtbot, tmp_path):
+        """Clicking a profiled button profiles its action rather than raising a TypeError"""
+        new_window = ProjectWindow(Settings({
+            "ProfileDirectory": str(tmp_path), "ProfileMemory": False}))
+        qtbot.addWidget(new_window)
+        new_window.controls.control_from_id("ResolveSubtreeBtn").clicked.emit(False)
+        assert os.listdir(tmp_path) == ["00001-resolve_subtree_btn_clicked.prof"]
+
 
 class TestGivenAProjectWindowForANewProject:
     """Tests for the project overview window after a new Lexicon has been constructed"""
@@ -20,6 +41,53 @@ class TestGivenAProjectWindowForANewProject:
         qtbot.addWidget(new_window)
 
 
+    @pytest.mark.usefixtures("project_directory")
+    def test_only_the_current_lexicon_notifies_the_window(self, qtbot):
+        """Launching again or closing stops the window following the previous Lexicon"""
+        new_window = ProjectWindow(Settings())
+        qtbot.addWidget(new_window)
+        new_window._window_launch(ProjectStatus.NEW)  # pylint: disable=protected-access
+        first_lexicon = new_window.current_lexicon
+        new_window._window_launch(ProjectStatus.NEW)  # pylint: disable=protected-access
+        second_lexicon = new_window.current_lexicon
+        assert not first_lexicon._subscribers  # pylint: disable=protected-access
+        assert second_lexicon._subscribers  # pylint: disable=protected-access
+        new_window.close()
+        assert not second_lexicon._subscribers  # pylint: disable=protected-access
+
+
+    @pytest.mark.usefixtures("project_directory")
+    def test_closing_can_be_cancelled_if_changes_cannot_be_stored(self, qtbot, mocker):
+        """A failed store is reported and the user chooses whether the window closes"""
+        new_window = ProjectWindow(Settings())
+        qtbot.addWidget(new_window)
+        new_window._window_launch(ProjectStatus.NEW)  # pylint: disable=protected-access
+        mocker.patch.object(
+            new_window.options.find_by_id("SaveWorker"), "flush", side_effect=OSError("Disk full"))
+        warning = mocker.patch.object(QMessageBox, "warning", return_value=QMessageBox.Cancel)
+        assert not new_window.close()
+        assert "Disk full" in warning.call_args.args[2]
+        warning.return_value = QMessageBox.Close
+        assert new_window.close()
+
+
+class TestGivenAProjectWindowForAStoredProject:
+    """Tests for the project overview window launched from a stored Project"""
+    @pytest.mark.usefixtures("project_directory")
+    def test_the_project_is_built_from_its_descriptor(self, qtbot):
+        """The Project selected on the splash screen is loaded from its descriptor"""
+        stored_project = Project({"Name": "TestLaunchedProject", "Filename": "TestLaunched"})
+        stored_project.store()
+        new_window = ProjectWindow(Settings())
+        qtbot.addWidget(new_window)
+        new_window.options.set_option_to(
+            "CurrentProjectDescriptor",
+            ProjectBuilder.descriptor_from_file("data/PROJ-TestLaunched.data"))
+        new_window._window_launch(ProjectStatus.LOADING)  # pylint: disable=protected-access
+        assert new_window.options.find_by_id("CurrentProject").name == "TestLaunchedProject"
+        assert new_window.current_lexicon is not None
+
+
 class TestAProjectUIControllerShould:
     """Tests for the project overview after loading a populated Project"""
     # 6_1_1 Editing "Translated Word Components" splits the input components
@@ -38,16 +106,3 @@ class TestAProjectUIControllerShould:
             excluded=[' '],
             separator='+')
         assert components == []
-
-    def test_update_component_mappings(self):
-        """Only existing components should be found"""
-        mapping = {"test": []}
-        component_id = "TestFragments"
-        components = ["test", "fragments"]
-
-        new_mapping = ProjectUIController.update_component_mapping(
-            mapping=mapping,
-            component_id=component_id,
-            components=components)
-
-        assert new_mapping["TestFragments"] == ["test", "fragments"]
@@ -0,0 +1,70 @@
+"""Test properties and methods of the SaveWorker background store"""
+import pytest
+from core.project import Project, ProjectBuilder
+from ui.save_worker import SaveWorker
+
+
+pytestmark = pytest.mark.usefixtures("project_directory")
+
+
+@pytest.fixture(name="make_save_worker")
+def fixture_make_save_worker(qapp):  # pylint: disable=unused-argument
+    """Builds SaveWorkers whose pools are drained before they are destroyed"""
+    workers = []
+
+    def _make_save_worker(debounce_ms: int) -> SaveWorker:
+        workers.append(SaveWorker(debounce_ms=debounce_ms))
+        return workers[-1]
+    yield _make_save_worker
+    for worker in workers:
+        worker.wait_for_done()
+
+
+def _edited_project() -> Project:
+    project = Project({"Name": "TestSaveWorkerProject", "Filename": "TestSaveWorker"})
+    project.list_lexicons()[0].create_entry()
+    return project
+
+
+class TestGivenASaveWorker:
+    """Tests for saves requested from the GUI thread"""
+    def test_a_requested_save_is_stored_in_the_background(self, qtbot, make_save_worker):
+        """Behaviour Test"""
+        save_worker = make_save_worker(0)
+        project = _edited_project()
+        with qtbot.waitSignal(save_worker.saved, timeout=5000):
+            save_worker.request_save(project)
+        assert not project.has_unsaved_changes()
+        loaded_project = ProjectBuilder.project_from_file("data/PROJ-TestSaveWorker.data")
+        assert loaded_project.list_lexicons()[0].count_entries() == 1
+
+    def test_requests_within_the_debounce_window_are_coalesced(
+            self, qtbot, mocker, make_save_worker):
+        """Behaviour Test"""
+        save_worker = make_save_worker(50)
+        project = _edited_project()
+        snapshot_spy = mocker.spy(project, "snapshot")
+        with qtbot.waitSignal(save_worker.saved, timeout=5000):
+            for _ in range(5):
+                save_worker.request_save(project)
+        assert snapshot_spy.call_count == 1
+
+    def test_a_failed_store_is_reported(self, qtbot, mocker, make_save_worker):
+        """Behaviour Test"""
+        save_worker = make_save_worker(0)
+        project = _edited_project()
+        mocker.patch("core.project.ProjectSnapshot.store", side_effect=ValueError("Disk full"))
+        with qtbot.waitSignal(save_worker.failed, timeout=5000) as blocker:
+            save_worker.request_save(project)
+        save_worker.wait_for_done()
+        assert blocker.args == ["Disk full"]
+        assert not save_worker.is_saving
+        assert project.has_unsaved_changes()
+
+    def test_flushing_stores_outstanding_changes_immediately(self, make_save_worker):
+        """Behaviour Test"""
+        save_worker = make_save_worker(60000)
+        project = _edited_project()
+        save_worker.request_save(project)
+        save_worker.flush()
+        assert not project.has_unsaved_changes()
@@ -0,0 +1,50 @@
+"""Test properties of Lexicons made by the SyntheticLexiconGenerator"""
+from core.core import WordField
+from core.project import ProjectBuilder
+from core.synthetic_lexicon import SyntheticLexiconGenerator
+from core.wordflow import summarise_word_data
+
+
+class TestASyntheticLexiconShould:
+    """Tests for the Words and changes generated"""
+    def test__contain_only_words_that_pass_the_wordflow(self):
+        """State Test"""
+        generator = SyntheticLexiconGenerator(500, depth=5, fan_out=3)
+        assert not [x for x in generator.word_data() if summarise_word_data(x)["Failed"] > 0]
+
+    def test__contain_the_requested_number_of_words_and_generations(self):
+        """State Test"""
+        lexicon = SyntheticLexiconGenerator(300, depth=3, fan_out=4).build_lexicon()
+        assert lexicon.count_entries() == 300
+        generations = {}
+        for word in lexicon:
+            parents = word.find_data_on(WordField.TRANSLATEDCOMPONENTS)
+            generations[word.find_data_on(WordField.TRANSLATEDWORD)] = 1 + max(
+                (generations[x] for x in parents), default=-1)
+        assert max(generations.values()) == 2
+
+    def test__record_each_change_against_its_originator_and_children(self):
+        """State Test"""
+        generator = SyntheticLexiconGenerator(50, depth=2, changes_per_word=1, ripple_depth=1)
+        lexicon = generator.build_lexicon()
+        for change in lexicon.changehistory.get_all_items():
+            recorded_by = [
+                x for x in lexicon if change.uid in x.find_data_on(WordField.VERSIONHISTORY)]
+            assert recorded_by[0].find_data_on(WordField.UID) == change.originator
+            assert recorded_by[1:] == lexicon.get_children_of(recorded_by[0])
+
+    def test__be_the_same_for_the_same_seed(self):
+        """State Test"""
+        first_data = list(SyntheticLexiconGenerator(20, changes_per_word=1, seed=7).word_data())
+        second_data = list(SyntheticLexiconGenerator(20, changes_per_word=1, seed=7).word_data())
+        assert first_data == second_data
+
+    def test__be_written_as_a_loadable_project(self, project_directory):  # pylint: disable=unused-argument
+        """Behaviour Test"""
+        generator = SyntheticLexiconGenerator(40, changes_per_word=2, resolved_fraction=0.5)
+        project_file = generator.write_project("Synthetic", "Synthetic")
+        project = ProjectBuilder.project_from_file(project_file)
+        assert list(project.lexicon_manifest().values()) == [{"WordCount": 40, "ChangeCount": 80}]
+        lexicon = project.list_lexicons()[0]
+        assert lexicon.count_entries() == 40
+        assert len(lexicon.changehistory.get_all_items()) == 80
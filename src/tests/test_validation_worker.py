@@ -0,0 +1,49 @@
+"""Test properties and methods of the ValidationWorker background validator"""
+import pytest
+from core.core import WordField
+from core.word import Word
+from ui.validation_worker import ValidationWorker
+
+
+@pytest.fixture(name="validation_worker")
+def fixture_validation_worker(qapp):  # pylint: disable=unused-argument
+    """A ValidationWorker whose pool is drained before it is destroyed"""
+    worker = ValidationWorker()
+    worker.batch_size = 2
+    yield worker
+    worker.wait_for_done()
+
+
+def _root_word(translated_word: str) -> Word:
+    return Word({"translated_word": translated_word})
+
+
+class TestGivenAValidationWorker:
+    """Tests for validation requested from the GUI thread"""
+    def test_an_unvalidated_word_has_no_summary_until_validated(self, qtbot, validation_worker):
+        """Behaviour Test"""
+        word = _root_word("aa")
+        with qtbot.waitSignal(validation_worker.validated, timeout=5000) as blocker:
+            assert validation_worker.summary_for(word) is None
+        assert blocker.args == [word.find_data_on(WordField.UID)]
+        summary = validation_worker.summary_for(word)
+        assert set(summary) == {"Checks", "Failed", "FailedStages"}
+        assert not validation_worker.is_validating
+
+    def test_every_requested_word_is_validated_across_batches(self, qtbot, validation_worker):
+        """Behaviour Test"""
+        words = [_root_word(f"w{x}") for x in range(5)]
+        with qtbot.waitSignals([validation_worker.validated] * 5, timeout=5000):
+            for word in words:
+                validation_worker.summary_for(word)
+        assert all(validation_worker.summary_for(x) is not None for x in words)
+
+    def test_an_invalidated_word_is_validated_again(self, qtbot, validation_worker):
+        """Behaviour Test"""
+        word = _root_word("aa")
+        with qtbot.waitSignal(validation_worker.validated, timeout=5000):
+            validation_worker.summary_for(word)
+        validation_worker.invalidate([word])
+        with qtbot.waitSignal(validation_worker.validated, timeout=5000):
+            assert validation_worker.summary_for(word) is None
+        assert validation_worker.summary_for(word) is not None
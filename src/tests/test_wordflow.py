@@ -1,7 +1,7 @@
 """Test operations associated with word validity pipeline"""
 # import pytest
 from core.core import WordField
-from core.wordflow import Wordflow
+from core.wordflow import Wordflow, summarise_word_data
 from core.word import Word
 
 
@@ -301,3 +301,17 @@ class TestTheBaseWordFlowShould:
         for field in field_list[1:]:
             assert last_field in (field, stage_pairs[field])
             last_field = field
+
+
+class TestAWordflowSummaryShould:
+    """Test summaries of Wordflows run over plain Word data"""
+    def test__match_a_wordflow_run_over_the_same_word(self):
+        """State Test"""
+        word = Word({"translated_word": "aa"})
+        wordflow = Wordflow()
+        wordflow.run_stages(word=word)
+        summary = summarise_word_data(word.data_for_export())
+        assert summary == {
+            "Checks": wordflow.count_checks(),
+            "Failed": wordflow.count_failed_stages(),
+            "FailedStages": wordflow.list_failed_stages()}
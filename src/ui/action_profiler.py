@@ -0,0 +1,132 @@
+"""Profiling of user actions, writing a profile per action and a summary report"""
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Union
+
+# Functions listed in the summary report, by cumulative time over every profiled action
+SUMMARY_FUNCTION_COUNT = 30
+
+
+def _positional_parameter_count(slot: Callable) -> Union[int, None]:
+    """Number of positional arguments slot accepts, or None if it accepts any number"""
+    parameters = inspect.signature(slot).parameters.values()
+    if any(x.kind == inspect.Parameter.VAR_POSITIONAL for x in parameters):
+        return None
+    return len([
+        x for x in parameters
+        if x.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)])
+
+
+class ActionProfiler:
+    """Wraps slots so that each call is profiled with cProfile and, optionally, tracemalloc
+
+    The profile of each call is written to output_directory as it completes, so that it
+    survives a crash. Calls made while another action is being profiled are included in
+    the profile of that action rather than profiled again."""
+    def __init__(self, output_directory: str, trace_memory: bool = True) -> None:
+        self.output_directory = output_directory
+        self.trace_memory = trace_memory
+        self._started_tracing = False
+        self._is_profiling = False
+        self._action_count = 0
+        self._actions: dict[str, dict] = {}
+        self._profile_files: list[str] = []
+        os.makedirs(output_directory, exist_ok=True)
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def wrap(self, action_name: str, slot: Callable) -> Callable:
+        """A callable that profiles each call of slot as an action called action_name
+
+        As when connecting slot itself, arguments of a signal beyond those slot accepts
+        are dropped."""
+        positional_count = _positional_parameter_count(slot)
+
+        @functools.wraps(slot)
+        def _profiled_slot(*args, **kwargs):
+            args = args[:positional_count]
+            if self._is_profiling:
+                return slot(*args, **kwargs)
+            return self._profile(action_name, slot, args, kwargs)
+        return _profiled_slot
+
+    def _profile(self, action_name: str, slot: Callable, args: tuple, kwargs: dict):
+        self._is_profiling = True
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            return profile.runcall(slot, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            peak_memory = None
+            if self.trace_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - memory_before
+            self._is_profiling = False
+            self._record(action_name, profile, elapsed, peak_memory)
+
+    def _record(
+            self,
+            action_name: str,
+            profile: cProfile.Profile,
+            elapsed: float,
+            peak_memory: int) -> None:
+        self._action_count += 1
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', action_name).strip('_')
+        profile_location = os.path.join(
+            self.output_directory, f"{self._action_count:05d}-{slug}.prof")
+        profile.dump_stats(profile_location)
+        self._profile_files.append(profile_location)
+        action = self._actions.setdefault(action_name, {
+            "Calls": 0, "TotalSeconds": 0.0, "MaxSeconds": 0.0, "PeakMemoryBytes": None})
+        action["Calls"] += 1
+        action["TotalSeconds"] += elapsed
+        action["MaxSeconds"] = max(action["MaxSeconds"], elapsed)
+        if peak_memory is not None:
+            action["PeakMemoryBytes"] = max(action["PeakMemoryBytes"] or 0, peak_memory)
+
+    def summary(self) -> dict:
+        """Calls, timings and peak memory of each profiled action"""
+        return {x: dict(self._actions[x]) for x in sorted(self._actions)}
+
+    def write_summary(self) -> str:
+        """Writes summary.json and a readable summary.txt, returning the location of the latter"""
+        summary = self.summary()
+        summary_json = os.path.join(self.output_directory, "summary.json")
+        with open(summary_json, 'w', encoding='UTF-8') as summary_file:
+            json.dump(summary, summary_file, indent=2)
+        report = io.StringIO()
+        report.write(f"{'Action':<40}{'Calls':>8}{'Total s':>12}{'Max s':>12}{'Peak KiB':>12}\n")
+        for (action_name, action) in summary.items():
+            peak = action["PeakMemoryBytes"]
+            report.write(
+                f"{action_name:<40}{action['Calls']:>8}{action['TotalSeconds']:>12.4f}"
+                f"{action['MaxSeconds']:>12.4f}"
+                f"{'-' if peak is None else f'{peak / 1024:.1f}':>12}\n")
+        if self._profile_files:
+            report.write("\n")
+            stats = pstats.Stats(*self._profile_files, stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_FUNCTION_COUNT)
+        summary_location = os.path.join(self.output_directory, "summary.txt")
+        with open(summary_location, 'w', encoding='UTF-8') as summary_file:
+            summary_file.write(report.getvalue())
+        return summary_location
+
+    def close(self) -> None:
+        """Writes the summary report and stops tracing memory if the profiler started it"""
+        self.write_summary()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -0,0 +1,123 @@
+"""Table model presenting the change history of a single Word, fetched as the view scrolls"""
+from collections.abc import Callable
+from typing import Union
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+from core.change_history import LexiconChangeHistory
+from core.change_history_item import ChangeHistoryItem
+from core.core import WordField
+from core.word import Word
+
+# Matches the role QStandardItem.setData() uses by default
+CHANGE_ROLE = Qt.UserRole + 1
+
+
+class ChangeHistoryTableModel(QAbstractTableModel):
+    """Read-only model over the version history of a Word
+
+    Rows are ordered unresolved first when a Word is set, keeping the order of the history
+    within each group. Only the change id and resolved flag of each row are held; rows are
+    fetched in batches and descriptions are read from the history when a view requests them.
+    If a word_lookup is given, the tooltip of each description names the Word that
+    originated the change."""
+    fetch_batch_size = 256
+    _headers = ["Change Description", "Resolved"]
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._change_history: Union[LexiconChangeHistory, None] = None
+        self._word_lookup: Union[Callable[[str], Union[Word, None]], None] = None
+        self._rows: list[tuple[bool, str]] = []
+        self._fetched = 0
+
+    def set_word(
+            self,
+            word: Union[Word, None],
+            change_history: LexiconChangeHistory,
+            word_lookup: Callable[[str], Union[Word, None]] = None) -> None:
+        """Presents the version history of word, discarding all previously fetched rows
+
+        word_lookup finds the Word with a given uid, such as Lexicon.retrieve_by_uid."""
+        self.beginResetModel()
+        self._change_history = change_history
+        self._word_lookup = word_lookup
+        self._rows = []
+        self._fetched = 0
+        if word is not None:
+            resolved_ids = set(word.find_data_on(WordField.RESOLVEDHISTORYITEMS))
+            self._rows = sorted(
+                ((x in resolved_ids, x) for x in word.find_data_on(WordField.VERSIONHISTORY)),
+                key=lambda row: row[0])
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Presents no history"""
+        self.set_word(None, self._change_history, self._word_lookup)
+
+    # pylint: disable-next=invalid-name
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """True while rows of the history have not been fetched"""
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    # pylint: disable-next=invalid-name
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Fetches the next batch of rows of the history"""
+        if parent.isValid():
+            return
+        last_row = min(self._fetched + self.fetch_batch_size, len(self._rows)) - 1
+        if last_row < self._fetched:
+            return
+        self.beginInsertRows(parent, self._fetched, last_row)
+        self._fetched = last_row + 1
+        self.endInsertRows()
+
+    # pylint: disable-next=invalid-name
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows fetched so far"""
+        if parent.isValid():
+            return 0
+        return self._fetched
+
+    # pylint: disable-next=invalid-name
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """The description and resolved status of each change"""
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    # pylint: disable-next=invalid-name
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Column titles"""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def change_at(self, index: QModelIndex) -> Union[ChangeHistoryItem, None]:
+        """The logged change presented at index, or None if it is not in the history"""
+        if self._change_history is None:
+            return None
+        return self._change_history.find_item_with_id(self._rows[index.row()][1])
+
+    def _originator_text_at(self, index: QModelIndex) -> Union[str, None]:
+        logged_item = self.change_at(index)
+        if logged_item is None or self._word_lookup is None:
+            return None
+        originator = self._word_lookup(logged_item.originator)
+        if originator is None:
+            return None
+        return f"Changed on {originator.find_data_on(WordField.TRANSLATEDWORD)}"
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Formats the change at index for role as it is requested"""
+        if not index.isValid():
+            return None
+        (resolved, change_id) = self._rows[index.row()]
+        if role == CHANGE_ROLE:
+            return self.change_at(index)
+        if role == Qt.ToolTipRole and index.column() == 0:
+            return self._originator_text_at(index)
+        if role != Qt.DisplayRole:
+            return None
+        if index.column() == 1:
+            return str(resolved)
+        logged_item = self.change_at(index)
+        return change_id if logged_item is None else logged_item.description
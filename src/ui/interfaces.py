@@ -1,7 +1,7 @@
 """Common UI interfaces"""
 from __future__ import annotations
 from typing import Protocol
-from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QEvent, QObject, pyqtSignal
 from configuration.settings import Settings
 
 
@@ -33,3 +33,25 @@ class Controls:
     def control_from_id(self, object_name: str):
         """Return a registered instance using its name"""
         return self._control_library.get(object_name)
+
+
+def double_clickable(widget):
+    """Helper method to add an event filter for Double Click"""
+    class Filter(QObject):
+        """Permits double click on an element that doesn't have a Double Click slot"""
+        clicked = pyqtSignal()
+
+        # pylint: disable-next=invalid-name
+        def eventFilter(self,
+                        obj: 'QObject',
+                        event: 'QEvent') -> bool:
+            """Catch Dbl-Click if triggered within the bounds of the element"""
+            if obj == widget:
+                if event.type() == QEvent.MouseButtonDblClick:
+                    if obj.rect().contains(event.pos()):
+                        self.clicked.emit()
+                        return True
+            return False
+    dbl_filter = Filter(widget)
+    widget.installEventFilter(dbl_filter)
+    return dbl_filter.clicked
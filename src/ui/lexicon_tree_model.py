@@ -0,0 +1,237 @@
+"""Item model presenting a Lexicon to Qt views without copying its Words"""
+from __future__ import annotations
+import bisect
+from typing import Callable, Sequence, Tuple, Union
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
+from PyQt5.QtGui import QBrush
+from core.core import WordField
+from core.lexicon import Lexicon
+from core.word import Word
+
+# Matches the role QStandardItem.setData() uses by default
+WORD_ROLE = Qt.UserRole + 1
+
+
+class _TreeNode:
+    """One position of a Word in the tree; a Word with several parents has a node under each"""
+    __slots__ = ("word", "parent", "row", "available", "children")
+
+    def __init__(self, word: Union[Word, None], parent: Union[_TreeNode, None], row: int) -> None:
+        self.word = word
+        self.parent = parent
+        self.row = row
+        self.available: Union[list[int], None] = None
+        self.children: list[_TreeNode] = []
+
+
+class LexiconTreeModel(QAbstractItemModel):
+    """Read-only model over the etymological hierarchy of a Lexicon
+
+    Top level rows are the Words without parents. Children are read from the Lexicon when a row
+    is expanded, fetched in batches and formatted only when a view requests them."""
+    fetch_batch_size = 256
+    _text_roles = {Qt.DisplayRole: 0, Qt.ToolTipRole: 1}
+    _colour_roles = {Qt.ForegroundRole: 0, Qt.BackgroundRole: 1}
+
+    def __init__(
+            self,
+            text_builder: Callable[[Word], Tuple[str, str]],
+            colour_builder: Callable[[Word], Tuple[QBrush, QBrush]],
+            parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._text_builder = text_builder
+        self._colour_builder = colour_builder
+        self._lexicon: Union[Lexicon, None] = None
+        self._root = _TreeNode(None, None, 0)
+        self._nodes_by_uid: dict[str, list[_TreeNode]] = {}
+        self._text_cache = {}
+
+    @property
+    def lexicon(self) -> Union[Lexicon, None]:
+        """The Lexicon currently presented"""
+        return self._lexicon
+
+    def set_lexicon(self, lexicon: Lexicon) -> None:
+        """Presents lexicon, discarding all previously fetched rows"""
+        self.beginResetModel()
+        self._lexicon = lexicon
+        self._root = _TreeNode(None, None, 0)
+        self._nodes_by_uid = {}
+        self._text_cache = {}
+        self.endResetModel()
+
+    def reload(self) -> None:
+        """Discards all fetched rows so the hierarchy is read again after a structural edit"""
+        self.set_lexicon(self._lexicon)
+
+    def _node_from(self, index: QModelIndex) -> _TreeNode:
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def _index_of_node(self, node: _TreeNode) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _available_under(self, node: _TreeNode) -> list[int]:
+        """Lexicon positions of the children of node, sorted but not yet materialised"""
+        if node.available is None:
+            if self._lexicon is None:
+                node.available = []
+            else:
+                node.available = self._lexicon.list_child_positions(node.word)
+        return node.available
+
+    # pylint: disable-next=invalid-name
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """True if the Word at parent has children, without fetching them"""
+        node = self._node_from(parent)
+        if node.available is not None:
+            return len(node.available) > 0
+        if node.word is None:
+            return self._lexicon is not None and self._lexicon.count_entries() > 0
+        return self._lexicon.count_children_of(node.word) > 0
+
+    # pylint: disable-next=invalid-name
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """True while the Word at parent has children that have not been fetched as rows"""
+        node = self._node_from(parent)
+        return len(node.children) < len(self._available_under(node))
+
+    # pylint: disable-next=invalid-name
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Fetches the next batch of children of the Word at parent as rows"""
+        node = self._node_from(parent)
+        available = self._available_under(node)
+        first_row = len(node.children)
+        last_row = min(first_row + self.fetch_batch_size, len(available)) - 1
+        if last_row < first_row:
+            return
+        self.beginInsertRows(parent, first_row, last_row)
+        for row in range(first_row, last_row + 1):
+            child = _TreeNode(self._lexicon.retrieve_at(available[row]), node, row)
+            node.children.append(child)
+            self._nodes_by_uid.setdefault(child.word.find_data_on(WordField.UID), []).append(child)
+        self.endInsertRows()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Index for a fetched row under parent"""
+        node = self._node_from(parent)
+        if not 0 <= row < len(node.children) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Index of the row the Word at index was fetched under"""
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of_node(index.internalPointer().parent)
+
+    # pylint: disable-next=invalid-name
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows fetched so far under parent"""
+        if parent.column() > 0:
+            return 0
+        return len(self._node_from(parent).children)
+
+    # pylint: disable-next=invalid-name,unused-argument
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """A single column of formatted Words"""
+        return 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Rows are selectable but not editable"""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def _text_for(self, word: Word) -> Tuple[str, str]:
+        uid = word.find_data_on(WordField.UID)
+        if uid not in self._text_cache:
+            self._text_cache[uid] = self._text_builder(word)
+        return self._text_cache[uid]
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Formats the Word at index for role as it is requested"""
+        if not index.isValid():
+            return None
+        word = self.word_at(index)
+        if role in self._text_roles:
+            return self._text_for(word)[self._text_roles[role]]
+        if role in self._colour_roles:
+            return self._colour_builder(word)[self._colour_roles[role]]
+        if role == WORD_ROLE:
+            return word
+        return None
+
+    def word_at(self, index: QModelIndex) -> Word:
+        """The Word presented at index"""
+        return self._node_from(index).word
+
+    def _ancestry_of(self, word: Word) -> list[Word]:
+        """word followed by its first registered parent, that parent's first parent and so on"""
+        ancestry = [word]
+        while True:
+            components = ancestry[-1].find_data_on(WordField.TRANSLATEDCOMPONENTS) or []
+            parents = [self._lexicon.retrieve(x) for x in components]
+            parents = [x for x in parents if x is not None and x not in ancestry]
+            if not parents:
+                return ancestry
+            ancestry.append(parents[0])
+
+    def _child_node_for(self, node: _TreeNode, word: Word) -> Union[_TreeNode, None]:
+        """The row presenting word directly under node, fetching rows up to it if needed
+
+        The row is found by bisecting the sorted child positions rather than scanning rows."""
+        for child in self._nodes_by_uid.get(word.find_data_on(WordField.UID), []):
+            if child.parent is node:
+                return child
+        available = self._available_under(node)
+        translated_word = word.find_data_on(WordField.TRANSLATEDWORD)
+        key_at = self._lexicon.translated_word_at
+        row = bisect.bisect_left(available, translated_word, key=key_at)
+        while row < len(available) and key_at(available[row]) == translated_word:
+            while len(node.children) <= row:
+                self.fetchMore(self._index_of_node(node))
+            if node.children[row].word is word:
+                return node.children[row]
+            row += 1
+        return None
+
+    def reveal_word(self, word: Word) -> QModelIndex:
+        """Fetches the rows leading to word through its first parents and returns its index"""
+        if self._lexicon is None:
+            return QModelIndex()
+        node = self._root
+        for ancestor in reversed(self._ancestry_of(word)):
+            node = self._child_node_for(node, ancestor)
+            if node is None:
+                return QModelIndex()
+        return self._index_of_node(node)
+
+    def index_of_word(self, word: Word) -> QModelIndex:
+        """Index of a row presenting word; rows already fetched are found without any search"""
+        nodes = self._nodes_by_uid.get(word.find_data_on(WordField.UID))
+        if nodes:
+            return self._index_of_node(nodes[0])
+        return self.reveal_word(word)
+
+    def refresh_words(self, words: Sequence[Word]) -> None:
+        """Discards cached formatting for words and signals views to repaint only their rows"""
+        self.refresh_uids([x.find_data_on(WordField.UID) for x in words])
+
+    def refresh_uids(self, uids: Sequence[str]) -> None:
+        """Discards cached formatting for the Words with uids and repaints only their rows"""
+        for uid in uids:
+            self._text_cache.pop(uid, None)
+            for node in self._nodes_by_uid.get(uid, []):
+                word_index = self._index_of_node(node)
+                self.dataChanged.emit(word_index, word_index)
+
+    def refresh_all(self) -> None:
+        """Discards all cached formatting and signals views to repaint every fetched row"""
+        self._text_cache = {}
+        for node in [x for nodes in self._nodes_by_uid.values() for x in nodes]:
+            word_index = self._index_of_node(node)
+            self.dataChanged.emit(word_index, word_index)
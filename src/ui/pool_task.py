@@ -0,0 +1,35 @@
+"""Work run on a QThreadPool that reports its outcome to the GUI thread through signals"""
+from typing import Any
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class PoolTaskSignals(QObject):
+    """Signals raised by a PoolTask, which cannot emit signals itself as it is not a QObject"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object, str)
+
+
+class PoolTask(QRunnable):
+    """Runs work on a pool thread, emitting its result through finished
+
+    Every error is emitted through failed instead, as an exception escaping a pool thread
+    aborts the application. The pool deletes a task once it has run, so the owner of the
+    task should keep a reference to its signals until one of them has been received."""
+    signals_type = PoolTaskSignals
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = self.signals_type()
+
+    def work(self) -> Any:
+        """The work of the task, returning the result to emit"""
+        raise NotImplementedError
+
+    def run(self) -> None:
+        """Runs the work of the task and reports the outcome"""
+        try:
+            result = self.work()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.signals.failed.emit(self, str(error))
+            return
+        self.signals.finished.emit(result)
@@ -1,12 +1,15 @@
 """Project screen showing project overview"""
+import logging
 from typing import Sequence
-from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtGui import QStandardItemModel, QStandardItem, QBrush, QColor
+from PyQt5 import QtWidgets
+from PyQt5.QtGui import QStandardItemModel, QStandardItem, QBrush, QCloseEvent, QColor
+from PyQt5.QtCore import QItemSelectionModel
 from PyQt5.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
     QLayout,
+    QMessageBox,
     QPushButton,
     QTableView,
     QTreeView,
@@ -14,14 +17,28 @@ from PyQt5.QtWidgets import (
     QWidget)
 
 from core.core import ProjectStatus
-from core.project import Project, ProjectBuilder
+from core.project import Project, ProjectDescriptor
 from core.change_history import LexiconChangeHistory
-from core.lexicon import Lexicon
-from core.word import Word, WordField
+from core.lexicon import Lexicon, LexiconChange
+from core.word import Word
 # Replace this with an interface
 from configuration.settings import Settings
+from ui.action_profiler import ActionProfiler
+from ui.change_history_model import ChangeHistoryTableModel
 from ui.interfaces import Controls
+from ui.lexicon_tree_model import LexiconTreeModel, WORD_ROLE
 from ui.project_word_details import WordDetails
+from ui.save_worker import SaveWorker
+from ui.validation_worker import ValidationWorker
+
+# Slots of ProjectWindow profiled as user actions when a ProfileDirectory is configured
+PROFILED_SLOTS = (
+    "_details_model_data_changed",
+    "_tree_overview_selection_changed",
+    "_tree_overview_update",
+    "_resolve_changes_btn_clicked",
+    "_resolve_descendants_btn_clicked",
+    "_resolve_subtree_btn_clicked")
 
 
 class ProjectUIController:
@@ -53,20 +70,6 @@ class ProjectUIController:
             trimmed[ind] = str.strip(value)
         return trimmed
 
-    @staticmethod
-    def update_component_mapping(mapping: dict, component_id: str, components: Sequence[str]):
-        """Updates component mapping with split component data.
-        
-        Components are in order.
-        Component values are True if the component word exists in the mapping."""
-        mapping[component_id] = components
-        return mapping
-
-    @staticmethod
-    def store_project(project: Project):
-        """Stores the specified Project"""
-        project.store()
-
 
 class ProjectWindow(QWidget):
     """Window to display project overview and controls to the user"""
@@ -79,7 +82,14 @@ class ProjectWindow(QWidget):
         self._selected_node = None
         self._selected_change_nodes = set()
 
-        self._translated_component_mapping = {}
+        save_worker = SaveWorker(parent=self)
+        save_worker.failed.connect(self._project_save_failed)
+        save_worker.saved.connect(lambda _: self._window_title_update())
+        self.options.set_option_to("SaveWorker", save_worker)
+        validation_worker = ValidationWorker(parent=self)
+        validation_worker.validated.connect(self._word_validated)
+        self.options.set_option_to("ValidationWorker", validation_worker)
+        self._start_profiling()
 
         modified_status_colours = {
             True: QBrush(QColor(255, 0, 0)),
@@ -97,6 +107,17 @@ class ProjectWindow(QWidget):
 
         QtWidgets.QApplication.instance().focusChanged.connect(self._check_focus)
 
+    def _start_profiling(self):
+        """Replaces each of PROFILED_SLOTS with a profiled wrapper before any are connected"""
+        profile_directory = self._configuration.find_by_id("ProfileDirectory")
+        if profile_directory is None:
+            return
+        trace_memory = self._configuration.find_by_id("ProfileMemory") is not False
+        profiler = ActionProfiler(profile_directory, trace_memory=trace_memory)
+        for slot_name in PROFILED_SLOTS:
+            setattr(self, slot_name, profiler.wrap(slot_name, getattr(self, slot_name)))
+        self.options.set_option_to("ActionProfiler", profiler)
+
     def _add_tree_overview(self, layout: QLayout):
         tree_group = QGroupBox("Tree Overview")
         tree_layout = QHBoxLayout()
@@ -108,7 +129,11 @@ class ProjectWindow(QWidget):
         _tree_overview.clicked.connect(
             self._tree_overview_selection_changed)
         # self._tree_overview.doubleClicked.connect(self._tree_overview_double_clicked)
-        _tree_model = QStandardItemModel(_tree_overview)
+        _tree_overview.setHeaderHidden(True)
+        _tree_model = LexiconTreeModel(
+            text_builder=self._tree_item_text_for,
+            colour_builder=self._tree_item_colours_for,
+            parent=_tree_overview)
         _tree_overview.setModel(_tree_model)
         tree_layout.addWidget(_tree_overview)
 
@@ -153,6 +178,11 @@ class ProjectWindow(QWidget):
 
         _resolve_btn: QPushButton = self.controls.control_from_id("ResolveChangeBtn")
         _resolve_btn.clicked.connect(self._resolve_changes_btn_clicked)
+        _resolve_descendants_btn: QPushButton = self.controls.control_from_id(
+            "ResolveDescendantsBtn")
+        _resolve_descendants_btn.clicked.connect(self._resolve_descendants_btn_clicked)
+        _resolve_subtree_btn: QPushButton = self.controls.control_from_id("ResolveSubtreeBtn")
+        _resolve_subtree_btn.clicked.connect(self._resolve_subtree_btn_clicked)
 
         return layout
 
@@ -181,38 +211,51 @@ class ProjectWindow(QWidget):
     def _tree_overview_selection_changed(self):
         _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
         selected_cell = _tree_overview.selectionModel().selectedIndexes()[0]
-        _selected_item = _tree_overview.model().itemFromIndex(selected_cell)
-        self._selected_node: Word = _selected_item.data()
+        self._selected_node: Word = selected_cell.data(WORD_ROLE)
         # The data formatting & field selection needs to be in a controller (MVC)
         # Don't pass OUT a control, pass IN the text that needs to be set.
         self._word_details_table_populate()
         self._changehistory_table_populate()
+        self.controls.control_from_id("ResolveSubtreeBtn").setEnabled(True)
 
     def _change_history_selection_changed(self):
         _change_history: QTreeView = self.controls.control_from_id("ChangeHistoryTable")
         _resolve_btn: QPushButton = self.controls.control_from_id("ResolveChangeBtn")
 
-        self._selected_change_nodes = set()
-        selected_rows = _change_history.selectionModel().selectedIndexes()
-        for row in selected_rows:
-            _selected_change_item: QStandardItem = _change_history.model().itemFromIndex(row)
-            self._selected_change_nodes.add(_selected_change_item.data())
+        _change_model: ChangeHistoryTableModel = _change_history.model()
+        self._selected_change_nodes = {
+            _change_model.change_at(x) for x in _change_history.selectionModel().selectedIndexes()}
+        self._selected_change_nodes.discard(None)
 
-        if self._selected_change_nodes:
-            _resolve_btn.setEnabled(True)
-        else:
-            _resolve_btn.setEnabled(False)
+        _resolve_btn.setEnabled(bool(self._selected_change_nodes))
+        self.controls.control_from_id("ResolveDescendantsBtn").setEnabled(
+            bool(self._selected_change_nodes))
 
     def _resolve_changes_btn_clicked(self):
         """Resolve all selected indexes"""
         if self._selected_change_nodes and self._selected_node:
-            for change_node in self._selected_change_nodes:
-                self.current_lexicon.resolve_change_for(change_node, self._selected_node)
-            self._tree_overview_update()
-            self._changehistory_table_populate()
-            ProjectUIController.store_project(self.options.find_by_id("CurrentProject"))
+            self.current_lexicon.resolve_changes_for(
+                list(self._selected_change_nodes),
+                self._selected_node)
+            self._project_save_requested()
             self.controls.control_from_id("ResolveChangeBtn").setEnabled(False)
 
+    def _resolve_descendants_btn_clicked(self):
+        """Resolve all selected changes for the selected Word and its descendants"""
+        if self._selected_change_nodes and self._selected_node:
+            self.current_lexicon.resolve_changes_for_descendants(
+                list(self._selected_change_nodes),
+                self._selected_node)
+            self._project_save_requested()
+            self.controls.control_from_id("ResolveChangeBtn").setEnabled(False)
+            self.controls.control_from_id("ResolveDescendantsBtn").setEnabled(False)
+
+    def _resolve_subtree_btn_clicked(self):
+        """Resolve every ancestor change for the selected Word and its descendants"""
+        if self._selected_node:
+            self.current_lexicon.resolve_ancestor_changes_for_subtree(self._selected_node)
+            self._project_save_requested()
+
     def _details_model_data_changed(self, item: QStandardItem):
         details_table: QTreeView = self.controls.control_from_id("WordDetailsTable")
         details_model: QStandardItemModel = details_table.model()
@@ -222,8 +265,7 @@ class ProjectWindow(QWidget):
         this_changehistory: LexiconChangeHistory = self.options.find_by_id("CurrentChangeHistory")
         new_value = item.text()
         if field_label == "Translated Word Components":
-            word_components = ProjectUIController.split_and_trim_string(target=new_value)
-            new_value = word_components
+            new_value = ProjectUIController.split_and_trim_string(target=new_value)
 
         change_history_item = this_lexicon.set_field_to_value(
             field_label,
@@ -231,29 +273,46 @@ class ProjectWindow(QWidget):
             new_value)
         this_changehistory.add_item(change_history_item)
 
-        ProjectUIController.store_project(self.options.find_by_id("CurrentProject"))
+        self._project_save_requested()
 
-        if field_label == "Translated Word":
-            self._build_translated_component_mappings()
-        if field_label == "Translated Word Components":
-            self._translated_component_mapping = ProjectUIController.update_component_mapping(
-                mapping=self._translated_component_mapping,
-                component_id=this_lexicon.get_field_for_word("Translated Word", associated_word),
-                components=word_components)
         if field_label == "Etymological Symbology":
             item.setText(this_lexicon.get_field_for_word("Etymological Symbology", associated_word))
 
-        self._word_details_table_update()
-        self._tree_overview_update()
-        self._tree_overview_scroll_to(associated_word)
-        self._changehistory_table_populate()
-
     def _new_word_clicked(self):
-        new_entry = self.current_lexicon.create_entry()
-        self._build_translated_component_mappings()
-        self._window_update()
-        self._tree_overview_scroll_to(new_entry)
-        ProjectUIController.store_project(self.options.find_by_id("CurrentProject"))
+        self.current_lexicon.create_entry()
+        self._project_save_requested()
+
+    def _project_save_requested(self):
+        save_worker: SaveWorker = self.options.find_by_id("SaveWorker")
+        save_worker.request_save(self.options.find_by_id("CurrentProject"))
+
+    def _project_save_failed(self, message: str):
+        logging.getLogger('etym_logger').error("Project could not be stored: %s", message)
+        self._window_title_update(save_failed=True)
+
+    # pylint: disable-next=invalid-name
+    def closeEvent(self, event: QCloseEvent):
+        """Stores any changes still waiting to be saved before the window closes
+
+        If they cannot be stored, the user may cancel closing the window."""
+        try:
+            self.options.find_by_id("SaveWorker").flush()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._project_save_failed(str(error))
+            answer = QMessageBox.warning(
+                self,
+                "Unsaved Changes",
+                f"The project could not be stored: {error}\n\nClose without saving?",
+                QMessageBox.Close | QMessageBox.Cancel,
+                QMessageBox.Cancel)
+            if answer != QMessageBox.Close:
+                event.ignore()
+                return
+        self.options.find_by_id("ValidationWorker").wait_for_done()
+        self._unsubscribe_from_current_lexicon()
+        if self.options.find_by_id("ActionProfiler") is not None:
+            self.options.find_by_id("ActionProfiler").close()
+        super().closeEvent(event)
 
     def _get_item_status_colour(self, palette_name: str, colour_key):
         return self.options.find_by_id(palette_name).get(colour_key)
@@ -261,79 +320,84 @@ class ProjectWindow(QWidget):
     def __build_tree_item_text(self, lexicon: Lexicon, word: Word):
         tooltip = ""
         _root_char = '\N{seedling}'
-        wordflow = lexicon.get_word_validitor()
-        wordflow.run_stages(word=word)
-        total_checks = wordflow.count_checks()
-        failed_checks = wordflow.count_failed_stages()
-        if failed_checks > 0:
-            tooltip = "\n".join(wordflow.list_failed_stages())
+        validation_worker: ValidationWorker = self.options.find_by_id("ValidationWorker")
+        validation = validation_worker.summary_for(word)
         translated_word = lexicon.get_field_for_word("Translated Word", word)
-        word_components = self._translated_component_mapping[translated_word]
+        word_components = lexicon.get_field_for_word("Translated Word Components", word)
         _display_char = '\N{herb}'
-        if len(lexicon.get_field_for_word("Translated Word Components", word)) < 1:
+        if len(word_components) < 1:
             _display_char = _root_char
         display_text = _display_char + f" {translated_word}"
         if word_components:
             display_text += f" [{', '.join(word_components)}]"
-        if failed_checks == 0:
+        if validation is None:
+            display_text += ' \N{hourglass}'
+            tooltip = "Validating"
+        elif validation["Failed"] == 0:
             display_text += ' \N{check mark}'
         else:
+            total_checks = validation["Checks"]
+            passed_checks = total_checks - validation["Failed"]
             display_text += ' \N{cross mark}'
-            display_text += f" ({round(((total_checks - failed_checks)/total_checks) * 100, 0)}%)"
+            display_text += f" ({round((passed_checks / total_checks) * 100, 0)}%)"
+            tooltip = "\n".join(validation["FailedStages"])
         return display_text, tooltip
 
-    def _tree_overview_update(self, lexicon: Lexicon = None):
-
+    def _word_validated(self, uid: str):
+        _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
+        _tree_model: LexiconTreeModel = _tree_overview.model()
+        _tree_model.refresh_uids([uid])
+
+    def _tree_item_text_for(self, word: Word):
+        return self.__build_tree_item_text(lexicon=self.current_lexicon, word=word)
+
+    def _tree_item_colours_for(self, word: Word):
+        foreground_colour = self._get_item_status_colour(
+            "ModStatusColours",
+            word.has_unresolved_modification)
+        background_colour = self._get_item_status_colour(
+            "AncStatusColours",
+            word.has_modified_ancestor)
+        return foreground_colour, background_colour
+
+    def _tree_overview_update(self, lexicon: Lexicon = None, words: Sequence[Word] = None):
+        """Presents lexicon in the tree, or repaints only the rows of words if supplied"""
         if lexicon is None:
             lexicon = self.current_lexicon
 
-        # Get View, Model and Root - Clear Model, Set Header to Hidden
         _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
-        _scroll_position = _tree_overview.verticalScrollBar().value()
-        _tree_model: QStandardItemModel = _tree_overview.model()
-        _tree_model.clear()
-        _tree_overview.setHeaderHidden(True)
-        root = _tree_model.invisibleRootItem()
-
-        # For each Word
-        for word in lexicon.members:
-            # Get data about the Word
-            display_text, tooltip_text = self.__build_tree_item_text(
-                lexicon=lexicon,
-                word=word)
-
-            # Use data from thw Word to create the Item
-            new_item = QStandardItem(display_text)
-            new_item.setToolTip(tooltip_text)
-            new_item.setData(word)
-
-            foreground_colour = self._get_item_status_colour(
-                "ModStatusColours",
-                word.has_unresolved_modification)
-            if foreground_colour is not None:
-                new_item.setForeground(foreground_colour)
-
-            background_colour = self._get_item_status_colour(
-                "AncStatusColours",
-                word.has_modified_ancestor)
-            if background_colour is not None:
-                new_item.setBackground(background_colour)
-
-            # Add new Item to the model
-            root.appendRow(new_item)
-        _tree_overview.expandAll()
-        _tree_model.sort(0)
-        _tree_overview.verticalScrollBar().setValue(_scroll_position)
+        _tree_model: LexiconTreeModel = _tree_overview.model()
+        if _tree_model.lexicon is not lexicon:
+            _tree_model.set_lexicon(lexicon)
+        elif words is not None:
+            _tree_model.refresh_words(words)
+        else:
+            _tree_model.refresh_all()
+
+    def _tree_overview_reload(self):
+        """Reads the hierarchy again after an edit that moves Words within the tree"""
+        _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
+        _tree_model: LexiconTreeModel = _tree_overview.model()
+        _tree_model.reload()
 
     def _tree_overview_scroll_to(self, target_word: Word):
         _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
-        _tree_model: QStandardItemModel = _tree_overview.model()
-        all_items = _tree_model.findItems(
-            target_word.find_data_on(WordField.TRANSLATEDWORD), QtCore.Qt.MatchFlag.MatchContains)
-        if all_items:
-            found_index = _tree_model.indexFromItem(all_items[0])
+        _tree_model: LexiconTreeModel = _tree_overview.model()
+        found_index = _tree_model.index_of_word(target_word)
+        if found_index.isValid():
             _tree_overview.scrollTo(found_index)
 
+    def _tree_overview_reselect(self):
+        """Selects the row of the selected Word again after the hierarchy has been read again"""
+        if self._selected_node is None:
+            return
+        _tree_overview: QTreeView = self.controls.control_from_id("LexiconOverview")
+        _tree_model: LexiconTreeModel = _tree_overview.model()
+        found_index = _tree_model.index_of_word(self._selected_node)
+        if found_index.isValid():
+            _tree_overview.selectionModel().setCurrentIndex(
+                found_index, QItemSelectionModel.ClearAndSelect)
+
     def _word_details_table_update(self):
         word_details_table: QTableView = self.controls.control_from_id("WordDetailsTable")
         word_details_table.horizontalHeader().setHidden(True)
@@ -376,34 +440,15 @@ class ProjectWindow(QWidget):
             # QHeaderView.ResizeToContents
             QHeaderView.Stretch
         )
-        model: QStandardItemModel = table.model()
-        model.setHorizontalHeaderLabels(["Change Description", "Resolved"])
 
     def _changehistory_table_populate(self):
         changes_table: QTableView = self.controls.control_from_id("ChangeHistoryTable")
-        changes_model: QStandardItemModel = changes_table.model()
-        changes_model.clear()
+        changes_model: ChangeHistoryTableModel = changes_table.model()
         self._changehistory_table_update()
-
-        change_history = self.current_changehistory
-        if self._selected_node:
-            this_lexicon = self.current_lexicon
-            item_data = this_lexicon.get_field_for_word(
-                "Version History",
-                self._selected_node)
-            for idx, change_data in enumerate(item_data):
-                logged_item = change_history.find_item_with_id(change_data)
-                resolved = self._selected_node.has_resolved_change_with_id(change_data)
-                resolve_description = QStandardItem(str(resolved))
-                resolve_description.setData(logged_item)
-                if logged_item is not None:
-                    change_description = QStandardItem(logged_item.description)
-                else:
-                    change_description = QStandardItem(change_data)
-                change_description.setData(logged_item)
-                changes_model.setItem(idx, 0, change_description)
-                changes_model.setItem(idx, 1, resolve_description)
-        changes_model.sort(1)
+        changes_model.set_word(
+            self._selected_node,
+            self.current_changehistory,
+            self.current_lexicon.retrieve_by_uid)
 
     def _check_focus(self):
         if self.isActiveWindow():
@@ -412,35 +457,45 @@ class ProjectWindow(QWidget):
                 self._window_launch(self.options.find_by_id("ProjectStatus"))
                 self._window_update()
 
-    def _build_translated_component_mappings(self):
-        this_lexicon = self.current_lexicon
-        all_words = this_lexicon.get_all_words()
-        for word in all_words:
-            translated_word = this_lexicon.get_field_for_word("Translated Word", word)
-            translated_components = this_lexicon.get_field_for_word(
-                "Translated Word Components",
-                word)
-            components = translated_components
-            self._translated_component_mapping = ProjectUIController.update_component_mapping(
-                mapping=self._translated_component_mapping,
-                component_id=translated_word,
-                components=components)
-
     def _window_launch(self, project_status: ProjectStatus):
         _behaviour_refs = {
             ProjectStatus.LOADING: self._load_existing_project,
             ProjectStatus.NEW: self._create_new_project
         }
+        self._unsubscribe_from_current_lexicon()
         _behaviour_refs[project_status]()
 
-        self._build_translated_component_mappings()
+        self.current_lexicon.subscribe(self._lexicon_changed)
 
-    def _window_update(self):
+    def _unsubscribe_from_current_lexicon(self):
+        if self.current_lexicon is not None:
+            self.current_lexicon.unsubscribe(self._lexicon_changed)
+
+    def _lexicon_changed(self, change: LexiconChange):
+        """Repaints only the rows and tables affected by a modification of the Lexicon"""
+        self.options.find_by_id("ValidationWorker").invalidate(change.words)
+        if change.is_structural:
+            self._tree_overview_reload()
+            self._tree_overview_reselect()
+            for word in change.words:
+                self._tree_overview_scroll_to(word)
+        else:
+            self._tree_overview_update(words=change.affected_words)
+        if self._selected_node is not None and self._selected_node in change.affected_words:
+            self._changehistory_table_populate()
+
+    def _window_title_update(self, save_failed: bool = False):
         project_title = "Undefined"
         this_project: Project = self.options.find_by_id("CurrentProject")
         if this_project:
             project_title = this_project.name
-        self.setWindowTitle("EtymTree - Project Overview - (" + project_title + ")")
+        window_title = "EtymTree - Project Overview - (" + project_title + ")"
+        if save_failed:
+            window_title += " - Not Saved"
+        self.setWindowTitle(window_title)
+
+    def _window_update(self):
+        self._window_title_update()
 
         self._tree_overview_update(self.current_lexicon)
         self._word_details_table_update()
@@ -452,16 +507,22 @@ class ProjectWindow(QWidget):
         new_lexicon = new_project.find_lexicon_by_id(new_project.list_lexicons()[0].uuid)
         self.options.set_option_to("CurrentProject", new_project)
         self.options.set_option_to("CurrentLexicon", new_lexicon)
+        self.options.set_option_to(
+            "CurrentChangeHistory",
+            new_project.find_changehistory_by_id(new_lexicon.uuid))
 
     def _load_existing_project(self):
         self.options.set_option_to("ProjectStatus", ProjectStatus.SAVED)
-        loaded_project = ProjectBuilder.project_from_file(
-            self.options.find_by_id("CurrentProjectFile"))
+        descriptor: ProjectDescriptor = self.options.find_by_id("CurrentProjectDescriptor")
+        loaded_project = descriptor.build_project()
+        current_lexicon_id = loaded_project.list_lexicon_ids()[0]
         self.options.set_option_to("CurrentProject", loaded_project)
-        self.options.set_option_to("CurrentLexicon", loaded_project.list_lexicons()[0])
+        self.options.set_option_to(
+            "CurrentLexicon",
+            loaded_project.find_lexicon_by_id(current_lexicon_id))
         self.options.set_option_to(
             "CurrentChangeHistory",
-            loaded_project.find_changehistory_by_id(loaded_project.list_lexicons()[0].uuid))
+            loaded_project.find_changehistory_by_id(current_lexicon_id))
 
     @property
     def current_lexicon(self) -> Lexicon:
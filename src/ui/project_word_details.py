@@ -11,6 +11,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout
 )
 from PyQt5.QtGui import QStandardItemModel
+from ui.change_history_model import ChangeHistoryTableModel
 from ui.interfaces import Controls
 
 
@@ -144,7 +145,7 @@ class WordDetails:
 
         changes_table = QTableView()
         changes_table.setObjectName("ChangeHistoryTable")
-        changes_model = QStandardItemModel()
+        changes_model = ChangeHistoryTableModel(parent=changes_table)
         changes_table.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows)  # pylint: disable=no-member
         changes_table.setModel(changes_model)
@@ -156,9 +157,23 @@ class WordDetails:
         resolve_change_btn.setEnabled(False)
         details_layout.addWidget(resolve_change_btn)
 
+        resolve_descendants_btn = QPushButton()
+        resolve_descendants_btn.setObjectName("ResolveDescendantsBtn")
+        resolve_descendants_btn.setText("Resolve Selected Change(s) For All Descendants")
+        resolve_descendants_btn.setEnabled(False)
+        details_layout.addWidget(resolve_descendants_btn)
+
+        resolve_subtree_btn = QPushButton()
+        resolve_subtree_btn.setObjectName("ResolveSubtreeBtn")
+        resolve_subtree_btn.setText("Resolve All Ancestor Changes In Subtree")
+        resolve_subtree_btn.setEnabled(False)
+        details_layout.addWidget(resolve_subtree_btn)
+
         self.controls.register_control(details_table)
         self.controls.register_control(changes_table)
         self.controls.register_control(resolve_change_btn)
+        self.controls.register_control(resolve_descendants_btn)
+        self.controls.register_control(resolve_subtree_btn)
         self.details_group.setLayout(details_layout)
 
     def get_layout(self):
@@ -0,0 +1,89 @@
+"""Stores Projects on a background thread so editing is not blocked by file writes"""
+from typing import Union
+from PyQt5.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+from core.project import Project, ProjectSnapshot
+from ui.pool_task import PoolTask
+
+
+class _SaveTask(PoolTask):
+    """Stores a single ProjectSnapshot on a pool thread"""
+    def __init__(self, snapshot: ProjectSnapshot) -> None:
+        super().__init__()
+        self.snapshot = snapshot
+
+    def work(self) -> ProjectSnapshot:
+        """Stores the snapshot"""
+        self.snapshot.store()
+        return self.snapshot
+
+
+class SaveWorker(QObject):
+    """Coalesces save requests and stores snapshots of a Project one at a time off the GUI thread
+
+    A snapshot is taken on the GUI thread once no further request has arrived for
+    debounce_ms, so the Project may be edited freely while the snapshot is written."""
+    saved = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, debounce_ms: int = 500, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._project: Union[Project, None] = None
+        self._task: Union[_SaveTask, None] = None
+        self._save_pending = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._save_now)
+
+    @property
+    def is_saving(self) -> bool:
+        """True while a snapshot is being written"""
+        return self._task is not None
+
+    def request_save(self, project: Project) -> None:
+        """Schedules project to be stored once requests stop arriving for the debounce window"""
+        self._project = project
+        self._timer.start()
+
+    def _save_now(self) -> None:
+        if self._project is None:
+            return
+        if self._task is not None:
+            self._save_pending = True
+            return
+        self._save_pending = False
+        if not self._project.has_unsaved_changes():
+            return
+        self._task = _SaveTask(self._project.snapshot())
+        self._task.signals.finished.connect(self._task_finished)
+        self._task.signals.failed.connect(self._task_failed)
+        self._pool.start(self._task)
+
+    def _task_finished(self, snapshot: ProjectSnapshot) -> None:
+        self._task = None
+        if self._project is not None:
+            self._project.record_stored(snapshot)
+        self.saved.emit(snapshot)
+        if self._save_pending:
+            self._save_now()
+
+    def _task_failed(self, _: _SaveTask, message: str) -> None:
+        self._task = None
+        self.failed.emit(message)
+        if self._save_pending:
+            self._save_now()
+
+    def wait_for_done(self) -> None:
+        """Blocks until any write in progress has ended; call before the worker is destroyed"""
+        self._pool.waitForDone()
+
+    def flush(self) -> None:
+        """Waits for any write in progress, then stores outstanding changes on the calling thread"""
+        self._timer.stop()
+        self.wait_for_done()
+        if self._project is not None and self._project.has_unsaved_changes():
+            snapshot = self._project.snapshot()
+            snapshot.store()
+            self._project.record_stored(snapshot)
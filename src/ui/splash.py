@@ -11,7 +11,7 @@ from PyQt5.QtWidgets import (
 
 # Replace this with an interface
 from core.core import ProjectStatus, id_project_files_in
-from core.project import ProjectBuilder, Project
+from core.project import ProjectBuilder, ProjectDescriptor
 from configuration.settings import Settings
 from ui.interfaces import EtymWindow
 
@@ -38,7 +38,7 @@ class SplashWindow(QWidget):
         past_projects_model.appendRow(QStandardItem("No Projects Available"))
         self._past_projects = past_projects
         layout.addWidget(past_projects)
-        self._selected_project: Project = None
+        self._selected_project: ProjectDescriptor = None
         past_projects.clicked.connect(self._click_on_project_in_list)
 
         options_buttons = QVBoxLayout()
@@ -74,10 +74,8 @@ class SplashWindow(QWidget):
         if self._selected_project:
             project_overview_window: EtymWindow = self._configuration.find_by_id("MainWindow")
             project_overview_window.options.set_option_to("ProjectStatus", ProjectStatus.LOADING)
-            this_project = self._selected_project
             project_overview_window.options.set_option_to(
-                "CurrentProjectFile",
-                f"./data/PROJ-{this_project.filename}.data")
+                "CurrentProjectDescriptor", self._selected_project)
             project_overview_window.options.set_option_to("IsLaunching", True)
             project_overview_window.showMaximized()
             self.close()
@@ -85,19 +83,23 @@ class SplashWindow(QWidget):
             print("ERROR: No Project File Is Selected")
 
     def _populate_past_projects(self):
+        project_file_prefix: str = self._configuration.find_by_id("ProjectFilePrefix")
+        self._logger.debug("Project File Prefix in Use: %s", project_file_prefix)
+
         def _temp_validator(filename: str):
-            project_file_prefix: str = self._configuration.find_by_id("ProjectFilePrefix")
-            self._logger.debug("Project File Prefix in Use: %s", project_file_prefix)
-            self._logger.debug("Possible Project File     : %s", filename)
             return filename.startswith(project_file_prefix)
-        all_files = id_project_files_in("./data/", _temp_validator)
-        self._logger.info("All Files: %s", all_files)
-        projects = ProjectBuilder.projects_from_files(all_files)
-        self._logger.info("Projects Reconstructed: %s", projects)
+        all_files = id_project_files_in(
+            "./data/",
+            _temp_validator,
+            self._configuration.find_by_id("ProjectIndexFile"))
+        self._logger.debug("All Files: %s", all_files)
+        projects = ProjectBuilder.descriptors_from_files(all_files)
+        self._logger.debug("Projects Described: %s", projects)
         if projects:
             pp_model: QStandardItemModel = self._past_projects.model()
             pp_model.clear()
             for (project_name, project) in projects.items():
                 new_item = QStandardItem(project_name)
+                new_item.setToolTip(f"{len(project.lexicon_ids)} Lexicon(s)")
                 new_item.setData(project)
                 pp_model.appendRow(new_item)
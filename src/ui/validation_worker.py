@@ -0,0 +1,106 @@
+"""Validates Words on a background thread so the tree is shown before validation finishes"""
+import copy
+from typing import Sequence
+from PyQt5.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+from core.core import WordField
+from core.word import Word
+from core.wordflow import summarise_word_data
+from ui.pool_task import PoolTask, PoolTaskSignals
+
+
+class _ValidationSignals(PoolTaskSignals):
+    """Signals raised by a _ValidationTask, including one for each Word validated"""
+    validated = pyqtSignal(str, int, object)
+
+
+class _ValidationTask(PoolTask):
+    """Validates a batch of copied Word data on a pool thread, reporting each Word as it is done"""
+    signals_type = _ValidationSignals
+
+    def __init__(self, batch: Sequence[tuple[str, int, dict]]) -> None:
+        super().__init__()
+        self.batch = batch
+
+    def work(self) -> None:
+        """Validates each Word in the batch, reporting a Word that raises as failing validation"""
+        for (uid, generation, word_data) in self.batch:
+            try:
+                summary = summarise_word_data(word_data)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                summary = {"Checks": 1, "Failed": 1, "FailedStages": [f"Validation error: {error}"]}
+            self.signals.validated.emit(uid, generation, summary)
+
+
+class ValidationWorker(QObject):
+    """Validates requested Words off the GUI thread and caches each summary by Word uid
+
+    Requests made in the same pass of the event loop are gathered into batches. A summary
+    that arrives after its Word was invalidated again is discarded."""
+    validated = pyqtSignal(str)
+    batch_size = 64
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._summaries: dict[str, dict] = {}
+        self._generations: dict[str, int] = {}
+        self._requested: dict[str, Word] = {}
+        self._in_progress: set[str] = set()
+        self._task_signals: list[_ValidationSignals] = []
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.setInterval(0)
+        self._dispatch_timer.timeout.connect(self._dispatch)
+
+    def summary_for(self, word: Word) -> dict:
+        """The cached validation summary of word, or None after requesting one"""
+        uid = word.find_data_on(WordField.UID)
+        summary = self._summaries.get(uid)
+        if summary is None and uid not in self._in_progress:
+            self._requested[uid] = word
+            self._dispatch_timer.start()
+        return summary
+
+    def invalidate(self, words: Sequence[Word]) -> None:
+        """Discards cached summaries of words, including any still being calculated"""
+        for word in words:
+            uid = word.find_data_on(WordField.UID)
+            self._summaries.pop(uid, None)
+            self._in_progress.discard(uid)
+            self._generations[uid] = self._generations.get(uid, 0) + 1
+
+    def _dispatch(self) -> None:
+        # Word data is copied here, on the GUI thread, so edits cannot race the validation
+        requested = [
+            (uid, self._generations.get(uid, 0), copy.deepcopy(word.data_for_export()))
+            for (uid, word) in self._requested.items()]
+        self._in_progress.update(self._requested)
+        self._requested = {}
+        for start in range(0, len(requested), self.batch_size):
+            task = _ValidationTask(requested[start:start + self.batch_size])
+            task.signals.validated.connect(self._task_validated)
+            task.signals.finished.connect(self._task_finished)
+            task.signals.failed.connect(self._task_finished)
+            self._task_signals.append(task.signals)
+            self._pool.start(task)
+
+    def _task_validated(self, uid: str, generation: int, summary: dict) -> None:
+        if generation != self._generations.get(uid, 0):
+            return
+        self._in_progress.discard(uid)
+        self._summaries[uid] = summary
+        self.validated.emit(uid)
+
+    def _task_finished(self) -> None:
+        self._task_signals = [x for x in self._task_signals if x is not self.sender()]
+
+    @property
+    def is_validating(self) -> bool:
+        """True while requested Words are waiting for or undergoing validation"""
+        return bool(self._requested or self._in_progress)
+
+    def wait_for_done(self) -> None:
+        """Blocks until all validation in progress has ended; call before the worker is destroyed"""
+        self._dispatch_timer.stop()
+        self._pool.waitForDone()